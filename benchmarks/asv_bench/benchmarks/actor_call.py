@@ -0,0 +1,81 @@
+# Copyright 1999-2022 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+from mars import oscar as mo
+
+
+class EchoActor(mo.Actor):
+    def echo(self, value):
+        return value
+
+
+class ActorCallSuite:
+    """
+    Benchmark that tracks rate of small actor calls between processes
+    """
+
+    params = [(0, 1), (16 * 1024, 1), (16 * 1024, 2)]
+    param_names = ["coalesce_size_and_channels"]
+    timeout = 600
+
+    num_calls = 20000
+    concurrency = 100
+
+    def _track_calls_per_second(self, coalesce_size, channels_per_address):
+        async def _call():
+            pool = await mo.create_actor_pool(
+                "127.0.0.1",
+                n_process=1,
+                extra_conf={
+                    "channels_per_address": channels_per_address,
+                    "socket": {"coalesce_size": coalesce_size},
+                },
+            )
+            await pool.start()
+            async with pool:
+                ref = await mo.create_actor(
+                    EchoActor,
+                    address=pool.external_address,
+                    allocate_strategy=mo.allocate_strategy.RandomSubPool(),
+                )
+
+                async def call_batch(n_calls):
+                    for i in range(n_calls):
+                        await ref.echo(i)
+
+                start_time = time.time()
+                await asyncio.gather(
+                    *[
+                        call_batch(self.num_calls // self.concurrency)
+                        for _ in range(self.concurrency)
+                    ]
+                )
+                duration = time.time() - start_time
+            return self.num_calls / duration
+
+        return asyncio.run(_call())
+
+    def track_calls_per_second(self, coalesce_size_and_channels):
+        return self._track_calls_per_second(*coalesce_size_and_channels)
+
+    track_calls_per_second.unit = "calls/s"
+
+
+if __name__ == "__main__":
+    suite = ActorCallSuite()
+    for param in suite.params:
+        print(param, suite.track_calls_per_second(param))
@@ -0,0 +1,89 @@
+# Copyright 1999-2022 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import tempfile
+
+import numpy as np
+
+from mars.lib.filesystem import LocalFileSystem
+from mars.storage import get_storage_backend
+from mars.storage.filesystem import DiskStorage
+
+
+class SmallObjectsDiskStorageSuite:
+    """
+    Benchmark that times spilling many small objects into disk storages
+    """
+
+    params = ["disk", "segment_disk"]
+    param_names = ["backend"]
+    timeout = 600
+
+    num_objects = 20000
+
+    def setup(self, backend):
+        self.objects = [np.random.rand(64) for _ in range(self.num_objects)]
+
+        async def _setup():
+            backend_cls = get_storage_backend(backend)
+            params, self.teardown_params = await backend_cls.setup(
+                fs=LocalFileSystem(), root_dirs=[tempfile.mkdtemp()]
+            )
+            return backend_cls(**params)
+
+        self.storage = asyncio.run(_setup())
+
+    def teardown(self, backend):
+        asyncio.run(self.storage.teardown(**self.teardown_params))
+
+    def time_put_get_delete(self, backend):
+        async def _run():
+            infos = [await self.storage.put(obj) for obj in self.objects]
+            for info in infos:
+                await self.storage.get(info.object_id)
+            for info in infos:
+                await self.storage.delete(info.object_id)
+
+        asyncio.run(_run())
+
+
+class LargeObjectDiskStorageSuite:
+    """
+    Benchmark that times reloading large spilled objects from disk storages
+    """
+
+    params = [False, True]
+    param_names = ["mmap_read"]
+    timeout = 600
+
+    def setup(self, mmap_read):
+        data = np.random.rand(64 * 1024**2 // 8)
+
+        async def _setup():
+            params, self.teardown_params = await DiskStorage.setup(
+                fs=LocalFileSystem(),
+                root_dirs=[tempfile.mkdtemp()],
+                mmap_read=mmap_read,
+            )
+            storage = DiskStorage(**params)
+            return storage, await storage.put(data)
+
+        self.storage, self.info = asyncio.run(_setup())
+
+    def teardown(self, mmap_read):
+        asyncio.run(self.storage.teardown(**self.teardown_params))
+
+    def time_get(self, mmap_read):
+        asyncio.run(self.storage.get(self.info.object_id))
@@ -17,10 +17,13 @@ import tracemalloc
 
 import mars.tensor as mt
 import mars.dataframe as md
+from mars.core import ChunkGraph
 from mars.core.graph import TileableGraph, TileableGraphBuilder, ChunkGraphBuilder
 from mars.resource import Resource
 from mars.services.task.analyzer import GraphAnalyzer
 from mars.services.task.analyzer.assigner import GraphAssigner
+from mars.tensor.arithmetic import TensorAdd
+from mars.tensor.random import TensorRand
 
 
 class ChunkGraphAssignerSuite:
@@ -82,3 +85,36 @@ class ChunkGraphAssignerSuite:
 
     def track_traced_mem_peak(self):
         return self.mem_peak
+
+
+class WideChunkGraphAssignerSuite:
+    """
+    Benchmark that times performance of chunk graph assigner
+    on graphs with a huge number of initial chunks
+    """
+
+    params = [100_000, 1_000_000]
+    param_names = ["num_chunks"]
+    timeout = 600
+
+    def setup(self, num_chunks):
+        # mimic graphs like `read_parquet` followed by chunk-wise operands
+        self.chunk_graph = chunk_graph = ChunkGraph()
+        results = []
+        for i in range(num_chunks):
+            inp = TensorRand(i).new_chunk([])
+            out = TensorAdd(lhs=inp, rhs=1).new_chunk([inp])
+            chunk_graph.add_node(inp)
+            chunk_graph.add_node(out)
+            chunk_graph.add_edge(inp, out)
+            results.append(out)
+        chunk_graph.results = results
+        self.start_ops = list(GraphAnalyzer._iter_start_ops(chunk_graph))
+        self.band_resource = {
+            (f"worker-{i}", "numa-0"): Resource(num_cpus=16) for i in range(50)
+        }
+
+    def time_assigner(self, num_chunks):
+        assigner = GraphAssigner(self.chunk_graph, self.start_ops, self.band_resource)
+        assigned_result = assigner.assign({})
+        assert len(assigned_result) == num_chunks
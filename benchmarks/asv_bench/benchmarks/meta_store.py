@@ -0,0 +1,135 @@
+# Copyright 1999-2021 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import gc
+import pickle
+import tracemalloc
+
+import numpy as np
+
+import mars.dataframe as md
+import mars.tensor as mt
+from mars.core import tile
+from mars.services.meta.metas import DataFrameChunkMeta, TensorChunkMeta
+from mars.services.meta.store import get_meta_store
+
+
+class MetaStoreMemorySuite:
+    """
+    Benchmark that tracks memory consumed by supervisor meta store per chunk
+    """
+
+    def setup(self):
+        self.serialized_metas = self._gen_serialized_metas()
+        # shapes of chunks are unknown before execution, e.g., after filtering
+        self.unknown_shape_serialized_metas = self._gen_serialized_metas(
+            unknown_shape=True
+        )
+
+    @staticmethod
+    def _gen_serialized_metas(unknown_shape: bool = False):
+        t = tile(mt.random.rand(4000, 100, chunk_size=(10, 50)))
+        df = tile(
+            md.DataFrame(mt.random.rand(4000, 4, chunk_size=10), columns=list("abcd"))
+        )
+        metas = []
+        for i, c in enumerate(t.chunks):
+            metas.append(
+                TensorChunkMeta(
+                    object_id=c.key,
+                    memory_size=4000,
+                    store_size=4000,
+                    index=c.index,
+                    bands=[(f"worker-{i % 50}", "numa-0")],
+                    shape=(np.nan, c.shape[1]) if unknown_shape else c.shape,
+                    dtype=c.dtype,
+                    order=c.order,
+                )
+            )
+        for i, c in enumerate(df.chunks):
+            metas.append(
+                DataFrameChunkMeta(
+                    object_id=c.key,
+                    memory_size=320,
+                    store_size=320,
+                    index=c.index,
+                    bands=[(f"worker-{i % 50}", "numa-0")],
+                    shape=(np.nan, c.shape[1]) if unknown_shape else c.shape,
+                    dtypes_value=c.dtypes_value,
+                    index_value=c.index_value,
+                )
+            )
+        # metas are deserialized from messages sent by workers
+        return [pickle.dumps(meta) for meta in metas]
+
+    def _track_bytes_per_chunk(
+        self, store_name: str, serialized_metas=None, delete: bool = False
+    ):
+        serialized_metas = serialized_metas or self.serialized_metas
+        gc.collect()
+        tracemalloc.start()
+        metas = [pickle.loads(meta) for meta in serialized_metas]
+        meta_store = get_meta_store(store_name)("bench_session")
+
+        async def _set_metas(metas):
+            await meta_store.set_meta.batch(
+                *(meta_store.set_meta.delay(meta.object_id, meta) for meta in metas)
+            )
+            await meta_store.add_chunk_bands.batch(
+                *(
+                    meta_store.add_chunk_bands.delay(
+                        meta.object_id, [("worker-0", "numa-0")]
+                    )
+                    for meta in metas
+                )
+            )
+            if delete:
+                await meta_store.del_meta.batch(
+                    *(meta_store.del_meta.delay(meta.object_id) for meta in metas)
+                )
+
+        asyncio.run(_set_metas(metas))
+        # release references held outside the store
+        del metas
+        gc.collect()
+        mem_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return mem_size / len(serialized_metas)
+
+    def track_dict_store_bytes_per_chunk(self):
+        return self._track_bytes_per_chunk("dict")
+
+    track_dict_store_bytes_per_chunk.unit = "bytes"
+
+    def track_dict_store_bytes_per_chunk_unknown_shape(self):
+        return self._track_bytes_per_chunk("dict", self.unknown_shape_serialized_metas)
+
+    track_dict_store_bytes_per_chunk_unknown_shape.unit = "bytes"
+
+    def track_dict_store_bytes_per_chunk_after_delete(self):
+        # bytes left by the store after all metas are deleted
+        return self._track_bytes_per_chunk(
+            "dict", self.unknown_shape_serialized_metas, delete=True
+        )
+
+    track_dict_store_bytes_per_chunk_after_delete.unit = "bytes"
+
+
+if __name__ == "__main__":
+    suite = MetaStoreMemorySuite()
+    suite.setup()
+    print(suite.track_dict_store_bytes_per_chunk())
+    print(suite.track_dict_store_bytes_per_chunk_unknown_shape())
+    print(suite.track_dict_store_bytes_per_chunk_after_delete())
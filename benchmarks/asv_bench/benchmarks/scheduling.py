@@ -0,0 +1,151 @@
+# Copyright 1999-2022 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from typing import List
+
+from mars import oscar as mo
+from mars.services.cluster import MockClusterAPI
+from mars.services.scheduling.supervisor import (
+    GlobalResourceManagerActor,
+    SubtaskManagerActor,
+    SubtaskQueueingActor,
+)
+from mars.services.scheduling.worker import SubtaskExecutionActor
+from mars.services.subtask import Subtask, SubtaskResult, SubtaskStatus
+from mars.services.task.supervisor.manager import TaskManagerActor
+
+
+class _MockTaskManagerActor(mo.Actor):
+    def set_subtask_result(self, result: SubtaskResult):
+        pass
+
+
+class _MockQueueingActor(mo.Actor):
+    def add_subtasks(self, subtasks, priorities, **kwargs):
+        pass
+
+    def submit_subtasks(self, band=None, limit=None):
+        pass
+
+    def remove_queued_subtasks(self, subtask_ids: List[str]):
+        pass
+
+
+class _MockExecutionActor(mo.StatelessActor):
+    @staticmethod
+    def _gen_result(subtask: Subtask) -> SubtaskResult:
+        return SubtaskResult(
+            subtask_id=subtask.subtask_id,
+            session_id=subtask.session_id,
+            status=SubtaskStatus.succeeded,
+        )
+
+    async def run_subtask(
+        self, subtask: Subtask, band_name: str, supervisor_address: str
+    ):
+        return self._gen_result(subtask)
+
+    async def run_subtasks(
+        self, subtasks: List[Subtask], band_name: str, supervisor_address: str
+    ):
+        return [(st.subtask_id, self._gen_result(st), None) for st in subtasks]
+
+
+class SubtaskDispatchSuite:
+    """
+    Benchmark that tracks number of subtasks dispatched per second
+    from one supervisor to a worker
+    """
+
+    params = [1, 100]
+    param_names = ["submit_batch_size"]
+    num_subtasks = 10000
+
+    def _track_subtasks_per_second(self, submit_batch_size: int) -> float:
+        async def _dispatch():
+            session_id = "bench_session"
+            supervisor_pool = await mo.create_actor_pool("127.0.0.1", n_process=0)
+            worker_pool = await mo.create_actor_pool("127.0.0.1", n_process=0)
+            async with supervisor_pool, worker_pool:
+                address = supervisor_pool.external_address
+                band = (worker_pool.external_address, "numa-0")
+                await MockClusterAPI.create(address)
+                await mo.create_actor(
+                    _MockQueueingActor,
+                    uid=SubtaskQueueingActor.gen_uid(session_id),
+                    address=address,
+                )
+                await mo.create_actor(
+                    GlobalResourceManagerActor,
+                    uid=GlobalResourceManagerActor.default_uid(),
+                    address=address,
+                )
+                await mo.create_actor(
+                    _MockTaskManagerActor,
+                    uid=TaskManagerActor.gen_uid(session_id),
+                    address=address,
+                )
+                await mo.create_actor(
+                    _MockExecutionActor,
+                    uid=SubtaskExecutionActor.default_uid(),
+                    address=band[0],
+                )
+                manager_ref = await mo.create_actor(
+                    SubtaskManagerActor,
+                    session_id,
+                    uid=SubtaskManagerActor.gen_uid(session_id),
+                    address=address,
+                )
+
+                subtasks = [
+                    Subtask(f"subtask{i}", session_id) for i in range(self.num_subtasks)
+                ]
+                await manager_ref.add_subtasks(subtasks, [(0,)] * len(subtasks))
+                subtask_ids = [st.subtask_id for st in subtasks]
+
+                start_time = time.time()
+                if submit_batch_size > 1:
+                    await asyncio.gather(
+                        *(
+                            manager_ref.submit_subtasks_to_band(
+                                band, subtask_ids[i : i + submit_batch_size]
+                            )
+                            for i in range(0, len(subtask_ids), submit_batch_size)
+                        )
+                    )
+                else:
+                    await asyncio.gather(
+                        *(
+                            manager_ref.submit_subtask_to_band(stid, band)
+                            for stid in subtask_ids
+                        )
+                    )
+                duration = time.time() - start_time
+                await MockClusterAPI.cleanup(address)
+            return self.num_subtasks / duration
+
+        return asyncio.run(_dispatch())
+
+    def track_subtasks_per_second(self, submit_batch_size: int):
+        return self._track_subtasks_per_second(submit_batch_size)
+
+    track_subtasks_per_second.unit = "subtasks/s"
+
+
+if __name__ == "__main__":
+    suite = SubtaskDispatchSuite()
+    for batch_size in suite.params:
+        print(batch_size, suite.track_subtasks_per_second(batch_size))
@@ -0,0 +1,98 @@
+# Copyright 1999-2022 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+import numpy as np
+
+from mars import oscar as mo
+from mars.services.storage.core import StorageManagerActor
+from mars.services.storage.handler import StorageHandlerActor
+from mars.services.storage.transfer import SenderManagerActor
+from mars.storage import StorageLevel
+
+
+class ShuffleTransferSuite:
+    """
+    Benchmark that tracks throughput of transferring shuffle data
+    from one worker to another
+    """
+
+    params = [(1, 0), (1, 4), (4, 4)]
+    param_names = ["channels_and_pipeline_depth"]
+    timeout = 600
+
+    num_chunks = 64
+    chunk_size = 4 * 1024**2
+
+    def _track_bytes_per_second(self, transfer_channels, transfer_pipeline_depth):
+        async def _transfer():
+            async def start_pool():
+                pool = await mo.create_actor_pool(
+                    "127.0.0.1", n_process=2, labels=["main", "numa-0", "io"]
+                )
+                await pool.start()
+                return pool
+
+            session_id = "bench_session"
+            storage_configs = {"shared_memory": {}}
+            pool1, pool2 = await start_pool(), await start_pool()
+            async with pool1, pool2:
+                addresses = [pool1.external_address, pool2.external_address]
+                for address in addresses:
+                    await mo.create_actor(
+                        StorageManagerActor,
+                        storage_configs,
+                        transfer_channels=transfer_channels,
+                        transfer_pipeline_depth=transfer_pipeline_depth,
+                        uid=StorageManagerActor.default_uid(),
+                        address=address,
+                    )
+
+                handler_ref = await mo.actor_ref(
+                    uid=StorageHandlerActor.gen_uid("numa-0"), address=addresses[0]
+                )
+                data_keys = [f"shuffle_data_{i}" for i in range(self.num_chunks)]
+                n_elements = self.chunk_size // np.dtype(np.float64).itemsize
+                for data_key in data_keys:
+                    await handler_ref.put(
+                        session_id,
+                        data_key,
+                        np.random.rand(n_elements),
+                        StorageLevel.MEMORY,
+                    )
+
+                sender_ref = await mo.actor_ref(
+                    uid=SenderManagerActor.gen_uid("numa-0"), address=addresses[0]
+                )
+                start_time = time.time()
+                await sender_ref.send_batch_data(
+                    session_id, data_keys, addresses[1], StorageLevel.MEMORY
+                )
+                duration = time.time() - start_time
+            return self.num_chunks * self.chunk_size / duration
+
+        return asyncio.run(_transfer())
+
+    def track_bytes_per_second(self, channels_and_pipeline_depth):
+        return self._track_bytes_per_second(*channels_and_pipeline_depth)
+
+    track_bytes_per_second.unit = "bytes/s"
+
+
+if __name__ == "__main__":
+    suite = ShuffleTransferSuite()
+    for param in suite.params:
+        print(param, suite.track_bytes_per_second(param))
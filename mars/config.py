@@ -344,6 +344,13 @@ default_options.register_option(
 default_options.register_option(
     "dataframe.arrow_array.pandas_only", None, validator=any_validator(is_null, is_bool)
 )
+# coalesce adjacent small partitions generated by shuffle into chunks
+# no larger than the size, None means no coalescing
+default_options.register_option(
+    "dataframe.shuffle.coalesce_size",
+    None,
+    validator=any_validator(is_null, is_numeric, is_string),
+)
 
 # learn options
 assume_finite = os.environ.get("SKLEARN_ASSUME_FINITE")
@@ -63,5 +63,6 @@ from .graph import (
     ChunkGraphBuilder,
     TileContext,
     TileStatus,
+    observe_memory_sizes,
 )
 from .mode import enter_mode, is_build_mode, is_eager_mode, is_kernel_mode
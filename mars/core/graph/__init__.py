@@ -12,6 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .builder import TileableGraphBuilder, ChunkGraphBuilder, TileContext, TileStatus
+from .builder import (
+    TileableGraphBuilder,
+    ChunkGraphBuilder,
+    TileContext,
+    TileStatus,
+    observe_memory_sizes,
+)
 from .core import DirectedGraph, DAG, GraphContainsCycleError
 from .entity import TileableGraph, ChunkGraph, EntityGraph
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextvars
 import dataclasses
 import functools
 from typing import (
@@ -38,6 +39,8 @@ from .base import AbstractGraphBuilder
 tile_gen_type = Generator[List[ChunkType], List[ChunkType], List[TileableType]]
 DEFAULT_UPDATED_PROGRESS = 0.4
 
+_current_tile_context = contextvars.ContextVar("current_tile_context", default=None)
+
 
 @dataclasses.dataclass
 class _TileableHandler:
@@ -59,12 +62,14 @@ class TileContext(Dict[TileableType, TileableType]):
     _tileables = Set[TileableType]
     _tileable_to_progress: Dict[TileableType, float]
     _tileable_to_tile_infos: Dict[TileableType, List[_TileableTileInfo]]
+    _chunk_key_to_memory_size: Dict[str, int]
 
     def __init__(self, *args, **kw):
         super().__init__(*args, **kw)
         self._tileables = None
         self._tileable_to_progress = dict()
         self._tileable_to_tile_infos = dict()
+        self._chunk_key_to_memory_size = dict()
 
     def set_tileables(self, tileables: Set[TileableType]):
         self._tileables = tileables
@@ -108,6 +113,12 @@ class TileContext(Dict[TileableType, TileableType]):
     def get_tileable_tile_infos(self) -> Dict[TileableType, List[_TileableTileInfo]]:
         return {t: self._tileable_to_tile_infos.get(t, list()) for t in self._tileables}
 
+    def record_memory_sizes(self, chunk_key_to_memory_size: Dict[str, int]):
+        self._chunk_key_to_memory_size.update(chunk_key_to_memory_size)
+
+    def get_memory_sizes(self, chunk_keys: List[str]) -> List[Optional[int]]:
+        return [self._chunk_key_to_memory_size.get(key) for key in chunk_keys]
+
 
 @dataclasses.dataclass
 class TileStatus:
@@ -294,6 +305,13 @@ class Tiler:
                         _add_result_chunk(self._chunk_to_fetch[chunk])
 
     def _iter(self):
+        token = _current_tile_context.set(self._tile_context)
+        try:
+            return self._iter_tile()
+        finally:
+            _current_tile_context.reset(token)
+
+    def _iter_tile(self):
         chunk_graph = self._cur_chunk_graph
 
         to_update_tileables = []
@@ -341,6 +359,78 @@ class Tiler:
                 t.refresh_params()
 
 
+def _get_memory_sizes(chunks: List[ChunkType]) -> List[Optional[int]]:
+    from ....core.context import get_context
+    from ....core.operand import Fetch
+
+    tile_context = _current_tile_context.get()
+    if tile_context is not None:
+        memory_sizes = tile_context.get_memory_sizes([c.key for c in chunks])
+    else:
+        memory_sizes = [None] * len(chunks)
+    # chunks executed by previous tasks are not recorded in tile context
+    fetch_indices = [
+        i
+        for i, (c, size) in enumerate(zip(chunks, memory_sizes))
+        if size is None and isinstance(c.op, Fetch)
+    ]
+    ctx = get_context()
+    if fetch_indices and ctx is not None:
+        metas = ctx.get_chunks_meta(
+            [chunks[i].key for i in fetch_indices],
+            fields=["memory_size"],
+            error="ignore",
+        )
+        for i, meta in zip(fetch_indices, metas):
+            if meta is not None:
+                memory_sizes[i] = meta.get("memory_size")
+    return memory_sizes
+
+
+def observe_memory_sizes(
+    chunks: List[ChunkType],
+    tileables: List[TileableType] = None,
+    progress: float = None,
+) -> Generator[
+    Union[List[EntityType], TileStatus], List[ChunkType], List[Optional[int]]
+]:
+    """
+    Get actual memory sizes of chunks for adaptive tiling. Chunks not
+    executed yet are yielded to execute first, after that, their sizes
+    are recorded by the task processor. Operands opt in by calling it via
+    `yield from` inside `tile`, sizes unknown to the execution backend
+    are returned as None.
+
+    Parameters
+    ----------
+    chunks : list
+        Chunks whose memory sizes are needed.
+    tileables : list, optional
+        Tiled tileables whose params are refreshed after execution.
+    progress : float, optional
+        Tile progress of the operand when yielding.
+
+    Returns
+    -------
+    memory_sizes : list
+        Memory sizes of chunks.
+    """
+    chunks = [c.data if hasattr(c, "data") else c for c in chunks]
+    memory_sizes = _get_memory_sizes(chunks)
+    if all(size is not None for size in memory_sizes):
+        # all executed before, no need to yield
+        for t in tileables or []:
+            (t.data if hasattr(t, "data") else t).refresh_params()
+        return memory_sizes
+
+    need_process = list(tileables or []) + chunks
+    if progress is not None:
+        yield TileStatus(need_process, progress=progress)
+    else:
+        yield need_process
+    return _get_memory_sizes(chunks)
+
+
 def prune_chunk_graph(chunk_graph: ChunkGraph):
     from ....core.operand import Fetch, VirtualOperand, ShuffleProxy
 
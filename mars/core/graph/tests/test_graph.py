@@ -18,9 +18,17 @@ import numpy as np
 
 from .... import dataframe as md
 from .... import tensor as mt
+from ....tensor.arithmetic import TensorAdd
 from ....tests.core import flaky
 from ....utils import to_str
-from .. import DAG, GraphContainsCycleError
+from ...entity.tileables import handler
+from .. import (
+    DAG,
+    GraphContainsCycleError,
+    ChunkGraphBuilder,
+    TileContext,
+    observe_memory_sizes,
+)
 
 
 def test_dag():
@@ -110,6 +118,54 @@ def test_to_dot():
     assert all(to_str(n.key)[:5] in dot for n in graph) is True
 
 
+def test_observe_memory_sizes():
+    observed = []
+
+    def tile_with_observed_sizes(op):
+        inp = op.inputs[0]
+        sizes = yield from observe_memory_sizes(
+            inp.chunks, tileables=[inp], progress=0.5
+        )
+        observed.append(sizes)
+        return (yield from TensorAdd.tile(op))
+
+    a = mt.ones((10,), chunk_size=5)
+    b = a + 1
+    graph = b.build_graph(tile=False)
+    tile_context = TileContext()
+
+    handler.register(TensorAdd, tile_with_observed_sizes)
+    try:
+        builder = ChunkGraphBuilder(
+            graph, fuse_enabled=False, tile_context=tile_context
+        )
+        chunk_graphs = builder.build()
+
+        # chunks not executed are yielded first
+        chunk_graph = next(chunk_graphs)
+        input_keys = [c.key for c in tile_context[a.data].chunks]
+        assert {c.key for c in chunk_graph.result_chunks} == set(input_keys)
+        assert observed == []
+
+        # record sizes like what the task processor does after each stage
+        tile_context.record_memory_sizes({key: 40 for key in input_keys})
+        chunk_graph = next(chunk_graphs)
+        assert observed == [[40, 40]]
+        assert len(tile_context[b.data].chunks) == 2
+        with pytest.raises(StopIteration):
+            next(chunk_graphs)
+    finally:
+        handler.unregister(TensorAdd)
+
+    # sizes are unknown outside tiling
+    tiled = tile_context[a.data]
+    gen = observe_memory_sizes(tiled.chunks)
+    assert [c.key for c in next(gen)] == [c.key for c in tiled.chunks]
+    with pytest.raises(StopIteration) as e:
+        next(gen)
+    assert e.value.value == [None, None]
+
+
 def test_tileable_graph_logic_key():
     # Tensor
     t1 = mt.random.randint(10, size=(10, 8), chunk_size=4)
@@ -15,7 +15,6 @@
 import functools
 import itertools
 import logging
-import uuid
 from typing import Callable, Dict, List, Union
 
 import numpy as np
@@ -23,9 +22,9 @@ import pandas as pd
 
 from ... import opcodes as OperandDef
 from ...config import options
-from ...core import ENTITY_TYPE, OutputType
-from ...core.custom_log import redirect_custom_log
 from ...core.context import get_context
+from ...core import ENTITY_TYPE, OutputType, observe_memory_sizes
+from ...core.custom_log import redirect_custom_log
 from ...core.operand import OperandStage
 from ...serialization.serializables import (
     Int32Field,
@@ -41,7 +40,6 @@ from ...utils import (
     enter_current_session,
     lazy_import,
     pd_release_version,
-    estimate_pandas_size,
 )
 from ..arrays import ArrowArray
 from ..core import GROUPBY_TYPE
@@ -55,6 +53,7 @@ from ..reduction.core import (
 from ..reduction.aggregation import is_funcs_aggregate, normalize_reduction_funcs
 from ..utils import (
     parse_index,
+    auto_merge_chunks,
     build_concatenated_rows_frame,
     is_cudf,
     concat_on_columns,
@@ -76,19 +75,6 @@ MEAN_RATIO_THRESHOLD = 2 / 3
 _support_get_group_without_as_index = pd_release_version[:2] > (1, 0)
 
 
-class SizeRecorder:
-    def __init__(self):
-        self._raw_records = []
-        self._agg_records = []
-
-    def record(self, raw_record: int, agg_record: int):
-        self._raw_records.append(raw_record)
-        self._agg_records.append(agg_record)
-
-    def get(self):
-        return self._raw_records, self._agg_records
-
-
 _agg_functions = {
     "sum": lambda x: x.sum(),
     "prod": lambda x: x.prod(),
@@ -178,11 +164,11 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
     # for chunk
     combine_size = Int32Field("combine_size")
     chunk_store_limit = Int64Field("chunk_store_limit")
+    shuffle_coalesce_size = AnyField("shuffle_coalesce_size")
     pre_funcs = ListField("pre_funcs")
     agg_funcs = ListField("agg_funcs")
     post_funcs = ListField("post_funcs")
     index_levels = Int32Field("index_levels")
-    size_recorder_name = StringField("size_recorder_name")
 
     def _set_inputs(self, inputs):
         super()._set_inputs(inputs)
@@ -891,30 +877,25 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
         out_df: TileableType,
         func_infos: ReductionSteps,
     ):
-        ctx = get_context()
         combine_size = op.combine_size
-        size_recorder_name = str(uuid.uuid4())
-        size_recorder = ctx.create_remote_object(size_recorder_name, SizeRecorder)
 
         # collect the first combine_size chunks, run it
-        # to get the size before and after agg
+        # to get the size after agg
         chunks = cls._gen_map_chunks(
             op, in_df.chunks[:combine_size], out_df, func_infos
         )
-        for chunk in chunks:
-            chunk.op.size_recorder_name = size_recorder_name
         # yield to trigger execution
-        yield chunks
-
-        raw_sizes, agg_sizes = size_recorder.get()
-        # destroy size recorder
-        ctx.destroy_remote_object(size_recorder_name)
+        memory_sizes = yield from observe_memory_sizes(chunks)
+        # sizes may be unknown to execution backends, take them as large
+        # as chunk store limit which prefers shuffle
+        agg_sizes = [
+            size if size is not None else op.chunk_store_limit for size in memory_sizes
+        ]
 
         logger.debug(
-            "Start to choose method for Groupby, agg_sizes: %s, raw_sizes: %s, "
+            "Start to choose method for Groupby, agg_sizes: %s, "
             "sample_count: %s, total_count: %s, chunk_store_limit: %s",
             agg_sizes,
-            raw_sizes,
             len(agg_sizes),
             len(in_df.chunks),
             op.chunk_store_limit,
@@ -924,6 +905,27 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
             op, in_df, out_df, func_infos, chunks, agg_sizes
         )
 
+    @classmethod
+    def _coalesce_shuffle_chunks(
+        cls, op: "DataFrameGroupByAgg", tileables: List[TileableType]
+    ):
+        out_df = tileables[0]
+        if op.shuffle_coalesce_size is None or len(out_df.chunks) <= 1:
+            return tileables
+
+        # run reducers to get actual sizes of shuffled partitions
+        memory_sizes = yield from observe_memory_sizes(out_df.chunks)
+        coalesced = auto_merge_chunks(
+            get_context(), out_df, op.shuffle_coalesce_size, memory_sizes=memory_sizes
+        )
+        logger.debug(
+            "Coalesce shuffled chunks for groupby operand %s, chunk count: %s -> %s",
+            op,
+            len(out_df.chunks),
+            len(coalesced.chunks),
+        )
+        return [coalesced]
+
     @classmethod
     def tile(cls, op: "DataFrameGroupByAgg"):
         in_df = op.inputs[0]
@@ -938,10 +940,12 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
             if len(in_df.chunks) <= op.combine_size:
                 return cls._tile_with_tree(op, in_df, out_df, func_infos)
             else:
-                return (yield from cls._tile_auto(op, in_df, out_df, func_infos))
+                ret = yield from cls._tile_auto(op, in_df, out_df, func_infos)
+                return (yield from cls._coalesce_shuffle_chunks(op, ret))
         if op.method == "shuffle":
             logger.debug("Choose shuffle method for groupby operand %s", op)
-            return cls._tile_with_shuffle(op, in_df, out_df, func_infos)
+            ret = cls._tile_with_shuffle(op, in_df, out_df, func_infos)
+            return (yield from cls._coalesce_shuffle_chunks(op, ret))
         elif op.method == "tree":
             logger.debug("Choose tree method for groupby operand %s", op)
             return cls._tile_with_tree(op, in_df, out_df, func_infos)
@@ -1117,14 +1121,6 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
                     )
                 )
 
-        if getattr(op, "size_recorder_name", None) is not None:
-            # record_size
-            raw_size = estimate_pandas_size(in_data)
-            # when agg by a list of methods, agg_size should be sum
-            agg_size = sum([estimate_pandas_size(item) for item in agg_dfs])
-            size_recorder = ctx.get_remote_object(op.size_recorder_name)
-            size_recorder.record(raw_size, agg_size)
-
         ctx[op.outputs[0].key] = tuple(agg_dfs)
 
     @classmethod
@@ -1349,6 +1345,7 @@ def agg(groupby, func=None, method="auto", combine_size=None, *args, **kwargs):
         groupby_params=groupby.op.groupby_params,
         combine_size=combine_size or options.combine_size,
         chunk_store_limit=options.chunk_store_limit,
+        shuffle_coalesce_size=options.dataframe.shuffle.coalesce_size,
         use_inf_as_na=use_inf_as_na,
     )
     return agg_op(groupby)
@@ -709,6 +709,30 @@ def test_groupby_agg_auto_method(setup):
     pd.testing.assert_frame_equal(result.sort_index(), raw.groupby("c1").agg("sum"))
 
 
+def test_groupby_agg_shuffle_coalesce(setup):
+    rs = np.random.RandomState(0)
+    raw = pd.DataFrame(
+        {
+            "c1": rs.randint(20, size=100),
+            "c2": rs.choice(["a", "b", "c"], (100,)),
+            "c3": rs.rand(100),
+        }
+    )
+    mdf = md.DataFrame(raw, chunk_size=10)
+
+    with option_context({"dataframe.shuffle.coalesce_size": "1M"}):
+        r = mdf.groupby("c1").agg("sum", method="shuffle")
+        pd.testing.assert_frame_equal(
+            r.execute().fetch().sort_index(), raw.groupby("c1").agg("sum")
+        )
+
+        r = mdf.groupby("c1", sort=False).c3.agg(["sum", "max"], method="shuffle")
+        pd.testing.assert_frame_equal(
+            r.execute().fetch().sort_index(),
+            raw.groupby("c1").c3.agg(["sum", "max"]),
+        )
+
+
 @pytest.mark.skip_ray_dag  # _fetch_infos() is not supported by ray backend.
 def test_distributed_groupby_agg(setup_cluster):
     rs = np.random.RandomState(0)
@@ -21,7 +21,14 @@ import numpy as np
 import pandas as pd
 
 from ... import opcodes as OperandDef
-from ...core import OutputType, recursive_tile, TileStatus
+from ...config import options
+from ...core import (
+    OutputType,
+    recursive_tile,
+    TileStatus,
+    get_output_types,
+    observe_memory_sizes,
+)
 from ...core.context import get_context
 from ...core.operand import OperandStage, MapReduceOperand
 from ...serialization.serializables import (
@@ -32,19 +39,23 @@ from ...serialization.serializables import (
     TupleField,
     KeyField,
     Int32Field,
+    Int64Field,
     NamedTupleField,
 )
 from ...typing import TileableType
 from ...utils import has_unknown_shape, lazy_import
+from ..align import _get_monotonic_chunk_index_min_max
 from ..base.bloom_filter import filter_by_bloom_filter
 from ..core import DataFrame, Series, DataFrameChunk
 from ..operands import DataFrameOperand, DataFrameOperandMixin, DataFrameShuffleProxy
+from .concat import DataFrameConcat
 from ..utils import (
     auto_merge_chunks,
     build_concatenated_rows_frame,
     build_df,
     parse_index,
     hash_dataframe_on,
+    hash_labels_on,
     infer_index_value,
     is_cudf,
 )
@@ -63,6 +74,10 @@ BLOOM_FILTER_OPTIONS = [
 ]
 BLOOM_FILTER_ON_OPTIONS = ["large", "small", "both"]
 DEFAULT_BLOOM_FILTER_ON = "large"
+# split hot keys across reducers for skewed merge
+SKEW_JOIN_OPTIONS = ["sample_size", "hot_key_factor", "max_splits"]
+DEFAULT_SKEW_JOIN_SAMPLE_SIZE = 1000
+DEFAULT_SKEW_JOIN_HOT_KEY_FACTOR = 1.0
 
 cudf = lazy_import("cudf")
 
@@ -76,6 +91,11 @@ class DataFrameMergeAlign(MapReduceOperand, DataFrameOperandMixin):
     input = KeyField("input")
     # for mapper
     mapper_id = Int32Field("mapper_id", default=0)
+    # hashes of hot keys to number of reducers they are spread to,
+    # rows of split keys are distributed among these reducers while
+    # rows of broadcast keys are sent to all of them
+    split_keys = DictField("split_keys", default=None)
+    broadcast_keys = DictField("broadcast_keys", default=None)
 
     def __init__(self, output_types=None, **kw):
         super().__init__(_output_types=output_types, **kw)
@@ -91,11 +111,7 @@ class DataFrameMergeAlign(MapReduceOperand, DataFrameOperandMixin):
         return len(self.output_types)
 
     @classmethod
-    def execute_map(cls, ctx, op):
-        chunk = op.outputs[0]
-        df = ctx[op.inputs[0].key]
-        shuffle_on = op.shuffle_on
-
+    def _reset_shuffle_on_index(cls, df, shuffle_on):
         if shuffle_on is not None:
             # shuffle on field may be resident in index
             to_reset_index_names = []
@@ -108,8 +124,51 @@ class DataFrameMergeAlign(MapReduceOperand, DataFrameOperandMixin):
                         to_reset_index_names.append(shuffle_on)
             if len(to_reset_index_names) > 0:
                 df = df.reset_index(to_reset_index_names)
+        return df
 
-        filters = hash_dataframe_on(df, shuffle_on, op.index_shuffle_size)
+    @classmethod
+    def _hash_with_hot_keys(cls, df, op: "DataFrameMergeAlign"):
+        size = op.index_shuffle_size
+        split_keys = op.split_keys or dict()
+        hot_keys = {**split_keys, **(op.broadcast_keys or dict())}
+        hashed_label = np.asarray(hash_labels_on(df, op.shuffle_on), dtype=np.uint64)
+        # hashes of hot keys are stored as int64
+        signed_label = hashed_label.view(np.int64)
+        is_hot = np.isin(signed_label, np.array(list(hot_keys), dtype=np.int64))
+
+        normal_pos = np.flatnonzero(~is_hot)
+        idx_to_grouped = pd.Index(normal_pos).groupby(hashed_label[normal_pos] % size)
+        filters = [
+            [np.asarray(idx_to_grouped.get(i, []), dtype=np.int64)] for i in range(size)
+        ]
+        # shift reducers of split rows between mappers
+        offset = op.outputs[0].index[0]
+        for key_hash, n_splits in hot_keys.items():
+            pos = np.flatnonzero(signed_label == key_hash)
+            if len(pos) == 0:
+                continue
+            base_idx = int(np.array(key_hash, dtype=np.int64).view(np.uint64)) % size
+            for i in range(n_splits):
+                reducer_idx = (base_idx + i) % size
+                if key_hash in split_keys:
+                    filters[reducer_idx].append(
+                        pos[(i - offset) % n_splits :: n_splits]
+                    )
+                else:
+                    filters[reducer_idx].append(pos)
+        return [np.sort(np.concatenate(f)) for f in filters]
+
+    @classmethod
+    def execute_map(cls, ctx, op):
+        chunk = op.outputs[0]
+        df = ctx[op.inputs[0].key]
+        shuffle_on = op.shuffle_on
+        df = cls._reset_shuffle_on_index(df, shuffle_on)
+
+        if op.split_keys or op.broadcast_keys:
+            filters = cls._hash_with_hot_keys(df, op)
+        else:
+            filters = hash_dataframe_on(df, shuffle_on, op.index_shuffle_size)
 
         # shuffle on index
         for index_idx, index_filter in enumerate(filters):
@@ -154,6 +213,28 @@ class DataFrameMergeAlign(MapReduceOperand, DataFrameOperandMixin):
             cls.execute_reduce(ctx, op)
 
 
+class DataFrameMergeSampleKeys(DataFrameOperand, DataFrameOperandMixin):
+    _op_type_ = OperandDef.DATAFRAME_MERGE_SAMPLE_KEYS
+
+    shuffle_on = AnyField("shuffle_on")
+    sample_size = Int64Field("sample_size")
+
+    def __init__(self, output_types=None, **kw):
+        super().__init__(_output_types=output_types or [OutputType.object], **kw)
+
+    @classmethod
+    def execute(cls, ctx, op: "DataFrameMergeSampleKeys"):
+        df = ctx[op.inputs[0].key]
+        df = DataFrameMergeAlign._reset_shuffle_on_index(df, op.shuffle_on)
+        n_rows = len(df)
+        if n_rows > op.sample_size:
+            rs = np.random.RandomState(op.inputs[0].index[0])
+            df = df.iloc[rs.randint(n_rows, size=op.sample_size)]
+        hashed_label = np.asarray(hash_labels_on(df, op.shuffle_on), dtype=np.uint64)
+        counts = pd.Series(hashed_label.view(np.int64)).value_counts()
+        ctx[op.outputs[0].key] = (n_rows, len(df), counts)
+
+
 MergeSplitInfo = namedtuple("MergeSplitInfo", "split_side, split_index, nsplits")
 
 
@@ -161,6 +242,7 @@ class MergeMethod(Enum):
     one_chunk = 0
     broadcast = 1
     shuffle = 2
+    sort_merge = 3
 
 
 class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
@@ -182,6 +264,9 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
     auto_merge_threshold = Int32Field("auto_merge_threshold")
     bloom_filter = AnyField("bloom_filter")
     bloom_filter_options = DictField("bloom_filter_options")
+    skew_join = BoolField("skew_join")
+    skew_join_options = DictField("skew_join_options")
+    shuffle_coalesce_size = AnyField("shuffle_coalesce_size")
 
     # only for broadcast merge
     split_info = NamedTupleField("split_info")
@@ -242,6 +327,8 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
         shuffle_on: Union[List, str],
         out_size: int,
         mapper_id: int = 0,
+        split_keys: Dict[int, int] = None,
+        broadcast_keys: Dict[int, int] = None,
     ):
         map_op = DataFrameMergeAlign(
             stage=OperandStage.map,
@@ -249,6 +336,8 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
             sparse=chunk.issparse(),
             mapper_id=mapper_id,
             index_shuffle_size=out_size,
+            split_keys=split_keys,
+            broadcast_keys=broadcast_keys,
         )
         return map_op.new_chunk(
             [chunk],
@@ -311,16 +400,32 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
         right_shuffle_on: Union[List, str],
         left: Union[DataFrame, Series],
         right: Union[DataFrame, Series],
+        left_hot_keys: Dict[int, int] = None,
+        right_hot_keys: Dict[int, int] = None,
     ):
         # gen map chunks
         # for left dataframe, use 0 as mapper_id
         left_map_chunks = [
-            cls._gen_map_chunk(chunk, left_shuffle_on, out_shape[0], mapper_id=0)
+            cls._gen_map_chunk(
+                chunk,
+                left_shuffle_on,
+                out_shape[0],
+                mapper_id=0,
+                split_keys=left_hot_keys,
+                broadcast_keys=right_hot_keys,
+            )
             for chunk in left.chunks
         ]
         # for right dataframe, use 1 as mapper_id
         right_map_chunks = [
-            cls._gen_map_chunk(chunk, right_shuffle_on, out_shape[0], mapper_id=1)
+            cls._gen_map_chunk(
+                chunk,
+                right_shuffle_on,
+                out_shape[0],
+                mapper_id=1,
+                split_keys=right_hot_keys,
+                broadcast_keys=left_hot_keys,
+            )
             for chunk in right.chunks
         ]
         map_chunks = left_map_chunks + right_map_chunks
@@ -488,6 +593,8 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
         op: "DataFrameMerge",
         left: Union[DataFrame, Series],
         right: Union[DataFrame, Series],
+        left_hot_keys: Dict[int, int] = None,
+        right_hot_keys: Dict[int, int] = None,
     ):
         df = op.outputs[0]
         left_row_chunk_size = left.chunk_shape[0]
@@ -502,7 +609,13 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
 
         # do shuffle
         left_chunks, right_chunks = cls._gen_both_shuffle_chunks(
-            out_chunk_shape, left_on, right_on, left, right
+            out_chunk_shape,
+            left_on,
+            right_on,
+            left,
+            right,
+            left_hot_keys=left_hot_keys,
+            right_hot_keys=right_hot_keys,
         )
 
         out_chunks = []
@@ -531,6 +644,233 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
             columns_value=df.columns_value,
         )
 
+    @classmethod
+    def _estimate_key_counts(cls, sample_results: List[Tuple]) -> Tuple[pd.Series, int]:
+        n_total = 0
+        counts = []
+        for n_rows, n_sampled, sample_counts in sample_results:
+            n_total += n_rows
+            if n_sampled > 0:
+                counts.append(sample_counts * (n_rows / n_sampled))
+        if not counts:
+            return pd.Series([], dtype=np.float64), n_total
+        return pd.concat(counts).groupby(level=0).sum(), n_total
+
+    @classmethod
+    def _sample_hot_keys(
+        cls,
+        op: "DataFrameMerge",
+        left: Union[DataFrame, Series],
+        right: Union[DataFrame, Series],
+    ):
+        skew_join_options = op.skew_join_options or dict()
+        sample_size = skew_join_options.get(
+            "sample_size", DEFAULT_SKEW_JOIN_SAMPLE_SIZE
+        )
+        hot_key_factor = skew_join_options.get(
+            "hot_key_factor", DEFAULT_SKEW_JOIN_HOT_KEY_FACTOR
+        )
+        n_reducers = max(left.chunk_shape[0], right.chunk_shape[0])
+        max_splits = min(skew_join_options.get("max_splits") or n_reducers, n_reducers)
+
+        left_on = _prepare_shuffle_on(op.left_index, op.left_on, op.on)
+        right_on = _prepare_shuffle_on(op.right_index, op.right_on, op.on)
+        sample_chunks = []
+        for df, shuffle_on in [(left, left_on), (right, right_on)]:
+            side_chunks = []
+            for c in df.chunks:
+                sample_op = DataFrameMergeSampleKeys(
+                    shuffle_on=shuffle_on, sample_size=sample_size
+                )
+                side_chunks.append(sample_op.new_chunk([c], index=c.index))
+            sample_chunks.append(side_chunks)
+
+        # let samples execute first
+        yield TileStatus(
+            sample_chunks[0] + sample_chunks[1] + left.chunks + right.chunks,
+            progress=0.4,
+        )
+        ctx = get_context()
+        side_counts = []
+        for side_chunks in sample_chunks:
+            results = ctx.get_chunks_result([c.key for c in side_chunks])
+            counts, n_total = cls._estimate_key_counts(results)
+            # rows a reducer receives on average
+            avg_size = max(n_total / n_reducers, 1)
+            hot_counts = counts[counts > hot_key_factor * avg_size]
+            side_counts.append((counts, hot_counts, avg_size))
+
+        # a side can be split only when its rows are not duplicated
+        # among reducers, i.e., rows of the other side are broadcast
+        if op.how == "left":
+            split_sides = [0]
+        elif op.how == "right":
+            split_sides = [1]
+        else:
+            assert op.how == "inner"
+            split_sides = [0, 1]
+
+        hot_keys = [dict(), dict()]
+        for key_hash in set(side_counts[0][1].index) | set(side_counts[1][1].index):
+            loads = [
+                counts.get(key_hash, 0) / avg_size
+                for counts, _, avg_size in side_counts
+            ]
+            side = max(split_sides, key=lambda i: loads[i])
+            if key_hash not in side_counts[side][1].index:
+                continue
+            n_splits = min(int(np.ceil(loads[side])), max_splits)
+            if n_splits > 1:
+                hot_keys[side][int(key_hash)] = n_splits
+        if hot_keys[0] or hot_keys[1]:
+            logger.info(
+                "Split %d hot keys of left and %d hot keys of right for merge %s.",
+                len(hot_keys[0]),
+                len(hot_keys[1]),
+                op,
+            )
+        return hot_keys
+
+    @classmethod
+    def _get_sorted_chunk_ranges(
+        cls,
+        op: "DataFrameMerge",
+        left: Union[DataFrame, Series],
+        right: Union[DataFrame, Series],
+    ) -> Optional[List[List[Tuple]]]:
+        """
+        Get index ranges of chunks when both inputs are merged on increasing
+        indexes whose chunks do not overlap, otherwise return None.
+        """
+        if not op.left_index or not op.right_index:
+            return None
+        if op.how not in ["inner", "left", "right"]:
+            return None
+
+        chunk_ranges = []
+        for df in (left, right):
+            if not df.index_value.is_monotonic_increasing:
+                return None
+            try:
+                res = _get_monotonic_chunk_index_min_max(
+                    df.index_value, [c.index_value for c in df.chunks]
+                )
+            except TypeError:  # pragma: no cover
+                return None
+            if res is None:
+                return None
+            ranges = res[0]
+            for min_val, _, max_val, _ in ranges:
+                if pd.isna(min_val) or pd.isna(max_val):
+                    return None
+            chunk_ranges.append(ranges)
+        return chunk_ranges
+
+    @classmethod
+    def _ranges_overlap(cls, range1: Tuple, range2: Tuple) -> bool:
+        min1, min1_close, max1, max1_close = range1
+        min2, min2_close, max2, max2_close = range2
+        if max1 < min2 or (max1 == min2 and not (max1_close and min2_close)):
+            return False
+        if max2 < min1 or (max2 == min1 and not (max2_close and min1_close)):
+            return False
+        return True
+
+    @classmethod
+    def _gen_concat_chunk(cls, chunks: List[DataFrameChunk]):
+        concat_op = DataFrameConcat(axis=0, output_types=get_output_types(chunks[0]))
+        index_value = parse_index(chunks[0].index_value.to_pandas()[:0], *chunks)
+        if chunks[0].ndim == 2:
+            return concat_op.new_chunk(
+                chunks,
+                shape=(np.nan, chunks[0].shape[1]),
+                dtypes=chunks[0].dtypes,
+                index_value=index_value,
+                columns_value=chunks[0].columns_value,
+            )
+        else:
+            return concat_op.new_chunk(
+                chunks,
+                shape=(np.nan,),
+                dtype=chunks[0].dtype,
+                index_value=index_value,
+                name=chunks[0].name,
+            )
+
+    @classmethod
+    def _tile_sort_merge(
+        cls,
+        op: "DataFrameMerge",
+        left: Union[DataFrame, Series],
+        right: Union[DataFrame, Series],
+        chunk_ranges: List[List[Tuple]],
+    ):
+        df = op.outputs[0]
+        left_ranges, right_ranges = chunk_ranges
+        # every chunk of the driving side is merged with chunks
+        # of the other side whose index ranges overlap with it
+        if op.how == "right" or (
+            op.how == "inner" and len(right.chunks) > len(left.chunks)
+        ):
+            drive_left = False
+            drive_chunks, drive_ranges = right.chunks, right_ranges
+            other_chunks, other_ranges = left.chunks, left_ranges
+        else:
+            drive_left = True
+            drive_chunks, drive_ranges = left.chunks, left_ranges
+            other_chunks, other_ranges = right.chunks, right_ranges
+
+        pairs = []
+        for drive_chunk, drive_range in zip(drive_chunks, drive_ranges):
+            overlapped = [
+                c
+                for c, r in zip(other_chunks, other_ranges)
+                if cls._ranges_overlap(drive_range, r)
+            ]
+            if not overlapped:
+                if op.how == "inner":
+                    # nothing matched
+                    continue
+                # rows of driving side are kept with no matches
+                overlapped = [other_chunks[0]]
+            pairs.append((drive_chunk, overlapped))
+        if not pairs:
+            pairs.append((drive_chunks[0], [other_chunks[0]]))
+
+        out_chunks = []
+        for drive_chunk, overlapped in pairs:
+            if len(overlapped) == 1:
+                other_chunk = overlapped[0]
+            else:
+                other_chunk = cls._gen_concat_chunk(overlapped)
+            if drive_left:
+                left_chunk, right_chunk = drive_chunk, other_chunk
+            else:
+                left_chunk, right_chunk = other_chunk, drive_chunk
+            merge_op = op.copy().reset_key()
+            out_chunk = merge_op.new_chunk(
+                [left_chunk, right_chunk],
+                shape=(np.nan, df.shape[1]),
+                index=(len(out_chunks), 0),
+                index_value=infer_index_value(
+                    left_chunk.index_value, right_chunk.index_value
+                ),
+                dtypes=df.dtypes,
+                columns_value=df.columns_value,
+            )
+            out_chunks.append(out_chunk)
+
+        new_op = op.copy()
+        return new_op.new_dataframes(
+            op.inputs,
+            df.shape,
+            nsplits=((np.nan,) * len(out_chunks), (df.shape[1],)),
+            chunks=out_chunks,
+            dtypes=df.dtypes,
+            index_value=df.index_value,
+            columns_value=df.columns_value,
+        )
+
     @classmethod
     def _tile_broadcast(
         cls,
@@ -689,6 +1029,8 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
         if method == "auto":
             if cls._can_merge_with_one_chunk(left, right, how):
                 return MergeMethod.one_chunk
+            elif cls._get_sorted_chunk_ranges(op, left, right) is not None:
+                return MergeMethod.sort_merge
             elif cls._can_merge_with_broadcast(
                 big_chunk_size, small_chunk_size, big_side, how
             ):
@@ -702,6 +1044,14 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
                 return MergeMethod.broadcast
             else:  # pragma: no cover
                 raise ValueError("Cannot specify merge method `broadcast`")
+        elif method == "sort_merge":
+            if cls._get_sorted_chunk_ranges(op, left, right) is not None:
+                return MergeMethod.sort_merge
+            raise ValueError(
+                "Cannot specify merge method `sort_merge`, both sides should be "
+                "merged on increasing indexes with known ranges of chunks, "
+                "and how should be `inner`, `left` or `right`"
+            )
         else:
             assert method == "shuffle"
             return MergeMethod.shuffle
@@ -736,6 +1086,18 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
 
         return False
 
+    @classmethod
+    def _auto_merge_inputs(
+        cls, ctx, left: TileableType, right: TileableType, progress: float
+    ):
+        memory_sizes = yield from observe_memory_sizes(
+            left.chunks + right.chunks, tileables=[left, right], progress=progress
+        )
+        n_left_chunks = len(left.chunks)
+        left = auto_merge_chunks(ctx, left, memory_sizes=memory_sizes[:n_left_chunks])
+        right = auto_merge_chunks(ctx, right, memory_sizes=memory_sizes[n_left_chunks:])
+        return left, right
+
     @classmethod
     def tile(cls, op: "DataFrameMerge"):
         left = build_concatenated_rows_frame(op.inputs[0])
@@ -749,11 +1111,11 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
             auto_merge_before
             and len(left.chunks) + len(right.chunks) > auto_merge_threshold
         ):
-            yield TileStatus([left, right] + left.chunks + right.chunks, progress=0.2)
             left_chunk_size = len(left.chunks)
             right_chunk_size = len(right.chunks)
-            left = auto_merge_chunks(ctx, left)
-            right = auto_merge_chunks(ctx, right)
+            left, right = yield from cls._auto_merge_inputs(
+                ctx, left, right, progress=0.2
+            )
             logger.info(
                 "Auto merge before %s, left data shape: %s, chunk count: %s -> %s, "
                 "right data shape: %s, chunk count: %s -> %s.",
@@ -792,33 +1154,70 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
                 *cls._apply_bloom_filter(left, right, left_on, right_on, op)
             )
             # auto merge after bloom filter
-            yield TileStatus([left, right] + left.chunks + right.chunks, progress=0.5)
-            left = auto_merge_chunks(ctx, left)
-            right = auto_merge_chunks(ctx, right)
+            left, right = yield from cls._auto_merge_inputs(
+                ctx, left, right, progress=0.5
+            )
 
             if op.method == "auto":
                 # if method is auto, select new method after auto merge
                 method = cls._choose_merge_method(op, left, right)
+        if method == MergeMethod.sort_merge:
+            chunk_ranges = cls._get_sorted_chunk_ranges(op, left, right)
+            if chunk_ranges is None:  # pragma: no cover
+                # ranges of chunks lost after bloom filter
+                method = MergeMethod.shuffle
         logger.info("Choose %s method for merge operand %s.", method, op)
         if method == MergeMethod.one_chunk:
             ret = cls._tile_one_chunk(op, left, right)
         elif method == MergeMethod.broadcast:
             ret = cls._tile_broadcast(op, left, right)
+        elif method == MergeMethod.sort_merge:
+            ret = cls._tile_sort_merge(op, left, right, chunk_ranges)
         else:
             assert method == MergeMethod.shuffle
-            ret = cls._tile_shuffle(op, left, right)
+            if op.skew_join and op.how in ["inner", "left", "right"]:
+                left_hot_keys, right_hot_keys = yield from cls._sample_hot_keys(
+                    op, left, right
+                )
+            else:
+                left_hot_keys = right_hot_keys = None
+            ret = cls._tile_shuffle(
+                op,
+                left,
+                right,
+                left_hot_keys=left_hot_keys,
+                right_hot_keys=right_hot_keys,
+            )
 
         if (
+            method == MergeMethod.shuffle
+            and op.shuffle_coalesce_size is not None
+            and len(ret[0].chunks) > 1
+        ):
+            # coalesce small partitions generated by shuffle,
+            # sizes of partitions are known after reducers executed
+            memory_sizes = yield from observe_memory_sizes(ret[0].chunks, progress=0.8)
+            merged = auto_merge_chunks(
+                ctx, ret[0], op.shuffle_coalesce_size, memory_sizes=memory_sizes
+            )
+            logger.info(
+                "Coalesce shuffled chunks of %s, data shape: %s, chunk count: %s -> %s.",
+                op,
+                merged.shape,
+                len(ret[0].chunks),
+                len(merged.chunks),
+            )
+            return [merged]
+        elif (
             op.how == "inner"
             and auto_merge_after
             and len(ret[0].chunks) > auto_merge_threshold
         ):
             # if how=="inner", output data size will reduce greatly with high probability，
             # use auto_merge_chunks to combine small chunks.
-            yield TileStatus(
-                ret[0].chunks, progress=0.8
-            )  # trigger execution for chunks
-            merged = auto_merge_chunks(get_context(), ret[0])
+            # trigger execution for chunks
+            memory_sizes = yield from observe_memory_sizes(ret[0].chunks, progress=0.8)
+            merged = auto_merge_chunks(ctx, ret[0], memory_sizes=memory_sizes)
             logger.info(
                 "Auto merge after %s, data shape: %s, chunk count: %s -> %s.",
                 op,
@@ -919,6 +1318,8 @@ def merge(
     auto_merge_threshold: int = 8,
     bloom_filter: Union[bool, str] = "auto",
     bloom_filter_options: Dict[str, Any] = None,
+    skew_join: bool = False,
+    skew_join_options: Dict[str, Any] = None,
 ) -> DataFrame:
     """
     Merge DataFrame or named Series objects with a database-style join.
@@ -996,9 +1397,11 @@ def merge(
         * "many_to_one" or "m:1": check if merge keys are unique in right
           dataset.
         * "many_to_many" or "m:m": allowed, but does not result in checks.
-    method : {"auto", "shuffle", "broadcast"}, default auto
+    method : {"auto", "shuffle", "broadcast", "sort_merge"}, default auto
         "broadcast" is recommended when one DataFrame is much smaller than the other,
-        otherwise, "shuffle" will be a better choice. By default, we choose method
+        otherwise, "shuffle" will be a better choice. "sort_merge" pairs chunks
+        with overlapping index ranges without any shuffle, which works when both
+        sides are merged on increasing indexes. By default, we choose method
         according to actual data size.
     auto_merge : {"both", "none", "before", "after"}, default both
         Auto merge small chunks before or after merge
@@ -1021,6 +1424,17 @@ def merge(
           when chunk size of left and right is greater than this threshold, apply bloom filter
         * "filter": "large", "small", "both", default "large"
           decides to filter on large, small or both DataFrames.
+    skew_join: bool, default False
+        Sample key frequencies before shuffle and split rows of hot keys
+        across several reducers, matching rows of the other side are sent
+        to all these reducers. Only works for "inner", "left" and "right"
+        merges with method "shuffle".
+    skew_join_options: dict
+        * "sample_size": rows sampled from every input chunk, default 1000
+        * "hot_key_factor": a key is hot when its estimated number of rows
+          exceeds the factor times average rows of a reducer, default 1.0
+        * "max_splits": max number of reducers a hot key is split into,
+          default the number of reducers
 
     Returns
     -------
@@ -1107,6 +1521,7 @@ def merge(
         "auto",
         "shuffle",
         "broadcast",
+        "sort_merge",
     ]:  # pragma: no cover
         raise NotImplementedError(f"{method} merge is not supported")
     if auto_merge not in ["both", "none", "before", "after"]:  # pragma: no cover
@@ -1131,6 +1546,16 @@ def merge(
                 raise ValueError(
                     f"Invalid filter {k}, available: {BLOOM_FILTER_ON_OPTIONS}"
                 )
+    if skew_join_options:
+        if not isinstance(skew_join_options, dict):
+            raise TypeError(
+                f"skew_join_options must be a dict, got {type(skew_join_options)}"
+            )
+        for k in skew_join_options:
+            if k not in SKEW_JOIN_OPTIONS:
+                raise ValueError(
+                    f"Invalid skew join option {k}, available: {SKEW_JOIN_OPTIONS}"
+                )
     op = DataFrameMerge(
         how=how,
         on=on,
@@ -1148,6 +1573,9 @@ def merge(
         auto_merge_threshold=auto_merge_threshold,
         bloom_filter=bloom_filter,
         bloom_filter_options=bloom_filter_options,
+        skew_join=skew_join,
+        skew_join_options=skew_join_options,
+        shuffle_coalesce_size=options.dataframe.shuffle.coalesce_size,
         output_types=[OutputType.dataframe],
     )
     return op(df, right)
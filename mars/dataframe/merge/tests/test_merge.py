@@ -235,6 +235,51 @@ def test_merge_one_chunk():
     assert tiled.chunks[1].inputs[1].key == tiled2.chunks[0].key
 
 
+def test_sort_merge():
+    df1 = pd.DataFrame({"a": np.arange(10)})
+    df2 = pd.DataFrame({"b": np.arange(10)}, index=np.arange(2, 22, 2))
+
+    mdf1 = from_pandas(df1, chunk_size=4)
+    mdf2 = from_pandas(df2, chunk_size=3)
+
+    # right side drives when it has more chunks
+    df = mdf1.merge(mdf2, left_index=True, right_index=True, auto_merge="none")
+    tiled, tiled1, tiled2 = tile(df, mdf1, mdf2)
+    assert tiled.chunk_shape == (2, 1)
+    left, right = tiled.chunks[0].inputs
+    assert [c.key for c in left.inputs] == [c.key for c in tiled1.chunks[:2]]
+    assert right.key == tiled2.chunks[0].key
+    left, right = tiled.chunks[1].inputs
+    assert left.key == tiled1.chunks[2].key
+    assert right.key == tiled2.chunks[1].key
+
+    # every chunk of left kept for left merge
+    df = mdf1.merge(
+        mdf2, how="left", left_index=True, right_index=True, auto_merge="none"
+    )
+    tiled, tiled1, tiled2 = tile(df, mdf1, mdf2)
+    assert tiled.chunk_shape == (3, 1)
+    for chunk, left_chunk, right_chunk in zip(
+        tiled.chunks, tiled1.chunks, [tiled2.chunks[i] for i in (0, 0, 1)]
+    ):
+        assert isinstance(chunk.op, DataFrameMerge)
+        assert chunk.inputs[0].key == left_chunk.key
+        assert chunk.inputs[1].key == right_chunk.key
+
+    # cannot merge outer
+    with pytest.raises(ValueError):
+        tile(
+            mdf1.merge(
+                mdf2,
+                how="outer",
+                left_index=True,
+                right_index=True,
+                method="sort_merge",
+                auto_merge="none",
+            )
+        )
+
+
 def test_append():
     df1 = pd.DataFrame(np.random.rand(10, 4), columns=list("ABCD"))
     df2 = pd.DataFrame(np.random.rand(10, 4), columns=list("ABCD"))
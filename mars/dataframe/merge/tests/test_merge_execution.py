@@ -16,6 +16,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from ....config import option_context
 from ....core.graph.builder.utils import build_graph
 from ...datasource.dataframe import from_pandas
 from ...datasource.series import from_pandas as series_from_pandas
@@ -636,6 +637,81 @@ def test_merge_with_bloom_filter_options(setup, filter):
     )
 
 
+@pytest.mark.parametrize("how", ["inner", "left", "right"])
+def test_sort_merge(setup, how):
+    ns = np.random.RandomState(0)
+    raw_df1 = pd.DataFrame(
+        {"col1": ns.random(40)}, index=np.sort(ns.choice(60, 40, replace=False))
+    )
+    raw_df2 = pd.DataFrame({"col2": ns.random(30)}, index=np.arange(10, 70, 2))
+
+    df1 = from_pandas(raw_df1, chunk_size=7)
+    df2 = from_pandas(raw_df2, chunk_size=4)
+    m = df1.merge(
+        df2,
+        how=how,
+        left_index=True,
+        right_index=True,
+        auto_merge="none",
+        method="sort_merge",
+    )
+
+    expected = raw_df1.merge(raw_df2, how=how, left_index=True, right_index=True)
+    result = m.execute().fetch()
+    pd.testing.assert_frame_equal(expected, result)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right"])
+def test_skew_merge(setup, how):
+    ns = np.random.RandomState(0)
+    # key 0 takes up most of rows of the left
+    left_keys = np.where(ns.random(400) < 0.6, 0, ns.randint(1, 20, size=400))
+    raw_df1 = pd.DataFrame({"col1": ns.random(400), "col2": left_keys})
+    raw_df2 = pd.DataFrame(
+        {"col1": ns.random(100), "col2": ns.randint(0, 25, size=(100,))}
+    )
+
+    df1 = from_pandas(raw_df1, chunk_size=40)
+    df2 = from_pandas(raw_df2, chunk_size=20)
+    m = df1.merge(
+        df2,
+        on="col2",
+        how=how,
+        auto_merge="none",
+        method="shuffle",
+        skew_join=True,
+        skew_join_options={"sample_size": 20},
+    )
+
+    expected = raw_df1.merge(raw_df2, on="col2", how=how)
+    result = m.execute().fetch()
+    pd.testing.assert_frame_equal(
+        expected.sort_values(by=["col1_x", "col1_y"]).reset_index(drop=True),
+        result.sort_values(by=["col1_x", "col1_y"]).reset_index(drop=True),
+    )
+
+    with pytest.raises(ValueError):
+        df1.merge(df2, on="col2", skew_join=True, skew_join_options={"unknown": 1})
+
+
+@pytest.mark.parametrize("how", ["inner", "outer"])
+def test_merge_with_shuffle_coalesce(setup, how):
+    rs = np.random.RandomState(0)
+    raw_df1 = pd.DataFrame({"col1": rs.random(100), "col2": rs.randint(20, size=100)})
+    raw_df2 = pd.DataFrame({"col1": rs.random(50), "col2": rs.randint(25, size=50)})
+
+    df1 = from_pandas(raw_df1, chunk_size=10)
+    df2 = from_pandas(raw_df2, chunk_size=10)
+    with option_context({"dataframe.shuffle.coalesce_size": "1M"}):
+        m = df1.merge(df2, on="col2", how=how, auto_merge="none", method="shuffle")
+    result = m.execute().fetch()
+    expected = raw_df1.merge(raw_df2, on="col2", how=how)
+    pd.testing.assert_frame_equal(
+        expected.sort_values(by=["col1_x", "col1_y"]).reset_index(drop=True),
+        result.sort_values(by=["col1_x", "col1_y"]).reset_index(drop=True),
+    )
+
+
 @pytest.mark.parametrize("auto_merge", ["none", "both", "before", "after"])
 def test_merge_on_duplicate_columns(setup, auto_merge):
     raw1 = pd.DataFrame(
@@ -41,6 +41,7 @@ class DataFrameSortOperand(DataFrameOperand):
     parallel_kind = StringField("parallel_kind")
     psrs_kinds = ListField("psrs_kinds", FieldTypes.string)
     nrows = Int64Field("nrows", default=None)
+    shuffle_coalesce_size = AnyField("shuffle_coalesce_size", default=None)
 
     @classmethod
     def _tile_head(cls, op: "DataFrameSortOperand"):
@@ -18,8 +18,9 @@ import numpy as np
 import pandas as pd
 
 from ... import opcodes as OperandDef
+from ...core import observe_memory_sizes
 from ...core.operand import OperandStage, MapReduceOperand
-from ...utils import lazy_import, calc_nsplits
+from ...utils import lazy_import, calc_nsplits, parse_readable_size
 from ...serialization.serializables import (
     AnyField,
     Int32Field,
@@ -29,7 +30,12 @@ from ...serialization.serializables import (
 )
 from ...tensor.base.psrs import PSRSOperandMixin
 from ..core import IndexValue, OutputType
-from ..utils import standardize_range_index, parse_index, is_cudf
+from ..utils import (
+    standardize_range_index,
+    parse_index,
+    is_cudf,
+    merge_small_chunks,
+)
 from ..operands import DataFrameOperandMixin, DataFrameOperand, DataFrameShuffleProxy
 
 
@@ -297,6 +303,16 @@ class DataFramePSRSOperandMixin(DataFrameOperandMixin, PSRSOperandMixin):
             op, False, None, partition_chunks, proxy_chunk
         )[0]
 
+        if op.shuffle_coalesce_size is not None and len(partition_sort_chunks) > 1:
+            # coalesce adjacent small partitions, order is kept by concat
+            memory_sizes = yield from observe_memory_sizes(partition_sort_chunks)
+            if all(size is not None for size in memory_sizes):
+                partition_sort_chunks = merge_small_chunks(
+                    partition_sort_chunks,
+                    memory_sizes,
+                    parse_readable_size(op.shuffle_coalesce_size)[0],
+                )
+
         if op.ignore_index:
             yield partition_sort_chunks
             chunks = standardize_range_index(partition_sort_chunks, axis=op.axis)
@@ -15,6 +15,7 @@
 import pandas as pd
 
 from ... import opcodes as OperandDef
+from ...config import options
 from ...core import OutputType, recursive_tile
 from ...serialization.serializables import ListField, BoolField
 from ...tensor.base.sort import _validate_sort_psrs_kinds
@@ -236,6 +237,7 @@ def sort_index(
         ignore_index=ignore_index,
         parallel_kind=parallel_kind,
         psrs_kinds=psrs_kinds,
+        shuffle_coalesce_size=options.dataframe.shuffle.coalesce_size,
         gpu=a.op.is_gpu(),
     )
     sorted_a = op(a)
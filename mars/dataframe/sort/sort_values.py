@@ -16,6 +16,7 @@ import numpy as np
 import pandas as pd
 
 from ... import opcodes as OperandDef
+from ...config import options
 from ...core import OutputType
 from ...serialization.serializables import ListField
 from ...tensor.base.sort import _validate_sort_psrs_kinds
@@ -265,6 +266,7 @@ def dataframe_sort_values(
         ignore_index=ignore_index,
         parallel_kind=parallel_kind,
         psrs_kinds=psrs_kinds,
+        shuffle_coalesce_size=options.dataframe.shuffle.coalesce_size,
         gpu=df.op.is_gpu(),
         output_types=[OutputType.dataframe],
     )
@@ -377,6 +379,7 @@ def series_sort_values(
         ignore_index=ignore_index,
         parallel_kind=parallel_kind,
         psrs_kinds=psrs_kinds,
+        shuffle_coalesce_size=options.dataframe.shuffle.coalesce_size,
         output_types=[OutputType.series],
         gpu=series.op.is_gpu(),
     )
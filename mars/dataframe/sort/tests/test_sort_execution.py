@@ -19,6 +19,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from ....config import option_context
 from ....tests.core import require_cudf
 from ... import DataFrame, Series, ArrowStringDtype
 
@@ -365,6 +366,25 @@ def test_sort_index_execution(setup):
     pd.testing.assert_series_equal(result, expected)
 
 
+def test_sort_with_shuffle_coalesce(setup):
+    rs = np.random.RandomState(0)
+    raw = pd.DataFrame({"a": rs.rand(100), "b": rs.randint(10, size=100)})
+
+    with option_context({"dataframe.shuffle.coalesce_size": "1M"}):
+        mdf = DataFrame(raw, chunk_size=10)
+        result = mdf.sort_values(by="a").execute().fetch()
+        pd.testing.assert_frame_equal(result, raw.sort_values(by="a"))
+
+        result = mdf.sort_values(by="a", ignore_index=True).execute().fetch()
+        pd.testing.assert_frame_equal(
+            result, raw.sort_values(by="a", ignore_index=True)
+        )
+
+        series = Series(raw["a"], chunk_size=10)
+        result = series.sort_index(ascending=False).execute().fetch()
+        pd.testing.assert_series_equal(result, raw["a"].sort_index(ascending=False))
+
+
 def test_arrow_string_sort_values(setup):
     rs = np.random.RandomState(0)
     raw = pd.DataFrame(
@@ -624,6 +624,16 @@ def test_auto_merge_chunks():
     df2 = auto_merge_chunks(FakeContext(False), df, 3 * memory_size)
     assert df2 is df
 
+    # observed memory sizes are used when specified
+    df2 = auto_merge_chunks(
+        FakeContext(False), df, 2 * memory_size, memory_sizes=[memory_size] * 4
+    )
+    assert len(df2.chunks) == 2
+    df2 = auto_merge_chunks(
+        FakeContext(), df, 2 * memory_size, memory_sizes=[memory_size, None] * 2
+    )
+    assert df2 is df
+
     # number of chunks on columns > 1
     df3 = tile(DataFrame(pdf, chunk_size=2))
     df4 = auto_merge_chunks(FakeContext(), df3, 2 * memory_size)
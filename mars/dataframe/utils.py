@@ -75,6 +75,12 @@ def hash_index(index, size):
 
 
 def hash_dataframe_on(df, on, size, level=None):
+    hashed_label = hash_labels_on(df, on, level=level)
+    idx_to_grouped = pd.RangeIndex(0, len(hashed_label)).groupby(hashed_label % size)
+    return [idx_to_grouped.get(i, pd.Index([])) for i in range(size)]
+
+
+def hash_labels_on(df, on, level=None):
     if on is None:
         idx = df.index
         if level is not None:
@@ -97,8 +103,7 @@ def hash_dataframe_on(df, on, size, level=None):
         else:
             data = df[on]
         hashed_label = pd.util.hash_pandas_object(data, index=False, categorize=False)
-    idx_to_grouped = pd.RangeIndex(0, len(hashed_label)).groupby(hashed_label % size)
-    return [idx_to_grouped.get(i, pd.Index([])) for i in range(size)]
+    return hashed_label
 
 
 def hash_dtypes(dtypes, size):
@@ -1353,38 +1358,27 @@ def is_cudf(x):
     return False
 
 
-def auto_merge_chunks(
-    ctx: Context,
-    df_or_series: TileableType,
-    merged_file_size: Union[int, float, str] = None,
-) -> TileableType:
+def merge_small_chunks(
+    chunks: List[ChunkType], memory_sizes: List[int], to_merge_size: int
+) -> List[ChunkType]:
+    """
+    Concat adjacent chunks on axis 0 until accumulated memory sizes
+    reach `to_merge_size`, chunks are reindexed in order.
+    """
     from .merge import DataFrameConcat
 
-    if df_or_series.ndim == 2 and df_or_series.chunk_shape[1] > 1:
-        # skip auto merge optimization for DataFrame
-        # that has more than 1 chunks on columns axis
-        return df_or_series
-
-    metas = ctx.get_chunks_meta(
-        [c.key for c in df_or_series.chunks], fields=["memory_size"], error="ignore"
-    )
-    memory_sizes = [meta["memory_size"] if meta is not None else None for meta in metas]
-    if any(size is None for size in memory_sizes):
-        # has not been executed before, cannot get accurate memory size, skip auto merge
-        return df_or_series
-
     def _concat_chunks(merge_chunks: List[ChunkType], output_index: int):
         chunk_size = sum(c.shape[0] for c in merge_chunks)
-        concat_op = DataFrameConcat(output_types=df_or_series.op.output_types)
-        if df_or_series.ndim == 1:
+        concat_op = DataFrameConcat(output_types=merge_chunks[0].op.output_types)
+        if merge_chunks[0].ndim == 1:
             kw = dict(
-                dtype=df_or_series.dtype,
+                dtype=merge_chunks[0].dtype,
                 index_value=merge_index_value(
                     {c.index: c.index_value for c in merge_chunks}
                 ),
                 shape=(chunk_size,),
                 index=(output_index,),
-                name=df_or_series.name,
+                name=merge_chunks[0].name,
             )
         else:
             kw = dict(
@@ -1398,19 +1392,11 @@ def auto_merge_chunks(
             )
         return concat_op.new_chunk(merge_chunks, **kw)
 
-    to_merge_size = (
-        parse_readable_size(merged_file_size)[0]
-        if merged_file_size is not None
-        else options.chunk_store_limit
-    )
     to_merge_chunks = []
     acc_memory_size = 0
-    n_split = []
     out_chunks = []
     last_idx = len(memory_sizes) - 1
-    for idx, (chunk, chunk_memory_size) in enumerate(
-        zip(df_or_series.chunks, memory_sizes)
-    ):
+    for idx, (chunk, chunk_memory_size) in enumerate(zip(chunks, memory_sizes)):
         to_merge_chunks.append(chunk)
         acc_memory_size += chunk_memory_size
         if (
@@ -1422,20 +1408,49 @@ def auto_merge_chunks(
             if len(to_merge_chunks) == 1:
                 # do not generate concat op for 1 input.
                 c = to_merge_chunks[0].copy()
-                c._index = (
-                    (len(n_split),) if df_or_series.ndim == 1 else (len(n_split), 0)
-                )
+                c._index = (len(out_chunks),) if c.ndim == 1 else (len(out_chunks), 0)
                 out_chunks.append(c)
-                n_split.append(c.shape[0])
             else:
-                merged_chunk = _concat_chunks(to_merge_chunks, len(n_split))
-                out_chunks.append(merged_chunk)
-                n_split.append(merged_chunk.shape[0])
+                out_chunks.append(_concat_chunks(to_merge_chunks, len(out_chunks)))
             # reset
             acc_memory_size = 0
             to_merge_chunks = []
     # process the last chunk
     assert len(to_merge_chunks) == 0
+    return out_chunks
+
+
+def auto_merge_chunks(
+    ctx: Context,
+    df_or_series: TileableType,
+    merged_file_size: Union[int, float, str] = None,
+    memory_sizes: List[int] = None,
+) -> TileableType:
+    if df_or_series.ndim == 2 and df_or_series.chunk_shape[1] > 1:
+        # skip auto merge optimization for DataFrame
+        # that has more than 1 chunks on columns axis
+        return df_or_series
+
+    if memory_sizes is None:
+        metas = ctx.get_chunks_meta(
+            [c.key for c in df_or_series.chunks],
+            fields=["memory_size"],
+            error="ignore",
+        )
+        memory_sizes = [
+            meta["memory_size"] if meta is not None else None for meta in metas
+        ]
+    if any(size is None for size in memory_sizes):
+        # has not been executed before, cannot get accurate memory size, skip auto merge
+        return df_or_series
+
+    to_merge_size = (
+        parse_readable_size(merged_file_size)[0]
+        if merged_file_size is not None
+        else options.chunk_store_limit
+    )
+    out_chunks = merge_small_chunks(df_or_series.chunks, memory_sizes, to_merge_size)
+    n_split = [c.shape[0] for c in out_chunks]
     new_op = df_or_series.op.copy()
     params = df_or_series.params.copy()
     params["chunks"] = out_chunks
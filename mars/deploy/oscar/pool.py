@@ -222,6 +222,7 @@ async def create_worker_actor_pool(
     gpu_external_address_scheme = gpu_config.get("external_addr_scheme")
     gpu_enable_internal_address = gpu_config.get("enable_internal_addr")
     extra_conf = oscar_config.get("extra_conf", dict())
+    n_standby_process = oscar_config.get("n_standby_process", 0)
 
     if cuda_devices is None:  # pragma: no cover
         env_devices = os.environ.get("CUDA_VISIBLE_DEVICES")
@@ -267,5 +268,6 @@ async def create_worker_actor_pool(
         external_address_schemes=external_address_schemes,
         enable_internal_addresses=enable_internal_addresses,
         extra_conf=extra_conf,
+        n_standby_process=n_standby_process,
         **kwargs,
     )
@@ -12,14 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import struct
 from gzip import GzipFile
-from typing import BinaryIO
+from typing import BinaryIO, Optional, Union
 
 try:
     import lz4
+    import lz4.block
     import lz4.frame
 except ImportError:  # pragma: no cover
     lz4 = None
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
 
 
 _compressions = {"gzip": lambda f: GzipFile(fileobj=f)}
@@ -53,3 +60,309 @@ def compress(file: BinaryIO, compress_type: str) -> BinaryIO:
         )
 
     return compress_(file)
+
+
+# header of compressed blocks, including codec id, raw size and stored size
+_block_header = struct.Struct("<BQQ")
+
+_RAW_CODEC_ID = 0
+_codec_ids = {"lz4": 1, "zstd": 2}
+_block_compressors = dict()
+_block_decompressors = dict()
+
+if lz4:
+    _block_compressors["lz4"] = lambda data: lz4.block.compress(data, store_size=False)
+    _block_decompressors[_codec_ids["lz4"]] = lambda data, size: lz4.block.decompress(
+        data, uncompressed_size=size
+    )
+if zstandard:
+    _block_compressors["zstd"] = lambda data: zstandard.ZstdCompressor(
+        level=1
+    ).compress(data)
+    _block_decompressors[
+        _codec_ids["zstd"]
+    ] = lambda data, size: zstandard.ZstdDecompressor().decompress(
+        data, max_output_size=size
+    )
+
+DEFAULT_COMPRESS_BLOCK_SIZE = 1024**2
+
+
+class BlockCompressor:
+    """
+    Compress data into self-described blocks.
+
+    Parameters
+    ----------
+    codec: str
+        name of codec, lz4 or zstd.
+    adaptive: bool
+        if True, a sample of data is compressed first and data is stored
+        as is when the sample cannot be compressed well, which saves time
+        on incompressible buffers.
+    """
+
+    probe_size = 64 * 1024
+    min_ratio = 0.9
+
+    def __init__(self, codec: str, adaptive: bool = True):
+        try:
+            self._compress = _block_compressors[codec]
+        except KeyError:
+            raise ValueError(
+                f"Unknown or unavailable codec: {codec}, "
+                f'available include: {", ".join(_block_compressors)}'
+            ) from None
+        self._codec = codec
+        self._codec_id = _codec_ids[codec]
+        self._adaptive = adaptive
+
+    @property
+    def codec(self) -> str:
+        return self._codec
+
+    def _pack(self, codec_id: int, raw_size: int, data) -> bytes:
+        stored_size = getattr(data, "nbytes", len(data))
+        return b"".join(
+            [_block_header.pack(codec_id, raw_size, stored_size), bytes(data)]
+        )
+
+    def _compress_block(self, data: memoryview, max_ratio: float) -> Optional[bytes]:
+        raw_size = data.nbytes
+        if self._adaptive and raw_size >= 2 * self.probe_size:
+            probe = self._compress(data[: self.probe_size])
+            if len(probe) > self.min_ratio * self.probe_size:
+                return None
+        compressed = self._compress(data)
+        if len(compressed) >= max_ratio * raw_size:
+            return None
+        return self._pack(self._codec_id, raw_size, compressed)
+
+    def try_compress(self, data: Union[bytes, memoryview]) -> Optional[bytes]:
+        """
+        Compress data into a block, returns None if data
+        cannot be compressed well.
+        """
+        return self._compress_block(memoryview(data).cast("B"), self.min_ratio)
+
+    def compress(self, data: Union[bytes, memoryview]) -> bytes:
+        data = memoryview(data).cast("B")
+        # data is stored as is only when compression does not save space
+        block = self._compress_block(data, 1.0)
+        if block is None:
+            return self._pack(_RAW_CODEC_ID, data.nbytes, data)
+        return block
+
+
+def _decompress_payload(codec_id: int, raw_size: int, payload) -> bytes:
+    if codec_id == _RAW_CODEC_ID:
+        return payload
+    try:
+        decompress = _block_decompressors[codec_id]
+    except KeyError:  # pragma: no cover
+        raise ValueError(f"Codec with id {codec_id} is unavailable") from None
+    return decompress(payload, raw_size)
+
+
+def decompress_block(block: Union[bytes, memoryview]) -> Union[bytes, memoryview]:
+    """
+    Decompress a block generated by `BlockCompressor`.
+    """
+    block = memoryview(block)
+    codec_id, raw_size, stored_size = _block_header.unpack_from(block)
+    payload = block[_block_header.size : _block_header.size + stored_size]
+    return _decompress_payload(codec_id, raw_size, payload)
+
+
+class CompressedFileWriter:
+    """
+    Write file object which compresses data into blocks.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        compressor: BlockCompressor,
+        block_size: int = DEFAULT_COMPRESS_BLOCK_SIZE,
+    ):
+        self._file = file
+        self._compressor = compressor
+        self._block_size = block_size
+        self._pending = bytearray()
+        self._size = 0
+
+    @property
+    def name(self):
+        return getattr(self._file, "name", None)
+
+    @property
+    def mode(self):
+        return "wb"
+
+    @property
+    def closed(self):
+        return getattr(self._file, "closed", False)
+
+    def _write_block(self, data):
+        self._file.write(self._compressor.compress(data))
+
+    def write(self, content: Union[bytes, memoryview]):
+        content = memoryview(content).cast("B")
+        self._size += content.nbytes
+        if self._pending:
+            n_fill = self._block_size - len(self._pending)
+            self._pending.extend(content[:n_fill])
+            content = content[n_fill:]
+            if len(self._pending) < self._block_size:
+                return
+            self._write_block(self._pending)
+            self._pending = bytearray()
+        while content.nbytes >= self._block_size:
+            self._write_block(content[: self._block_size])
+            content = content[self._block_size :]
+        self._pending.extend(content)
+
+    def tell(self):
+        return self._size
+
+    def flush(self):
+        if self._pending:
+            self._write_block(self._pending)
+            self._pending = bytearray()
+        self._file.flush()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+class DecompressedFileReader:
+    """
+    Read file object which decompresses blocks written
+    by `CompressedFileWriter`.
+    """
+
+    def __init__(self, file: BinaryIO):
+        self._file = file
+        self._reset()
+
+    def _reset(self):
+        # offset of current block in decompressed data
+        self._block_start = 0
+        self._block_size = 0
+        # decompressed data of current block, None if skipped
+        self._block: Optional[memoryview] = memoryview(b"")
+        self._pos_in_block = 0
+        # position of next block in underlying file
+        self._next_pos = 0
+
+    @property
+    def name(self):
+        return getattr(self._file, "name", None)
+
+    @property
+    def mode(self):
+        return "rb"
+
+    @property
+    def closed(self):
+        return getattr(self._file, "closed", False)
+
+    def _seek_file(self, pos: int):
+        try:
+            self._file.seek(pos)
+        except ValueError:
+            if pos <= 0:
+                return
+            # buffer-based files may not accept seeking to the end
+            self._file.seek(pos - 1)
+            self._file.read(1)
+
+    def _read_header(self) -> Optional[tuple]:
+        header = self._file.read(_block_header.size)
+        if len(header) < _block_header.size:
+            return None
+        return _block_header.unpack(bytes(header))
+
+    def _next_block(self, decompress: bool = True) -> bool:
+        header = self._read_header()
+        if header is None:
+            return False
+        codec_id, raw_size, stored_size = header
+        self._block_start += self._block_size
+        self._block_size = raw_size
+        self._pos_in_block = 0
+        self._next_pos += _block_header.size + stored_size
+        if decompress:
+            payload = self._file.read(stored_size)
+            self._block = memoryview(
+                _decompress_payload(codec_id, raw_size, payload)
+            ).cast("B")
+        else:
+            self._block = None
+            self._seek_file(self._next_pos)
+        return True
+
+    def read(self, size: int = -1):
+        chunks = []
+        while size != 0:
+            if self._pos_in_block >= self._block_size:
+                if not self._next_block():
+                    break
+                continue
+            end = self._block_size
+            if size > 0:
+                end = min(end, self._pos_in_block + size)
+                size -= end - self._pos_in_block
+            chunks.append(self._block[self._pos_in_block : end])
+            self._pos_in_block = end
+        if len(chunks) == 1:
+            return chunks[0]
+        return b"".join(chunks)
+
+    def tell(self):
+        return self._block_start + self._pos_in_block
+
+    def _total_size(self) -> int:
+        total_size = self._block_start + self._block_size
+        pos = self._next_pos
+        while True:
+            header = self._read_header()
+            if header is None:
+                break
+            _, raw_size, stored_size = header
+            total_size += raw_size
+            pos += _block_header.size + stored_size
+            self._seek_file(pos)
+        self._seek_file(self._next_pos)
+        return total_size
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET):
+        if whence == os.SEEK_END:
+            offset += self._total_size()
+        elif whence == os.SEEK_CUR:
+            offset += self.tell()
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+
+        block_end = self._block_start + self._block_size
+        if offset < self._block_start or (self._block is None and offset < block_end):
+            # restart from the first block
+            self._seek_file(0)
+            self._reset()
+
+        while offset > self._block_start + self._block_size:
+            # peek size of next block to decide whether to decompress it
+            header = self._read_header()
+            if header is None:
+                break
+            self._seek_file(self._next_pos)
+            next_block_end = self._block_start + self._block_size + header[1]
+            self._next_block(decompress=offset < next_block_end)
+
+        self._pos_in_block = offset - self._block_start
+        return offset
+
+    def close(self):
+        self._block = None
+        self._file.close()
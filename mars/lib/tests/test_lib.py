@@ -12,14 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import os
 import pickle
 import sys
 
 import pandas as pd
 import numpy as np
+import pytest
 
 from ...tests.core import assert_groupby_equal
 from ...utils import calc_data_size, estimate_pandas_size
+from ..compression import (
+    BlockCompressor,
+    CompressedFileWriter,
+    DecompressedFileReader,
+    decompress_block,
+)
 from ..groupby_wrapper import wrapped_groupby
 from ..tbcode import load_traceback_code, dump_traceback_code
 
@@ -131,3 +140,44 @@ def test_traceback_code():
     code_lines = target_dict[__file__][2]
     assert "raise" in code_lines[tb.tb_lineno - 1]
     assert len([line for line in code_lines if line]) == 5
+
+
+@pytest.mark.parametrize("codec", ["lz4", "zstd"])
+def test_block_compression(codec):
+    pytest.importorskip({"lz4": "lz4.block", "zstd": "zstandard"}[codec])
+
+    compressible = b"mars" * 100000
+    incompressible = os.urandom(256 * 1024)
+
+    compressor = BlockCompressor(codec)
+    block = compressor.compress(compressible)
+    assert len(block) < len(compressible)
+    assert decompress_block(block) == compressible
+    # incompressible data is stored as is
+    block = compressor.compress(incompressible)
+    assert len(block) > len(incompressible)
+    assert bytes(decompress_block(block)) == incompressible
+    with pytest.raises(ValueError):
+        BlockCompressor("unknown")
+
+    raw = compressible + incompressible + compressible[:1000]
+    bio = io.BytesIO()
+    writer = CompressedFileWriter(bio, compressor, block_size=100000)
+    writer.write(raw[:10])
+    writer.write(raw[10:])
+    assert writer.tell() == len(raw)
+    writer.flush()
+    assert len(bio.getvalue()) < len(raw)
+
+    reader = DecompressedFileReader(io.BytesIO(bio.getvalue()))
+    assert reader.read(10) == raw[:10]
+    assert reader.read() == raw[10:]
+    for offset, whence, expected in [
+        (150000, os.SEEK_SET, 150000),
+        (-100, os.SEEK_END, len(raw) - 100),
+        (1000, os.SEEK_SET, 1000),
+        (100000, os.SEEK_CUR, 301000),
+    ]:
+        assert reader.seek(offset, whence) == expected
+        assert reader.tell() == expected
+        assert reader.read(200000) == raw[expected : expected + 200000]
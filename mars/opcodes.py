@@ -409,6 +409,7 @@ DATAFRAME_LOC_SETITEM = 2024
 # merge
 DATAFRAME_MERGE = 2010
 DATAFRAME_SHUFFLE_MERGE_ALIGN = 2011
+DATAFRAME_MERGE_SAMPLE_KEYS = 2012
 
 # bloom filter
 DATAFRAME_BLOOM_FILTER = 2014
@@ -28,6 +28,7 @@ from .api import (
     kill_actor,
     Actor,
     StatelessActor,
+    ActorCallBatch,
     create_actor_pool,
     setup_cluster,
     wait_actor_pool_recovered,
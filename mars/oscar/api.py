@@ -12,14 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from urllib.parse import urlparse
-from typing import Any, Dict, Type, Tuple
+from typing import Any, Dict, List, Optional, Type, Tuple
 from numbers import Number
 from collections import defaultdict
 
 from .backend import get_backend
 from .context import get_context
-from .core import _Actor, _StatelessActor, ActorRef
+from .core import (
+    _Actor,
+    _StatelessActor,
+    ActorRef,
+    LocalActorRef,
+    CALL_METHOD_BATCH,
+    CALL_METHOD_DEFAULT,
+)
+
+# uid handled by actor pools to dispatch calls packed by ActorCallBatch
+BATCH_DISPATCHER_UID = b"__batch_dispatcher__"
 
 
 async def create_actor(actor_cls, *args, uid=None, address=None, **kwargs) -> ActorRef:
@@ -70,6 +81,98 @@ async def get_pool_config(address: str):
     return await ctx.get_pool_config(address)
 
 
+class ActorCallBatch:
+    """
+    Calls to methods of multiple actors issued together. Calls to actors
+    in the same actor pool are packed into one message and run by the
+    pool one after another, thus only one round trip is needed for every
+    pool. Calls to actors in current process are made directly.
+
+    Examples
+    --------
+    >>> batch = ActorCallBatch()
+    >>> batch.add(quota_ref, "update_quota", 1024)
+    >>> batch.add_batch(data_manager_ref, "put_data_info", [(session_id, ...)])
+    >>> _, infos = await batch.send()
+    """
+
+    def __init__(self):
+        self._calls: List[Tuple[ActorRef, Tuple]] = []
+
+    def __len__(self):
+        return len(self._calls)
+
+    def add(self, actor_ref: ActorRef, method: str, *args, **kwargs):
+        """
+        Add a call to a method of an actor.
+        """
+        self._calls.append((actor_ref, (method, CALL_METHOD_DEFAULT, args, kwargs)))
+
+    def add_batch(
+        self,
+        actor_ref: ActorRef,
+        method: str,
+        args_list: List[Tuple],
+        kwargs_list: List[Dict] = None,
+    ):
+        """
+        Add a batch call to an extensible method of an actor,
+        result of the call is a list.
+        """
+        if kwargs_list is not None and not any(kwargs_list):
+            kwargs_list = None
+        content = (method, CALL_METHOD_BATCH, (list(args_list), kwargs_list), None)
+        self._calls.append((actor_ref, content))
+
+    @staticmethod
+    async def _call_local(actor_ref: LocalActorRef, content: Tuple):
+        method, call_method, args, kwargs = content
+        ref_method = getattr(actor_ref, method)
+        if call_method == CALL_METHOD_BATCH:
+            args_list, kwargs_list = args
+            kwargs_list = kwargs_list or [{}] * len(args_list)
+            return await ref_method.batch(
+                *(ref_method.delay(*a, **kw) for a, kw in zip(args_list, kwargs_list))
+            )
+        return await ref_method(*args, **kwargs)
+
+    async def send(self) -> List:
+        """
+        Send calls and return results in the order calls are added.
+        Calls to the same pool run in the order they are added, and
+        calls after a failed one are skipped. Errors raised by any
+        of the calls are raised.
+        """
+        ctx = get_context()
+        address_to_indices = defaultdict(list)
+        for idx, (actor_ref, _) in enumerate(self._calls):
+            # local calls are grouped under None
+            is_local = isinstance(actor_ref, LocalActorRef)
+            address_to_indices[None if is_local else actor_ref.address].append(idx)
+
+        async def _send(address: Optional[str], indices: List[int]):
+            if address is None:
+                return [await self._call_local(*self._calls[idx]) for idx in indices]
+            if len(indices) == 1:
+                # single call does not need to be dispatched
+                actor_ref, content = self._calls[indices[0]]
+                return [await ctx.send(actor_ref, content)]
+            calls = [(self._calls[idx][0].uid, self._calls[idx][1]) for idx in indices]
+            content = ("dispatch", CALL_METHOD_DEFAULT, (calls,), {})
+            return await ctx.send(ActorRef(address, BATCH_DISPATCHER_UID), content)
+
+        address_results = await asyncio.gather(
+            *(_send(addr, indices) for addr, indices in address_to_indices.items())
+        )
+        results = [None] * len(self._calls)
+        for indices, address_result in zip(
+            address_to_indices.values(), address_results
+        ):
+            for idx, result in zip(indices, address_result):
+                results[idx] = result
+        return results
+
+
 def setup_cluster(address_to_resources: Dict[str, Dict[str, Number]]):
     scheme_to_address_resources = defaultdict(dict)
     for address, resources in address_to_resources.items():
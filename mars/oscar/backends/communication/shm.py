@@ -0,0 +1,228 @@
+# Copyright 1999-2022 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import logging
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+try:
+    from multiprocessing import resource_tracker
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # pragma: no cover
+    # allow shared_memory package to be absent
+    resource_tracker = SharedMemory = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHM_POOL_SIZE = 256 * 1024**2
+# max total size of segments kept attached by receivers, segments
+# unlinked by senders are not reclaimed until they are detached
+DEFAULT_MAX_ATTACHED_SIZE = 32 * 1024**2
+# minimal size of shared memory segments
+_MIN_SEGMENT_SIZE = 1024**2
+# first byte of a segment is the flag whether it is used by a message,
+# the flag is cleared by the receiver when content is copied out
+_FREE, _IN_USE = 0, 1
+_HEADER_SIZE = 8
+SHM_BUFFERS_NAME = "shm_bufs"
+
+# segments of closed pools still waiting for receivers to copy content out
+_deferred_segments: List[SharedMemory] = []
+
+
+def _unlink_segment(shm: SharedMemory):
+    shm.close()
+    try:
+        shm.unlink()
+    except FileNotFoundError:  # pragma: no cover
+        pass
+
+
+def _release_deferred_segments(force: bool = False):
+    remained = []
+    for shm in _deferred_segments:
+        if force or shm.buf[0] == _FREE:
+            _unlink_segment(shm)
+        else:
+            remained.append(shm)
+    _deferred_segments[:] = remained
+
+
+atexit.register(_release_deferred_segments, force=True)
+
+
+class SharedMemoryPool:
+    """
+    Pool of shared memory segments to pass large buffers to other
+    processes on the same host. Segments are reused after receivers
+    copy out their content, and released when the pool is full.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_SHM_POOL_SIZE):
+        self._max_size = max_size
+        self._segments: List[SharedMemory] = []
+        self._size = 0
+        _release_deferred_segments()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _release_segments(self, segments: List[SharedMemory]):
+        for shm in segments:
+            self._segments.remove(shm)
+            self._size -= shm.size
+            _unlink_segment(shm)
+
+    def _create_segment(self, size: int) -> Optional[SharedMemory]:
+        # round sizes to powers of 2 to make segments easy to reuse
+        seg_size = max(1 << (size - 1).bit_length(), _MIN_SEGMENT_SIZE)
+        if self._size + seg_size > self._max_size:
+            self._release_segments(
+                [shm for shm in self._segments if shm.buf[0] == _FREE]
+            )
+            if self._size + seg_size > self._max_size:
+                return None
+        try:
+            shm = SharedMemory(create=True, size=seg_size)
+        except OSError:  # pragma: no cover
+            logger.warning("Failed to create shared memory of size %s", seg_size)
+            return None
+        self._segments.append(shm)
+        self._size += shm.size
+        return shm
+
+    def put(self, buffer) -> Optional[str]:
+        """
+        Copy the buffer into a free segment, returns name of the segment,
+        or None if no segment can be allocated.
+        """
+        buffer = memoryview(buffer).cast("B")
+        size = _HEADER_SIZE + buffer.nbytes
+
+        shm = None
+        for seg in self._segments:
+            if seg.buf[0] == _FREE and seg.size >= size:
+                if shm is None or seg.size < shm.size:
+                    shm = seg
+        if shm is None:
+            shm = self._create_segment(size)
+            if shm is None:
+                return None
+        shm.buf[0] = _IN_USE
+        shm.buf[_HEADER_SIZE:size] = buffer
+        return shm.name
+
+    def close(self):
+        # segments not copied out by receivers yet are unlinked
+        # after they are freed, or when the process exits
+        in_use = [shm for shm in self._segments if shm.buf[0] == _IN_USE]
+        self._release_segments([shm for shm in self._segments if shm not in in_use])
+        self._segments = []
+        self._size = 0
+        _deferred_segments.extend(in_use)
+        _release_deferred_segments()
+
+
+class SharedMemoryAttacher:
+    """
+    Attach shared memory segments created by other processes
+    and copy content out of them.
+    """
+
+    def __init__(self, max_attached_size: int = DEFAULT_MAX_ATTACHED_SIZE):
+        self._max_attached_size = max_attached_size
+        self._attached: Dict[str, SharedMemory] = OrderedDict()
+        self._attached_size = 0
+
+    @property
+    def attached_size(self) -> int:
+        return self._attached_size
+
+    def _attach(self, name: str) -> SharedMemory:
+        try:
+            shm = self._attached[name]
+            self._attached.move_to_end(name)
+            return shm
+        except KeyError:
+            pass
+
+        shm = SharedMemory(name=name)
+        if os.name != "nt":  # pragma: no branch
+            # segments are unlinked by processes creating them
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+    def _detach_until(self, size: int):
+        while self._attached and self._attached_size > size:
+            _, old_shm = self._attached.popitem(last=False)
+            self._attached_size -= old_shm.size
+            old_shm.close()
+
+    def get(self, name: str, size: int) -> bytes:
+        shm = self._attach(name)
+        content = bytes(shm.buf[_HEADER_SIZE : _HEADER_SIZE + size])
+        # the segment can be reused by the sender
+        shm.buf[0] = _FREE
+        if name in self._attached:
+            return content
+        if shm.size > self._max_attached_size:
+            # large segments are detached at once
+            shm.close()
+        else:
+            self._detach_until(self._max_attached_size - shm.size)
+            self._attached[name] = shm
+            self._attached_size += shm.size
+        return content
+
+    def close(self):
+        self._detach_until(0)
+
+
+def put_shm_buffers(
+    headers: List, buffers: List, pool: SharedMemoryPool, threshold: int
+) -> List:
+    """
+    Move buffers no smaller than the threshold into shared memory,
+    only names of segments are kept in headers.
+    """
+    shm_buffers = []
+    for idx, buf in enumerate(buffers):
+        if hasattr(buf, "__cuda_array_interface__"):
+            continue
+        size = getattr(buf, "nbytes", None) or len(buf)
+        if size < threshold:
+            continue
+        try:
+            name = pool.put(buf)
+        except (TypeError, ValueError):  # pragma: no cover
+            # buffers not contiguous
+            continue
+        if name is None:
+            # pool is full, send buffers by sockets
+            break
+        shm_buffers.append((idx, name, size))
+        buffers[idx] = b""
+    if shm_buffers:
+        headers[0][SHM_BUFFERS_NAME] = shm_buffers
+    return buffers
+
+
+def load_shm_buffers(header: List, buffers: List, attacher: SharedMemoryAttacher):
+    shm_buffers = header[0].pop(SHM_BUFFERS_NAME, None)
+    for idx, name, size in shm_buffers or ():
+        buffers[idx] = attacher.get(name, size)
+    return buffers
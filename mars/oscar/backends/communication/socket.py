@@ -18,24 +18,85 @@ import os
 import socket
 import sys
 import tempfile
+import time
 from abc import ABCMeta
 from asyncio import StreamReader, StreamWriter, AbstractServer
 from functools import lru_cache
 from hashlib import md5
-from typing import Any, Dict, Callable, Coroutine, Type
+from typing import Any, Dict, Callable, Coroutine, List, Tuple, Type
 from urllib.parse import urlparse
 
+from ....lib.compression import BlockCompressor, decompress_block
 from ....serialization import AioSerializer, AioDeserializer, deserialize
 from ....utils import implements, to_binary, classproperty
 from .base import Channel, ChannelType, Server, Client
 from .core import register_client, register_server
+from .shm import (
+    DEFAULT_SHM_POOL_SIZE,
+    SHM_BUFFERS_NAME,
+    SharedMemory,
+    SharedMemoryAttacher,
+    SharedMemoryPool,
+    load_shm_buffers,
+    put_shm_buffers,
+)
 from .utils import read_buffers, write_buffers
 
 _is_windows: bool = sys.platform.startswith("win")
 
+# messages no larger than the size are coalesced into one write
+DEFAULT_COALESCE_SIZE = 16 * 1024
+# seconds to wait for more messages to coalesce, when set to 0,
+# messages sent within the same loop iteration are coalesced
+DEFAULT_COALESCE_DELAY = 0
+# buffers smaller than the size are not compressed
+DEFAULT_COMPRESS_THRESHOLD = 64 * 1024
+# buffers are compressed or decompressed in a thread when their total
+# size reaches the size, thus the event loop is not blocked
+DEFAULT_COMPRESS_OFFLOAD_SIZE = 1024**2
+COMPRESSED_BUFFERS_NAME = "compressed_bufs"
+
+
+def _get_size(buf) -> int:
+    return getattr(buf, "nbytes", None) or len(buf)
+
+
+def _consume_task_error(task: asyncio.Task):
+    # errors are raised in senders waiting for the task, or
+    # when receiving messages from the closed channel
+    if not task.cancelled():
+        task.exception()
+
+
+class _ChannelSerializer(AioSerializer):
+    def __init__(self, obj: Any, channel: "SocketChannel", compress=0):
+        super().__init__(obj, compress=compress)
+        self._channel = channel
+
+    async def _serialize(self):
+        headers, buffers = await super()._serialize()
+        return headers, await self._channel._process_buffers(headers, buffers)
+
 
 class SocketChannel(Channel):
-    __slots__ = "reader", "writer", "_channel_type", "_send_lock", "_recv_lock"
+    __slots__ = (
+        "reader",
+        "writer",
+        "_channel_type",
+        "_send_lock",
+        "_recv_lock",
+        "_coalesce_size",
+        "_coalesce_delay",
+        "_pending_buffers",
+        "_flush_scheduled",
+        "_drain_task",
+        "_shm_threshold",
+        "_shm_pool",
+        "_shm_attacher",
+        "_compressor",
+        "_compress_threshold",
+        "_compress_stats",
+    )
 
     name = "socket"
 
@@ -47,6 +108,12 @@ class SocketChannel(Channel):
         dest_address: str = None,
         compression: int = None,
         channel_type: ChannelType = None,
+        coalesce_size: int = None,
+        coalesce_delay: float = None,
+        shm_threshold: int = None,
+        shm_pool_size: int = None,
+        compress_codec: str = None,
+        compress_threshold: int = None,
     ):
         super().__init__(
             local_address=local_address,
@@ -60,18 +127,76 @@ class SocketChannel(Channel):
         self._send_lock = asyncio.Lock()
         self._recv_lock = asyncio.Lock()
 
+        self._coalesce_size = (
+            DEFAULT_COALESCE_SIZE if coalesce_size is None else coalesce_size
+        )
+        self._coalesce_delay = coalesce_delay or DEFAULT_COALESCE_DELAY
+        self._pending_buffers = []
+        self._flush_scheduled = False
+        self._drain_task = None
+
+        # large buffers are passed via shared memory when both
+        # sides of the channel are on the same host
+        self._shm_threshold = shm_threshold or 0
+        if (
+            self._shm_threshold > 0
+            and channel_type == ChannelType.ipc
+            and SharedMemory is not None
+        ):
+            self._shm_pool = SharedMemoryPool(shm_pool_size or DEFAULT_SHM_POOL_SIZE)
+        else:
+            self._shm_pool = None
+        self._shm_attacher = None
+
+        # buffers are compressed adaptively, small buffers and
+        # buffers which cannot be compressed well are sent as is
+        self._compressor = (
+            BlockCompressor(compress_codec, adaptive=True) if compress_codec else None
+        )
+        self._compress_threshold = compress_threshold or DEFAULT_COMPRESS_THRESHOLD
+        self._compress_stats = dict(
+            raw_size=0, compressed_size=0, compress_time=0.0, decompress_time=0.0
+        )
+
     @property
     @implements(Channel.type)
     def type(self) -> ChannelType:
         return self._channel_type
 
+    @property
+    def compression_stats(self) -> Dict:
+        """
+        Sizes of buffers before and after compression,
+        and CPU time spent on compression and decompression.
+        """
+        stats = self._compress_stats.copy()
+        if stats["raw_size"]:
+            stats["ratio"] = stats["compressed_size"] / stats["raw_size"]
+        return stats
+
+    @property
+    @implements(Channel.info)
+    def info(self) -> Dict:
+        info = super().info
+        if self._compressor is not None:
+            info["compression_stats"] = self.compression_stats
+        return info
+
     @implements(Channel.send)
     async def send(self, message: Any):
         # get buffers
         compress = self.compression or 0
-        serializer = AioSerializer(message, compress=compress)
+        if self._shm_pool is not None or self._compressor is not None:
+            serializer = _ChannelSerializer(message, self, compress=compress)
+        else:
+            serializer = AioSerializer(message, compress=compress)
         buffers = await serializer.run()
 
+        if self._coalesce_size > 0 and self._is_small(buffers):
+            return await self._write_coalesced(buffers)
+
+        # keep order with messages waiting to be coalesced
+        self._flush_pending()
         # write buffers
         write_buffers(self.writer, buffers)
         async with self._send_lock:
@@ -79,16 +204,141 @@ class SocketChannel(Channel):
             # assertion error may be raised
             await self.writer.drain()
 
+    async def _process_buffers(self, headers: List, buffers: List) -> List:
+        if self._shm_pool is not None:
+            # buffers are not copied via sockets, compression is useless
+            return put_shm_buffers(
+                headers, buffers, self._shm_pool, self._shm_threshold
+            )
+        elif self._compressor is not None:
+            indices = [
+                idx
+                for idx, buf in enumerate(buffers)
+                if not hasattr(buf, "__cuda_array_interface__")
+                and _get_size(buf) >= self._compress_threshold
+            ]
+            if not indices:
+                return buffers
+            if sum(_get_size(buffers[idx]) for idx in indices) >= (
+                DEFAULT_COMPRESS_OFFLOAD_SIZE
+            ):
+                result = await asyncio.to_thread(
+                    self._compress_buffers, buffers, indices
+                )
+            else:
+                result = self._compress_buffers(buffers, indices)
+            compressed_indices, raw_size, compressed_size, cpu_time = result
+            stats = self._compress_stats
+            stats["raw_size"] += raw_size
+            stats["compressed_size"] += compressed_size
+            stats["compress_time"] += cpu_time
+            if compressed_indices:
+                headers[0][COMPRESSED_BUFFERS_NAME] = compressed_indices
+        return buffers
+
+    def _compress_buffers(self, buffers: List, indices: List[int]) -> Tuple:
+        compressed_indices = []
+        raw_size = compressed_size = 0
+        start = time.thread_time()
+        for idx in indices:
+            buf = buffers[idx]
+            size = _get_size(buf)
+            try:
+                block = self._compressor.try_compress(buf)
+            except TypeError:  # pragma: no cover
+                # buffers not contiguous
+                block = None
+            raw_size += size
+            if block is None:
+                compressed_size += size
+                continue
+            buffers[idx] = block
+            compressed_indices.append(idx)
+            compressed_size += len(block)
+        cpu_time = time.thread_time() - start
+        return compressed_indices, raw_size, compressed_size, cpu_time
+
+    @staticmethod
+    def _decompress_buffers(buffers: List, indices: List[int]) -> float:
+        start = time.thread_time()
+        for idx in indices:
+            buffers[idx] = decompress_block(buffers[idx])
+        return time.thread_time() - start
+
+    def _is_small(self, buffers: List) -> bool:
+        size = 0
+        for buf in buffers:
+            if hasattr(buf, "__cuda_array_interface__"):
+                return False
+            size += _get_size(buf)
+            if size > self._coalesce_size:
+                return False
+        return True
+
+    async def _write_coalesced(self, buffers: List):
+        if self.writer.is_closing():
+            raise ConnectionResetError("Connection closed")
+        self._pending_buffers.extend(buffers)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop = asyncio.get_running_loop()
+            if self._coalesce_delay > 0:
+                loop.call_later(self._coalesce_delay, self._flush_pending)
+            else:
+                loop.call_soon(self._flush_pending)
+        drain_task = self._drain_task
+        if drain_task is not None:
+            # wait when former writes are not flushed into the socket
+            await asyncio.shield(drain_task)
+
+    def _flush_pending(self):
+        self._flush_scheduled = False
+        if not self._pending_buffers:
+            return
+        buffers, self._pending_buffers = self._pending_buffers, []
+        self.writer.write(b"".join(buffers))
+        if self._drain_task is None:
+            # drain once for all coalesced messages
+            self._drain_task = asyncio.create_task(self._drain())
+            self._drain_task.add_done_callback(_consume_task_error)
+
+    async def _drain(self):
+        try:
+            async with self._send_lock:
+                await self.writer.drain()
+        finally:
+            self._drain_task = None
+
     @implements(Channel.recv)
     async def recv(self):
         deserializer = AioDeserializer(self.reader)
         async with self._recv_lock:
             header = await deserializer.get_header()
             buffers = await read_buffers(header, self.reader)
+        if SHM_BUFFERS_NAME in header[0]:
+            if self._shm_attacher is None:
+                self._shm_attacher = SharedMemoryAttacher()
+            buffers = load_shm_buffers(header, buffers, self._shm_attacher)
+        if COMPRESSED_BUFFERS_NAME in header[0]:
+            indices = header[0].pop(COMPRESSED_BUFFERS_NAME)
+            if sum(_get_size(buffers[idx]) for idx in indices) >= (
+                DEFAULT_COMPRESS_OFFLOAD_SIZE
+            ):
+                cpu_time = await asyncio.to_thread(
+                    self._decompress_buffers, buffers, indices
+                )
+            else:
+                cpu_time = self._decompress_buffers(buffers, indices)
+            self._compress_stats["decompress_time"] += cpu_time
         return deserialize(header, buffers)
 
     @implements(Channel.close)
     async def close(self):
+        self._flush_pending()
+        if self._shm_pool is not None:
+            self._shm_pool.close()
+        if self._shm_attacher is not None:
+            self._shm_attacher.close()
         self.writer.close()
         try:
             await self.writer.wait_closed()
@@ -101,19 +351,34 @@ class SocketChannel(Channel):
         return self.writer.is_closing()
 
 
+def _parse_socket_config(config: dict) -> dict:
+    try:
+        return {"socket": config["socket"]}
+    except KeyError:
+        return dict()
+
+
 class _BaseSocketServer(Server, metaclass=ABCMeta):
-    __slots__ = "_aio_server", "_channels"
+    __slots__ = "_aio_server", "_channels", "_channel_config"
 
     def __init__(
         self,
         address: str,
         aio_server: AbstractServer,
         channel_handler: Callable[[Channel], Coroutine] = None,
+        channel_config: Dict = None,
     ):
         super().__init__(address, channel_handler)
         # asyncio.Server
         self._aio_server = aio_server
         self._channels = []
+        # config of socket channels, e.g., coalesce_size and coalesce_delay
+        self._channel_config = channel_config or dict()
+
+    @classmethod
+    @implements(Server.parse_config)
+    def parse_config(cls, config: dict) -> dict:
+        return _parse_socket_config(config)
 
     @implements(Server.start)
     async def start(self):
@@ -146,6 +411,7 @@ class _BaseSocketServer(Server, metaclass=ABCMeta):
             local_address=local_address,
             dest_address=dest_address,
             channel_type=self.channel_type,
+            **self._channel_config,
         )
         self._channels.append(channel)
         # handle over channel to some handlers
@@ -178,9 +444,15 @@ class SocketServer(_BaseSocketServer):
         port: int,
         aio_server: AbstractServer,
         channel_handler: Callable[[Channel], Coroutine] = None,
+        channel_config: Dict = None,
     ):
         address = f"{host}:{port}"
-        super().__init__(address, aio_server, channel_handler=channel_handler)
+        super().__init__(
+            address,
+            aio_server,
+            channel_handler=channel_handler,
+            channel_config=channel_config,
+        )
         self.host = host
         self.port = port
 
@@ -206,6 +478,7 @@ class SocketServer(_BaseSocketServer):
             host = config.pop("host")
             port = int(config.pop("port"))
         handle_channel = config.pop("handle_channel")
+        channel_config = config.pop("socket", None)
         if "start_serving" not in config:
             config["start_serving"] = False
 
@@ -228,7 +501,13 @@ class SocketServer(_BaseSocketServer):
             for sock in aio_server.sockets:
                 sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, True)
 
-        server = SocketServer(host, port, aio_server, channel_handler=handle_channel)
+        server = SocketServer(
+            host,
+            port,
+            aio_server,
+            channel_handler=handle_channel,
+            channel_config=channel_config,
+        )
         return server
 
 
@@ -238,6 +517,11 @@ class SocketClient(Client):
 
     scheme = SocketServer.scheme
 
+    @classmethod
+    @implements(Client.parse_config)
+    def parse_config(cls, config: dict) -> dict:
+        return _parse_socket_config(config)
+
     @staticmethod
     @implements(Client.connect)
     async def connect(
@@ -245,9 +529,15 @@ class SocketClient(Client):
     ) -> "Client":
         host, port = dest_address.split(":", 1)
         port = int(port)
+        kwargs = kwargs.copy()
+        channel_config = kwargs.pop("config", dict()).get("socket", dict())
         (reader, writer) = await asyncio.open_connection(host=host, port=port, **kwargs)
         channel = SocketChannel(
-            reader, writer, local_address=local_address, dest_address=dest_address
+            reader,
+            writer,
+            local_address=local_address,
+            dest_address=dest_address,
+            **channel_config,
         )
         return SocketClient(local_address, dest_address, channel)
 
@@ -272,9 +562,15 @@ class UnixSocketServer(_BaseSocketServer):
         aio_server: AbstractServer,
         path: str,
         channel_handler: Callable[[Channel], Coroutine] = None,
+        channel_config: Dict = None,
     ):
         address = f"{self.scheme}:///{process_index}"
-        super().__init__(address, aio_server, channel_handler=channel_handler)
+        super().__init__(
+            address,
+            aio_server,
+            channel_handler=channel_handler,
+            channel_config=channel_config,
+        )
         self.process_index = process_index
         self.path = path
 
@@ -297,6 +593,7 @@ class UnixSocketServer(_BaseSocketServer):
         else:
             process_index = config.pop("process_index")
         handle_channel = config.pop("handle_channel")
+        channel_config = config.pop("socket", None)
         path = config.pop("path", _gen_unix_socket_default_path(process_index))
 
         dirname = os.path.dirname(path)
@@ -320,7 +617,11 @@ class UnixSocketServer(_BaseSocketServer):
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, True)
 
         server = UnixSocketServer(
-            process_index, aio_server, path, channel_handler=handle_channel
+            process_index,
+            aio_server,
+            path,
+            channel_handler=handle_channel,
+            channel_config=channel_config,
         )
         return server
 
@@ -339,6 +640,11 @@ class UnixSocketClient(Client):
 
     scheme = UnixSocketServer.scheme
 
+    @classmethod
+    @implements(Client.parse_config)
+    def parse_config(cls, config: dict) -> dict:
+        return _parse_socket_config(config)
+
     @staticmethod
     @lru_cache(100)
     def _get_process_index(addr):
@@ -350,6 +656,8 @@ class UnixSocketClient(Client):
         dest_address: str, local_address: str = None, **kwargs
     ) -> "Client":
         process_index = UnixSocketClient._get_process_index(dest_address)
+        kwargs = kwargs.copy()
+        channel_config = kwargs.pop("config", dict()).get("socket", dict())
         path = kwargs.pop("path", _gen_unix_socket_default_path(process_index))
         try:
             (reader, writer) = await asyncio.open_unix_connection(path, **kwargs)
@@ -358,6 +666,11 @@ class UnixSocketClient(Client):
                 "Cannot connect unix socket due to file not exists"
             )
         channel = SocketChannel(
-            reader, writer, local_address=local_address, dest_address=dest_address
+            reader,
+            writer,
+            local_address=local_address,
+            dest_address=dest_address,
+            channel_type=ChannelType.ipc,
+            **channel_config,
         )
         return UnixSocketClient(local_address, dest_address, channel)
@@ -114,6 +114,144 @@ async def test_comm(server_type, config, con):
     assert server2.stopped
 
 
+@pytest.mark.parametrize("coalesce_size", [0, 1024])
+@pytest.mark.asyncio
+async def test_coalesced_socket_comm(coalesce_size):
+    socket_config = {"socket": {"coalesce_size": coalesce_size}}
+    n_messages = 50
+
+    async def echo(chan: SocketChannel):
+        for _ in range(n_messages):
+            await chan.send(await chan.recv())
+
+    server_port = get_next_port()
+    config = dict(host="127.0.0.1", port=server_port, handle_channel=echo)
+    config.update(SocketServer.parse_config(socket_config))
+    async with await SocketServer.create(config):
+        client = await SocketClient.connect(
+            f"127.0.0.1:{server_port}",
+            config=SocketClient.parse_config(socket_config),
+        )
+        # small messages and large ones are sent concurrently
+        messages = [
+            np.random.rand(1000) if i % 10 == 0 else f"message_{i}"
+            for i in range(n_messages)
+        ]
+        await asyncio.gather(*[client.send(message) for message in messages])
+        received = [await client.recv() for _ in range(n_messages)]
+
+        def sort_key(obj):
+            return obj if isinstance(obj, str) else str(obj[0])
+
+        for message, received_message in zip(
+            sorted(messages, key=sort_key), sorted(received, key=sort_key)
+        ):
+            if isinstance(message, str):
+                assert message == received_message
+            else:
+                np.testing.assert_array_equal(message, received_message)
+        await client.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="unix socket only")
+@pytest.mark.asyncio
+async def test_shared_memory_comm():
+    socket_config = {"socket": {"shm_threshold": 1024}}
+    data = np.random.rand(1000, 100)
+
+    async def echo(chan: SocketChannel):
+        for _ in range(3):
+            await chan.send(await chan.recv())
+
+    config = dict(process_index="1", handle_channel=echo)
+    config.update(UnixSocketServer.parse_config(socket_config))
+    async with await UnixSocketServer.create(config):
+        client = await UnixSocketClient.connect(
+            "unixsocket:///1", config=UnixSocketClient.parse_config(socket_config)
+        )
+        for _ in range(3):
+            await client.send(data)
+            np.testing.assert_array_equal(data, await client.recv())
+        # segments are reused between messages
+        assert 0 < client.channel._shm_pool.size < 2 * data.nbytes
+        await client.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="unix socket only")
+def test_shared_memory_release():
+    from ..shm import (
+        SharedMemoryAttacher,
+        SharedMemoryPool,
+        _deferred_segments,
+    )
+
+    pool = SharedMemoryPool()
+    attacher = SharedMemoryAttacher(max_attached_size=3 * 1024**2)
+    name1 = pool.put(b"1" * 100)
+    name2 = pool.put(b"2" * 100)
+    assert attacher.get(name1, 100) == b"1" * 100
+
+    # segments not received yet are released after content copied out
+    pool.close()
+    assert pool.size == 0
+    assert len(_deferred_segments) == 1
+    assert attacher.get(name2, 100) == b"2" * 100
+    SharedMemoryPool().close()
+    assert len(_deferred_segments) == 0
+    attacher.close()
+    assert attacher.attached_size == 0
+
+    # attached segments are limited by size
+    pool = SharedMemoryPool()
+    for _ in range(3):
+        name = pool.put(bytes(1024**2))
+        attacher.get(name, 1024**2)
+    # size of every segment is rounded to 2MB
+    assert attacher.attached_size == 2 * 1024**2
+    name = pool.put(bytes(4 * 1024**2))
+    attacher.get(name, 4 * 1024**2)
+    assert attacher.attached_size == 2 * 1024**2
+    attacher.close()
+    assert attacher.attached_size == 0
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_compressed_socket_comm():
+    pytest.importorskip("lz4")
+    socket_config = {"socket": {"compress_codec": "lz4", "compress_threshold": 1024}}
+    # large buffers are compressed in threads
+    compressible = np.zeros((2000, 100))
+    incompressible = np.random.randint(0, 256, 100 * 1024, dtype=np.uint8)
+    small = np.arange(10)
+
+    async def echo(chan: SocketChannel):
+        for _ in range(3):
+            await chan.send(await chan.recv())
+
+    server_port = get_next_port()
+    config = dict(host="127.0.0.1", port=server_port, handle_channel=echo)
+    config.update(SocketServer.parse_config(socket_config))
+    async with await SocketServer.create(config):
+        client = await SocketClient.connect(
+            f"127.0.0.1:{server_port}",
+            config=SocketClient.parse_config(socket_config),
+        )
+        for data in (compressible, incompressible, small):
+            await client.send(data)
+            np.testing.assert_array_equal(data, await client.recv())
+
+        stats = client.channel.compression_stats
+        # small buffers are skipped
+        assert stats["raw_size"] == compressible.nbytes + incompressible.nbytes
+        # incompressible buffers are sent as is
+        assert stats["compressed_size"] > incompressible.nbytes
+        assert stats["ratio"] < 1
+        assert stats["decompress_time"] >= 0
+        assert client.channel.info["compression_stats"] == stats
+        await client.close()
+
+
 def _wrap_test(server_started_event, conf, tp):
     async def _test():
         async def check_data(chan: SocketChannel):
@@ -15,12 +15,18 @@
 import asyncio
 import copy
 import logging
+import time
 from typing import Dict, Union
 
-from ...oscar.profiling import ProfilingData
+from ...oscar.profiling import (
+    ActorCallStats,
+    ProfilingData,
+    MARS_ENABLE_ACTOR_CALL_STATS,
+)
 from ...utils import Timer
 from ..errors import ServerClosed
 from .communication import Client
+from .communication.base import ChannelType
 from .message import _MessageBase, ResultMessage, ErrorMessage, DeserializeMessageFailed
 from .router import Router
 
@@ -30,16 +36,40 @@ logger = logging.getLogger(__name__)
 
 
 class ActorCaller:
-    __slots__ = "_client_to_message_futures", "_clients"
+    __slots__ = "_client_to_message_futures", "_clients", "_client_to_sending"
 
     def __init__(self):
         self._client_to_message_futures: Dict[
             Client, Dict[bytes, asyncio.Future]
         ] = dict()
         self._clients: Dict[Client, asyncio.Task] = dict()
+        # client -> number of messages being sent
+        self._client_to_sending: Dict[Client, int] = dict()
 
     async def get_client(self, router: Router, dest_address: str) -> Client:
-        client = await router.get_client(dest_address, from_who=self)
+        client = await self._get_client(router, dest_address, self)
+        n_channels = router.channels_per_address
+        if (
+            n_channels <= 1
+            or not self._client_to_sending.get(client)
+            or client.channel_type == ChannelType.local
+        ):
+            return client
+
+        # the default client is busy sending messages, try other clients
+        # to the address, thus messages are not blocked by large payloads
+        best_client = client
+        for idx in range(1, n_channels):
+            client = await self._get_client(router, dest_address, (self, idx))
+            n_sending = self._client_to_sending.get(client, 0)
+            if n_sending == 0:
+                return client
+            if n_sending < self._client_to_sending[best_client]:
+                best_client = client
+        return best_client
+
+    async def _get_client(self, router: Router, dest_address: str, from_who) -> Client:
+        client = await router.get_client(dest_address, from_who=from_who)
         if client not in self._clients:
             self._clients[client] = asyncio.create_task(self._listen(client))
             self._client_to_message_futures[client] = dict()
@@ -111,8 +141,11 @@ class ActorCaller:
         self._client_to_message_futures[client][message.message_id] = wait_response
 
         with Timer() as timer:
+            self._client_to_sending[client] = self._client_to_sending.get(client, 0) + 1
+            send_start = time.monotonic()
             try:
                 await client.send(message)
+                send_duration = time.monotonic() - send_start
             except ConnectionError:
                 try:
                     await client.close()
@@ -120,6 +153,12 @@ class ActorCaller:
                     # close failed, ignore it
                     pass
                 raise ServerClosed(f"Remote server {client.dest_address} closed")
+            finally:
+                n_sending = self._client_to_sending[client] - 1
+                if n_sending:
+                    self._client_to_sending[client] = n_sending
+                else:
+                    del self._client_to_sending[client]
 
             if not wait:
                 r = wait_response
@@ -127,6 +166,10 @@ class ActorCaller:
                 r = await wait_response
 
         ProfilingData.collect_actor_call(message, timer.duration)
+        if MARS_ENABLE_ACTOR_CALL_STATS:
+            ActorCallStats.collect_call(
+                message, send_duration, timer.duration if wait else None
+            )
         return r
 
     async def stop(self):
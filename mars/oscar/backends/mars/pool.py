@@ -28,7 +28,7 @@ import threading
 import uuid
 from dataclasses import dataclass
 from types import TracebackType
-from typing import List
+from typing import List, Optional
 
 from ....utils import (
     dataslots,
@@ -118,8 +118,24 @@ class SubpoolStatus:
     traceback: TracebackType = None
 
 
+@dataslots
+@dataclass
+class _StandbyProcess:
+    process: multiprocessing.Process
+    env: dict
+    command_queue: multiprocessing.Queue
+    status_queue: multiprocessing.Queue
+
+
 @_register_message_handler
 class MainActorPool(MainActorPoolBase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # idle processes with modules imported, promoted to sub pools
+        # when recovering dead ones
+        self._standby_processes: List[_StandbyProcess] = []
+        self._replenish_standby_task: Optional[asyncio.Task] = None
+
     @classmethod
     def get_external_addresses(
         cls,
@@ -205,6 +221,69 @@ class MainActorPool(MainActorPoolBase):
             create_pool_task = loop.run_in_executor(executor, start_pool_in_process)
             return await create_pool_task
 
+    @classmethod
+    async def start_standby_process(
+        cls, modules: List[str], env: dict = None, start_method: str = None
+    ) -> _StandbyProcess:
+        def start_standby_in_process():
+            ctx = multiprocessing.get_context(method=start_method)
+            command_queue = ctx.Queue()
+            status_queue = ctx.Queue()
+
+            with _suspend_init_main():
+                process = ctx.Process(
+                    target=cls._run_standby_process,
+                    args=(modules, env, command_queue, status_queue),
+                    name="MarsStandbyActorPool",
+                )
+                process.daemon = True
+                process.start()
+
+            # wait for predefined modules to be imported
+            status_queue.get()
+            return _StandbyProcess(process, env, command_queue, status_queue)
+
+        _patch_spawn_get_preparation_data()
+        return await asyncio.to_thread(start_standby_in_process)
+
+    @classmethod
+    def _run_standby_process(
+        cls,
+        modules: List[str],
+        env: dict,
+        command_queue: multiprocessing.Queue,
+        status_queue: multiprocessing.Queue,
+    ):
+        ensure_coverage()
+
+        # environments like visible devices must be set before imports
+        if env:
+            os.environ.update(env)
+        for mod in modules:
+            __import__(mod, globals(), locals(), [])
+        status_queue.put(None)
+
+        command = command_queue.get()
+        if command is None:
+            return
+        actor_config, process_index = command
+        multiprocessing.current_process().name = f"MarsActorPool{process_index}"
+        cls._start_sub_pool(actor_config, process_index, status_queue)
+
+    @classmethod
+    async def _promote_standby_process(
+        cls,
+        standby: _StandbyProcess,
+        actor_pool_config: ActorPoolConfig,
+        process_index: int,
+    ):
+        def promote():
+            standby.command_queue.put((actor_pool_config, process_index))
+            # wait for sub actor pool to finish starting
+            return standby.process, standby.status_queue.get()
+
+        return await asyncio.to_thread(promote)
+
     @classmethod
     async def wait_sub_pools_ready(cls, create_pool_tasks: List[asyncio.Task]):
         processes = []
@@ -318,14 +397,83 @@ class MainActorPool(MainActorPoolBase):
                 raise
             return process.is_alive()
 
+    def _get_standby_config(self):
+        modules = []
+        standby_env = None
+        for process_index in self._config.get_process_indexes()[1:]:
+            pool_config = self._config.get_pool_config(process_index)
+            for mod in pool_config["modules"] or []:
+                if mod not in modules:
+                    modules.append(mod)
+            env = pool_config["env"] or dict()
+            if standby_env is None and env.get("CUDA_VISIBLE_DEVICES", "-1") == "-1":
+                # standby processes only replace sub pools without devices
+                standby_env = env
+        return modules, standby_env or dict()
+
+    def _pop_standby_process(self, process_index: int) -> Optional[_StandbyProcess]:
+        env = self._config.get_pool_config(process_index)["env"] or dict()
+        while self._standby_processes:
+            standby = self._standby_processes[0]
+            if standby.env != env:
+                return None
+            self._standby_processes.pop(0)
+            if standby.process.is_alive():
+                return standby
+        return None
+
+    async def _replenish_standby_processes(self):
+        modules, env = self._get_standby_config()
+        while (
+            not self._stopped.is_set()
+            and len(self._standby_processes) < self._n_standby_process
+        ):
+            standby = await self.start_standby_process(modules, env, "spawn")
+            if self._stopped.is_set():
+                await self.kill_sub_pool(standby.process, force=True)
+                break
+            self._standby_processes.append(standby)
+
+    def _ensure_standby_processes(self):
+        if not self._n_standby_process or (
+            self._replenish_standby_task is not None
+            and not self._replenish_standby_task.done()
+        ):
+            return
+        self._replenish_standby_task = asyncio.create_task(
+            self._replenish_standby_processes()
+        )
+
+    async def _stop_standby_processes(self):
+        if self._replenish_standby_task is not None:
+            self._replenish_standby_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._replenish_standby_task
+            self._replenish_standby_task = None
+        standby_processes, self._standby_processes = self._standby_processes, []
+        await asyncio.gather(
+            *[
+                self.kill_sub_pool(standby.process, force=True)
+                for standby in standby_processes
+            ]
+        )
+
     async def recover_sub_pool(self, address: str):
         process_index = self._config.get_process_index(address)
         # process dead, restart it
-        # remember always use spawn to recover sub pool
-        task = asyncio.create_task(
-            self.start_sub_pool(self._config, process_index, "spawn")
-        )
+        standby = self._pop_standby_process(process_index)
+        if standby is not None:
+            # promote a standby process whose modules are already imported
+            task = asyncio.create_task(
+                self._promote_standby_process(standby, self._config, process_index)
+            )
+        else:
+            # remember always use spawn to recover sub pool
+            task = asyncio.create_task(
+                self.start_sub_pool(self._config, process_index, "spawn")
+            )
         self.sub_processes[address] = (await self.wait_sub_pools_ready([task]))[0][0]
+        self._ensure_standby_processes()
 
         if self._auto_recover == "actor":
             # need to recover all created actors
@@ -336,6 +484,11 @@ class MainActorPool(MainActorPoolBase):
     async def start(self):
         await super().start()
         await self.start_monitor()
+        self._ensure_standby_processes()
+
+    async def stop(self):
+        await self._stop_standby_processes()
+        await super().stop()
 
 
 @_register_message_handler
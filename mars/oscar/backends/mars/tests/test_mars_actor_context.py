@@ -25,7 +25,7 @@ import pytest
 
 from ..... import oscar as mo
 from .....oscar.core import ActorRef, LocalActorRef
-from ....backends.allocate_strategy import RandomSubPool
+from ....backends.allocate_strategy import MainPool, ProcessIndex, RandomSubPool
 from ....debug import set_debug_options, get_debug_options, DebugOptions
 from ...router import Router
 
@@ -95,6 +95,13 @@ class DummyActor(mo.Actor):
         ), f"Expect type of actor ref is {tp}, but got {actor_ref} instead."
         return await getattr(actor_ref, method)(*args)
 
+    async def send_batch(self, calls):
+        batch = mo.ActorCallBatch()
+        for address, uid, method, args in calls:
+            actor_ref = await mo.actor_ref(uid, address=address)
+            batch.add(actor_ref, method, *args)
+        return await batch.send()
+
     async def tell(self, uid, method, *args):
         actor_ref = await mo.actor_ref(uid, address=self.address)
         await getattr(actor_ref, method).tell(*args)
@@ -407,6 +414,53 @@ async def test_mars_batch_method(actor_pool):
         await ref1.add_ret.batch(ref1.add_ret.delay(1), ref1.add.delay(2))
 
 
+@pytest.mark.asyncio
+async def test_mars_actor_call_batch(actor_pool):
+    refs = [
+        await mo.create_actor(
+            DummyActor,
+            i,
+            address=actor_pool.external_address,
+            allocate_strategy=strategy,
+        )
+        for i, strategy in enumerate(
+            [ProcessIndex(1), ProcessIndex(1), ProcessIndex(2), MainPool()]
+        )
+    ]
+    batch = mo.ActorCallBatch()
+    batch.add(refs[0], "add", 10)
+    batch.add(refs[1], "get_value")
+    batch.add_batch(refs[2], "add_ret", [(1,), (2,)])
+    batch.add(refs[3], "get_value")
+    batch.add(refs[0], "get_value")
+    assert len(batch) == 5
+    assert await batch.send() == [10, 1, [5, 5], 3, 10]
+    assert await mo.ActorCallBatch().send() == []
+
+    # calls to actors in sub pools are forwarded by the main pool
+    batch = mo.ActorCallBatch()
+    batch.add(ActorRef(actor_pool.external_address, refs[0].uid), "get_value")
+    batch.add(refs[3], "add", 1)
+    assert await batch.send() == [10, 4]
+
+    batch = mo.ActorCallBatch()
+    batch.add(refs[0], "add", 1)
+    batch.add(refs[1], "add", "invalid")
+    batch.add(refs[0], "add", 1)
+    with pytest.raises(TypeError):
+        await batch.send()
+    # calls after the failed one are skipped
+    assert await refs[0].get_value() == 11
+
+    # calls to actors in the same process are made directly
+    assert await refs[1].send_batch(
+        [
+            (refs[0].address, refs[0].uid, "add", (1,)),
+            (refs[2].address, refs[2].uid, "get_value", ()),
+        ]
+    ) == [12, 2]
+
+
 @pytest.mark.asyncio
 async def test_gather_exception(actor_pool):
     try:
@@ -684,6 +684,46 @@ async def test_auto_recover(auto_recover):
                 await ctx.has_actor(actor_ref)
 
 
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="skip under Windows")
+async def test_standby_process_recover():
+    start_method = os.environ.get("POOL_START_METHOD", "forkserver")
+    pool = await create_actor_pool(
+        "127.0.0.1",
+        pool_cls=MainActorPool,
+        n_process=2,
+        subprocess_start_method=start_method,
+        auto_recover="actor",
+        n_standby_process=1,
+    )
+
+    async with pool:
+        await pool._replenish_standby_task
+        assert len(pool._standby_processes) == 1
+        standby_process = pool._standby_processes[0].process
+
+        ctx = get_context()
+        actor_ref = await ctx.create_actor(
+            TestActor, address=pool.external_address, allocate_strategy=ProcessIndex(1)
+        )
+        await ctx.kill_actor(actor_ref)
+        await ctx.wait_actor_pool_recovered(actor_ref.address, pool.external_address)
+
+        # standby process promoted to the recovered sub pool
+        assert pool.sub_processes[actor_ref.address] is standby_process
+        assert await ctx.has_actor(actor_ref)
+        assert await actor_ref.add(1) == 1
+
+        # standby processes replenished
+        await pool._replenish_standby_task
+        assert len(pool._standby_processes) == 1
+        assert pool._standby_processes[0].process is not standby_process
+        new_standby_process = pool._standby_processes[0].process
+
+    assert not pool._standby_processes
+    assert not new_standby_process.is_alive()
+
+
 @pytest.mark.parametrize(
     "exception_config",
     [
@@ -20,6 +20,7 @@ import logging
 import multiprocessing
 import os
 import threading
+import time
 import traceback
 from abc import ABC, ABCMeta, abstractmethod
 from typing import Dict, List, Type, TypeVar, Coroutine, Callable, Union, Optional
@@ -28,7 +29,7 @@ from ...core.entrypoints import init_extension_entrypoints
 from ...metrics import init_metrics
 from ...utils import implements, to_binary
 from ...utils import lazy_import, register_asyncio_task_timeout_detector, TypeDispatcher
-from ..api import Actor
+from ..api import Actor, BATCH_DISPATCHER_UID
 from ..core import ActorRef, register_local_pool
 from ..debug import record_message_trace, debug_async_timeout
 from ..errors import (
@@ -38,6 +39,12 @@ from ..errors import (
     CannotCancelTask,
     SendMessageFailed,
 )
+from ..profiling import (
+    ActorCallStats,
+    MARS_ENABLE_ACTOR_CALL_STATS,
+    actor_lock_acquired_time,
+    message_received_time,
+)
 from ..utils import create_actor_ref
 from .allocate_strategy import allocated_type, AddressSpecified
 from .communication import Channel, Server, get_server_type, gen_local_address
@@ -505,6 +512,9 @@ class AbstractActorPool(ABC):
                     # close failed, ignore
                     pass
                 return
+            if MARS_ENABLE_ACTOR_CALL_STATS:
+                # tasks created below inherit the time from current context
+                message_received_time.set(time.monotonic())
             asyncio.create_task(self.process_message(message, channel))
             # delete to release the reference of message
             del message
@@ -588,16 +598,71 @@ class ActorPoolBase(AbstractActorPool, metaclass=ABCMeta):
             processor.result = result
         return processor.result
 
+    async def _dispatch_batch(self, message: SendMessage) -> ResultMessageType:
+        """
+        Dispatch calls packed by `ActorCallBatch` to actors in current pool
+        one after another, results are returned in order, or the error of
+        the first failed call.
+        """
+        _method, _call_method, (calls,), _kwargs = message.content
+
+        async def _send_calls():
+            results = []
+            for uid, content in calls:
+                result = await self.send(
+                    SendMessage(
+                        new_message_id(),
+                        ActorRef(self.external_address, uid),
+                        content,
+                        protocol=message.protocol,
+                        message_trace=message.message_trace,
+                    )
+                )
+                if isinstance(result, ErrorMessage):
+                    return result
+                results.append(result.result)
+            return results
+
+        result = await self._run_coro(message.message_id, _send_calls())
+        if isinstance(result, ErrorMessage):
+            result.message_id = message.message_id
+            return result
+        return ResultMessage(
+            message.message_id,
+            result,
+            protocol=message.protocol,
+            profiling_context=message.profiling_context,
+        )
+
     @implements(AbstractActorPool.send)
     async def send(self, message: SendMessage) -> ResultMessageType:
+        if message.actor_ref.uid == BATCH_DISPATCHER_UID:
+            return await self._dispatch_batch(message)
         with _ErrorProcessor(
             self.external_address, message.message_id, message.protocol
         ) as processor, record_message_trace(message):
             actor_id = message.actor_ref.uid
             if actor_id not in self._actors:
                 raise ActorNotExist(f"Actor {actor_id} does not exist")
-            coro = self._actors[actor_id].__on_receive__(message.content)
-            result = await self._run_coro(message.message_id, coro)
+            if MARS_ENABLE_ACTOR_CALL_STATS:
+                # keep acquired time of current message apart from
+                # nested calls sharing the context
+                lock_acquired_holder = []
+                token = actor_lock_acquired_time.set(lock_acquired_holder)
+                try:
+                    coro = self._actors[actor_id].__on_receive__(message.content)
+                    result = await self._run_coro(message.message_id, coro)
+                finally:
+                    actor_lock_acquired_time.reset(token)
+                ActorCallStats.collect_handle(
+                    message,
+                    message_received_time.get(),
+                    lock_acquired_holder[0] if lock_acquired_holder else None,
+                    time.monotonic(),
+                )
+            else:
+                coro = self._actors[actor_id].__on_receive__(message.content)
+                result = await self._run_coro(message.message_id, coro)
             processor.result = ResultMessage(
                 message.message_id,
                 result,
@@ -861,6 +926,7 @@ class MainActorPoolBase(ActorPoolBase):
         "_on_process_down",
         "_on_process_recover",
         "_recover_events",
+        "_n_standby_process",
     )
 
     def __init__(
@@ -877,6 +943,7 @@ class MainActorPoolBase(ActorPoolBase):
         auto_recover: Union[str, bool] = "actor",
         on_process_down: Callable[[MainActorPoolType, str], None] = None,
         on_process_recover: Callable[[MainActorPoolType, str], None] = None,
+        n_standby_process: int = 0,
     ):
         super().__init__(
             process_index,
@@ -889,6 +956,8 @@ class MainActorPoolBase(ActorPoolBase):
             servers,
         )
         self._subprocess_start_method = subprocess_start_method
+        # number of idle processes kept to replace dead sub pools
+        self._n_standby_process = n_standby_process or 0
 
         # auto recovering
         self._auto_recover = auto_recover
@@ -1012,7 +1081,10 @@ class MainActorPoolBase(ActorPoolBase):
 
     @implements(AbstractActorPool.send)
     async def send(self, message: SendMessage) -> ResultMessageType:
-        if message.actor_ref.uid in self._actors:
+        if (
+            message.actor_ref.uid in self._actors
+            or message.actor_ref.uid == BATCH_DISPATCHER_UID
+        ):
             return await super().send(message)
         actor_ref_message = ActorRefMessage(
             message.message_id, message.actor_ref, protocol=message.protocol
@@ -1156,6 +1228,7 @@ class MainActorPoolBase(ActorPoolBase):
         kw["auto_recover"] = config.pop("auto_recover", "actor")
         kw["on_process_down"] = config.pop("on_process_down", None)
         kw["on_process_recover"] = config.pop("on_process_recover", None)
+        kw["n_standby_process"] = config.pop("n_standby_process", 0)
         kw = AbstractActorPool._parse_config(config, kw)
         return kw
 
@@ -1408,6 +1481,7 @@ async def create_actor_pool(
     on_process_down: Callable[[MainActorPoolType, str], None] = None,
     on_process_recover: Callable[[MainActorPoolType, str], None] = None,
     extra_conf: dict = None,
+    n_standby_process: int = 0,
     **kwargs,
 ) -> MainActorPoolType:
     from ... import tensor, dataframe, learn, remote
@@ -1508,6 +1582,7 @@ async def create_actor_pool(
             "auto_recover": auto_recover,
             "on_process_down": on_process_down,
             "on_process_recover": on_process_recover,
+            "n_standby_process": n_standby_process,
         }
     )
     await pool.start()
@@ -99,6 +99,10 @@ class Router:
         if self._curr_external_addresses:
             return self._curr_external_addresses[0]
 
+    @property
+    def channels_per_address(self) -> int:
+        return self._comm_config.get("channels_per_address") or 1
+
     def get_internal_address(self, external_address: str) -> str:
         if external_address in self._curr_external_addresses:
             # local address, use dummy address
@@ -487,11 +487,13 @@ cdef class _BaseActor:
             Message shall be (method_name,) + args + (kwargs,)
         """
         from .debug import debug_async_timeout
+        from .profiling import mark_actor_lock_acquired
         try:
             method, call_method, args, kwargs = message
             if call_method == CALL_METHOD_DEFAULT:
                 func = getattr(self, method)
                 async with self._lock:
+                    mark_actor_lock_acquired()
                     with debug_async_timeout('actor_lock_timeout',
                                              "Method %s of actor %s hold lock timeout.",
                                              method, self.uid):
@@ -501,6 +503,7 @@ cdef class _BaseActor:
             elif call_method == CALL_METHOD_BATCH:
                 func = getattr(self, method)
                 async with self._lock:
+                    mark_actor_lock_acquired()
                     with debug_async_timeout('actor_lock_timeout',
                                              "Batch method %s of actor %s hold lock timeout, batch size %s.",
                                              method, self.uid, len(args)):
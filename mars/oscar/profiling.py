@@ -14,20 +14,27 @@
 
 import os
 import asyncio
+import bisect
+import contextvars
 import copy
 import json
 import heapq
 import logging
 import operator
-from collections import Counter
+import time
+from collections import Counter, OrderedDict
 from collections.abc import Mapping
+from typing import Dict, List, Optional, Set, Tuple
+
 from .backends.message import SendMessage, TellMessage
+from ..metrics import Metrics
 from ..typing import BandType
 
 
 logger = logging.getLogger(__name__)
 
 MARS_ENABLE_PROFILING = int(os.environ.get("MARS_ENABLE_PROFILING", 0))
+MARS_ENABLE_ACTOR_CALL_STATS = int(os.environ.get("MARS_ENABLE_ACTOR_CALL_STATS", 1))
 
 
 class _ProfilingOptionDescriptor:
@@ -291,3 +298,205 @@ class _ProfilingData:
 
 
 ProfilingData = _ProfilingData()
+
+
+# upper bounds of buckets of actor call latencies in seconds
+ACTOR_CALL_LATENCY_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    float("inf"),
+)
+ACTOR_CALL_REPORT_QUANTILES = (0.5, 0.99)
+
+# time when messages are received by actor pools
+message_received_time = contextvars.ContextVar("message_received_time", default=None)
+# holders of time when actor locks are acquired when handling messages,
+# one holder is created per message handled by actor pools
+actor_lock_acquired_time = contextvars.ContextVar(
+    "actor_lock_acquired_time", default=None
+)
+
+
+def mark_actor_lock_acquired():
+    holder = actor_lock_acquired_time.get()
+    # calls of local actors run in the context of callers, thus only
+    # the first acquisition belongs to the message handled by the pool
+    if holder is not None and not holder:
+        holder.append(time.monotonic())
+
+
+class _LatencyHistogram:
+    __slots__ = "counts", "count", "sum"
+
+    def __init__(self):
+        self.counts = [0] * len(ACTOR_CALL_LATENCY_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def record(self, value: float):
+        self.counts[bisect.bisect_left(ACTOR_CALL_LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """
+        Upper bound of the bucket where the quantile lies in.
+        """
+        rank = q * self.count
+        accum = 0
+        for bound, count in zip(ACTOR_CALL_LATENCY_BUCKETS, self.counts):
+            accum += count
+            if accum >= rank:
+                return bound
+        return ACTOR_CALL_LATENCY_BUCKETS[-1]  # pragma: no cover
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(zip(ACTOR_CALL_LATENCY_BUCKETS, self.counts)),
+        }
+
+
+class _ActorCallStats:
+    """
+    Always-on latency histograms of actor calls in current process,
+    keyed by actor uid, method name and phase of calls. Phases are
+
+    * send: time spent on serializing and writing messages by callers
+    * call: round trip time of calls observed by callers
+    * mailbox: time between messages received by actor pools and
+      handling started, including waiting for actor locks
+    * handler: time spent in actor methods
+
+    Callers and callees of calls usually lie in different processes,
+    network time can be estimated by subtracting other phases from
+    round trip time. At most `max_keys` histograms are kept, least
+    recently updated ones are evicted.
+    """
+
+    phases = ("send", "call", "mailbox", "handler")
+
+    def __init__(self, report_interval: float = 10.0, max_keys: int = 1024):
+        self._report_interval = report_interval
+        self._max_keys = max_keys
+        self._last_report_time = time.monotonic()
+        # (uid, method, phase) -> histogram, in order of updates
+        self._histograms: Dict[Tuple[str, str, str], _LatencyHistogram] = OrderedDict()
+        # keys of histograms updated since last report
+        self._updated_keys: Set[Tuple[str, str, str]] = set()
+        self._latency_gauge = None
+        self._total_time_gauge = None
+
+    @staticmethod
+    def _get_key(message) -> Optional[Tuple[str, str]]:
+        message_type = type(message)
+        if message_type is not SendMessage and message_type is not TellMessage:
+            return None
+        uid = message.actor_ref.uid
+        if isinstance(uid, bytes):
+            # generated uids are random bytes
+            uid = uid.decode("utf-8", errors="backslashreplace")
+        return uid, message.content[0]
+
+    def _record(self, uid: str, method: str, phase: str, duration: float):
+        key = (uid, method, phase)
+        try:
+            histogram = self._histograms[key]
+            self._histograms.move_to_end(key)
+        except KeyError:
+            histogram = self._histograms[key] = _LatencyHistogram()
+            if len(self._histograms) > self._max_keys:
+                evicted_key, _ = self._histograms.popitem(last=False)
+                self._updated_keys.discard(evicted_key)
+        histogram.record(duration)
+        self._updated_keys.add(key)
+
+    def collect_call(self, message, send_duration: float, duration: float = None):
+        key = self._get_key(message)
+        if key is None:
+            return
+        self._record(*key, "send", send_duration)
+        if duration is not None:
+            self._record(*key, "call", duration)
+        self._maybe_report()
+
+    def collect_handle(
+        self,
+        message,
+        received_time: Optional[float],
+        acquired_time: Optional[float],
+        finished_time: float,
+    ):
+        key = self._get_key(message)
+        if key is None or received_time is None:
+            return
+        acquired_time = acquired_time or received_time
+        self._record(*key, "mailbox", acquired_time - received_time)
+        self._record(*key, "handler", finished_time - acquired_time)
+        self._maybe_report()
+
+    def get_histograms(self) -> Dict[str, Dict[str, dict]]:
+        result = dict()
+        for (uid, method, phase), histogram in self._histograms.items():
+            result.setdefault(f"{uid}.{method}", dict())[phase] = histogram.to_dict()
+        return result
+
+    def get_hot_actors(self, top_n: int = 10, phase: str = "handler") -> List:
+        """
+        Rank actors by total time spent in the phase, returns
+        a list of (actor uid, total seconds, number of calls).
+        """
+        actor_stats = dict()
+        for (uid, _method, key_phase), histogram in self._histograms.items():
+            if key_phase != phase:
+                continue
+            total, count = actor_stats.get(uid, (0.0, 0))
+            actor_stats[uid] = (total + histogram.sum, count + histogram.count)
+        hot_actors = heapq.nlargest(top_n, actor_stats.items(), key=lambda it: it[1][0])
+        return [(uid, total, count) for uid, (total, count) in hot_actors]
+
+    def _maybe_report(self):
+        now = time.monotonic()
+        if now - self._last_report_time >= self._report_interval:
+            self._last_report_time = now
+            self.report()
+
+    def report(self):
+        if self._latency_gauge is None:
+            self._latency_gauge = Metrics.gauge(
+                "mars.actor_call.latency_secs",
+                "Quantiles of latencies of actor calls in different phases.",
+                ("actor", "method", "phase", "quantile"),
+            )
+            self._total_time_gauge = Metrics.gauge(
+                "mars.actor_call.total_time_secs",
+                "Total time of actor calls in different phases.",
+                ("actor", "method", "phase"),
+            )
+        updated_keys, self._updated_keys = self._updated_keys, set()
+        for key in updated_keys:
+            uid, method, phase = key
+            histogram = self._histograms[key]
+            tags = {"actor": uid, "method": method, "phase": phase}
+            self._total_time_gauge.record(histogram.sum, tags)
+            for q in ACTOR_CALL_REPORT_QUANTILES:
+                self._latency_gauge.record(
+                    histogram.quantile(q), dict(tags, quantile=str(q))
+                )
+
+    def clear(self):
+        self._histograms.clear()
+        self._updated_keys.clear()
+
+
+ActorCallStats = _ActorCallStats()
@@ -82,3 +82,70 @@ async def test_send_when_close(fake_get_client):
 
     with pytest.raises(ServerClosed):
         await futures[1]
+
+
+@pytest.mark.asyncio
+@mock.patch.object(Router, "get_client")
+async def test_multiple_channels(fake_get_client):
+    class FakeClient:
+        def __init__(self):
+            self.closed = False
+            self.dest_address = "test"
+            self.channel_type = None
+            self.sent_messages = []
+            self.send_event = asyncio.Event()
+            self.send_event.set()
+
+        async def send(self, message):
+            await self.send_event.wait()
+            self.sent_messages.append(message)
+
+        async def recv(self, *args, **kwargs):
+            await asyncio.sleep(3600)
+
+        async def close(self):
+            self.closed = True
+
+    clients = dict()
+
+    def get_client(dest_address, from_who=None):
+        if from_who not in clients:
+            clients[from_who] = FakeClient()
+        return clients[from_who]
+
+    fake_get_client.side_effect = get_client
+
+    class FakeMessage:
+        def __init__(self, id_num):
+            self.message_id = id_num
+
+    caller = ActorCaller()
+    router = Router(
+        external_addresses=["test1"],
+        local_address="test2",
+        comm_config={"channels_per_address": 2},
+    )
+
+    # messages go to the default client when it is idle
+    for index in range(3):
+        await caller.call(router, "test1", FakeMessage(index), wait=False)
+    assert len(clients) == 1
+    default_client = clients[caller]
+    assert len(default_client.sent_messages) == 3
+
+    # the default client is blocked by a large message,
+    # other messages are sent via another client
+    default_client.send_event.clear()
+    blocked_task = asyncio.create_task(
+        caller.call(router, "test1", FakeMessage(3), wait=False)
+    )
+    await asyncio.sleep(0)
+    await caller.call(router, "test1", FakeMessage(4), wait=False)
+    await caller.call(router, "test1", FakeMessage(5), wait=False)
+    assert len(clients) == 2
+    assert [m.message_id for m in clients[caller, 1].sent_messages] == [4, 5]
+
+    default_client.send_event.set()
+    await blocked_task
+    assert default_client.sent_messages[-1].message_id == 3
+    caller.cancel_tasks()
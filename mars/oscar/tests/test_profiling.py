@@ -22,8 +22,11 @@ from ..profiling import (
     ProfilingDataOperator,
     DummyOperator,
     _ProfilingOptions,
+    _ActorCallStats,
     _CallStats,
     _SubtaskStats,
+    actor_lock_acquired_time,
+    mark_actor_lock_acquired,
 )
 from ..backends.message import SendMessage
 from ...tests.core import check_dict_structure_same, mock
@@ -174,3 +177,74 @@ def test_collect():
     assert list(d["slow_subtasks"].values()) == list(
         reversed(range(counter - 10, counter))
     )
+
+
+def test_actor_call_stats():
+    from ..core import ActorRef
+
+    stats = _ActorCallStats(report_interval=0)
+    fake_actor_ref1 = ActorRef("def", b"uid1")
+    fake_actor_ref2 = ActorRef("def", "uid2")
+    for i in range(10):
+        fake_message = SendMessage(b"abc", fake_actor_ref1, ["method1", 0, (i,), {}])
+        stats.collect_call(fake_message, 0.0002, 0.02)
+        stats.collect_handle(fake_message, 1.0, 1.003, 1.013)
+    fake_message = SendMessage(b"abc", fake_actor_ref2, ["method2", 0, (), {}])
+    stats.collect_call(fake_message, 0.0002)
+    # lock acquired time missing
+    stats.collect_handle(fake_message, 1.0, None, 1.5)
+    # messages not received by pools
+    stats.collect_handle(fake_message, None, None, 1.0)
+
+    histograms = stats.get_histograms()
+    assert set(histograms["uid1.method1"]) == set(_ActorCallStats.phases)
+    assert set(histograms["uid2.method2"]) == {"send", "mailbox", "handler"}
+    mailbox = histograms["uid1.method1"]["mailbox"]
+    assert mailbox["count"] == 10
+    assert mailbox["sum"] == pytest.approx(0.03)
+    assert mailbox["buckets"][0.005] == 10
+    assert histograms["uid2.method2"]["mailbox"]["sum"] == 0
+    assert histograms["uid2.method2"]["handler"]["buckets"][0.5] == 1
+
+    hot_actors = stats.get_hot_actors()
+    assert [uid for uid, _, _ in hot_actors] == ["uid2", "uid1"]
+    assert hot_actors[1][1:] == (pytest.approx(0.1), 10)
+    assert [uid for uid, _, _ in stats.get_hot_actors(1, phase="mailbox")] == ["uid1"]
+
+    stats.clear()
+    assert stats.get_histograms() == dict()
+
+    # least recently updated histograms are evicted
+    stats = _ActorCallStats(report_interval=0, max_keys=2)
+    stats.collect_call(
+        SendMessage(b"abc", fake_actor_ref1, ["method1", 0, (), {}]), 0.0002
+    )
+    stats.collect_call(
+        SendMessage(b"abc", fake_actor_ref2, ["method2", 0, (), {}]), 0.0002, 0.02
+    )
+    assert set(stats.get_histograms()) == {"uid2.method2"}
+
+    # generated uids are not valid utf-8
+    stats.collect_call(
+        SendMessage(b"abc", ActorRef("def", b"\x8buid3"), ["method3", 0, (), {}]),
+        0.0002,
+    )
+    assert "\\x8buid3.method3" in stats.get_histograms()
+
+
+def test_mark_actor_lock_acquired():
+    holder = []
+    token = actor_lock_acquired_time.set(holder)
+    try:
+        mark_actor_lock_acquired()
+        assert len(holder) == 1
+        acquired_time = holder[0]
+        # acquisitions of nested local calls are ignored
+        mark_actor_lock_acquired()
+        assert holder == [acquired_time]
+    finally:
+        actor_lock_acquired_time.reset(token)
+
+    # no effects out of messages handled by pools
+    mark_actor_lock_acquired()
+    assert actor_lock_acquired_time.get() is None
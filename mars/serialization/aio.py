@@ -35,11 +35,14 @@ class AioSerializer:
         self._obj = obj
         self._compress = compress
 
-    async def _get_buffers(self):
-        headers, buffers = await serialize_with_spawn(
+    async def _serialize(self):
+        return await serialize_with_spawn(
             self._obj, spawn_threshold=DEFAULT_SPAWN_THRESHOLD
         )
 
+    async def _get_buffers(self):
+        headers, buffers = await self._serialize()
+
         def _is_cuda_buffer(buf: Union["rmm.DeviceBuffer", BinaryIO]):
             return hasattr(buf, "__cuda_array_interface__")
 
@@ -117,6 +120,9 @@ class AioDeserializer:
         buffer_sizes = header[0].pop(BUFFER_SIZES_NAME)
         # get buffers
         buffers = [await self._readexactly(size) for size in buffer_sizes]
+        return await self._deserialize(header, buffers)
+
+    async def _deserialize(self, header: tuple, buffers: list):
         # get num of objs
         num_objs = header[0].get("_N", 0)
 
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import asyncio
+import contextvars
 import logging
 from collections import defaultdict
 from functools import lru_cache
@@ -32,6 +33,10 @@ from .meta import MetaAPI, WorkerMetaAPI
 
 logger = logging.getLogger(__name__)
 
+# session id and key of running operand, kept in context variables
+# as operands in one subtask may be executed concurrently
+_running_operand = contextvars.ContextVar("running_operand", default=(None, None))
+
 
 class ThreadedServiceContext(Context):
     _cluster_api: ClusterAPI
@@ -61,9 +66,6 @@ class ThreadedServiceContext(Context):
         # can get the right isolation
         new_isolation(loop=self._loop, threaded=False)
 
-        self._running_session_id = None
-        self._running_op_key = None
-
         # APIs
         self._cluster_api = None
         self._session_api = None
@@ -267,18 +269,16 @@ class ThreadedServiceContext(Context):
         )
 
     def set_running_operand_key(self, session_id: str, op_key: str):
-        self._running_session_id = session_id
-        self._running_op_key = op_key
+        _running_operand.set((session_id, op_key))
 
     def set_progress(self, progress: float):
-        if (
-            self._running_op_key is None or self._subtask_api is None
-        ):  # pragma: no cover
+        session_id, op_key = _running_operand.get()
+        if op_key is None or self._subtask_api is None:  # pragma: no cover
             return
         return self._call(
             self._subtask_api.set_running_operand_progress(
-                session_id=self._running_session_id,
-                op_key=self._running_op_key,
+                session_id=session_id,
+                op_key=op_key,
                 slot_address=self.local_address,
                 progress=progress,
             )
@@ -14,3 +14,4 @@
 
 from .base import AbstractMetaStore, get_meta_store
 from .dictionary import DictMetaStore
+from .sqlite import SqliteMetaStore
@@ -50,6 +50,12 @@ class AbstractMetaStore(ABC):
             kwargs to create a meta store.
         """
 
+    async def destroy(self):
+        """
+        Destroy the meta store and release resources it holds.
+        This is called when the session is destroyed.
+        """
+
     @abstractmethod
     async def set_meta(self, object_id: str, meta: _CommonMeta):
         """
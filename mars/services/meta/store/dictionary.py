@@ -30,6 +30,20 @@ def _get_meta_fields(meta_cls):
     return [f.name for f in dataclass_fields(meta_cls)]
 
 
+# values of these fields are usually identical among chunks of the same
+# tileable, thus they are shared across metas instead of kept per meta
+_shared_meta_fields = ("shape", "dtype", "index")
+
+
+def _has_nan(value) -> bool:
+    # hashes of nan differ among objects, values with nan never dedupe
+    if isinstance(value, float):
+        return value != value
+    if isinstance(value, tuple):
+        return any(_has_nan(v) for v in value)
+    return False
+
+
 @register_meta_store
 class DictMetaStore(AbstractMetaStore):
     name = "dict"
@@ -42,6 +56,9 @@ class DictMetaStore(AbstractMetaStore):
         # data, other bands may only have part data, so when reducers fetch data,
         # we always choose the first band to avoid unexpected absence.
         self._band_chunks: Dict[BandType, OrderedSet] = defaultdict(OrderedSet)
+        # interned values to share among metas, including bands,
+        # field -> key -> [value, reference count]
+        self._shared_values: Dict[str, Dict] = defaultdict(dict)
         if kw:  # pragma: no cover
             raise TypeError(f"Keyword arguments {kw!r} cannot be recognized.")
 
@@ -52,6 +69,67 @@ class DictMetaStore(AbstractMetaStore):
         # no extra kwargs.
         return dict()
 
+    def _share_value(self, field: str, value, key=None):
+        if value is None or _has_nan(value):
+            return value
+        key = value if key is None else key
+        shared = self._shared_values[field]
+        try:
+            entry = shared.get(key)
+            if entry is None:
+                entry = shared[key] = [value, 0]
+        except TypeError:  # pragma: no cover
+            # unhashable values cannot be shared
+            return value
+        entry[1] += 1
+        return entry[0]
+
+    def _release_value(self, field: str, value, key=None):
+        if value is None:
+            return
+        key = value if key is None else key
+        shared = self._shared_values.get(field)
+        try:
+            entry = shared.get(key) if shared is not None else None
+        except TypeError:  # pragma: no cover
+            return
+        if entry is None or entry[0] is not value:
+            # value is not shared
+            return
+        entry[1] -= 1
+        if entry[1] == 0:
+            del shared[key]
+
+    def _share_bands(self, bands: List[BandType]) -> List[BandType]:
+        return [self._share_value("bands", band) for band in bands]
+
+    def _release_bands(self, bands: List[BandType]):
+        for band in bands:
+            self._release_value("bands", band)
+
+    def _compact_meta(self, meta: _CommonMeta):
+        for field in _shared_meta_fields:
+            value = getattr(meta, field, None)
+            if value is not None:
+                setattr(meta, field, self._share_value(field, value))
+        dtypes_value = getattr(meta, "dtypes_value", None)
+        if dtypes_value is not None:
+            # dtypes are shared by keys as they are not hashable
+            meta.dtypes_value = self._share_value(
+                "dtypes_value", dtypes_value, key=dtypes_value.key
+            )
+        if isinstance(meta, _ChunkMeta) and meta.bands:
+            meta.bands = self._share_bands(meta.bands)
+
+    def _release_meta(self, meta: _CommonMeta):
+        for field in _shared_meta_fields:
+            self._release_value(field, getattr(meta, field, None))
+        dtypes_value = getattr(meta, "dtypes_value", None)
+        if dtypes_value is not None:
+            self._release_value("dtypes_value", dtypes_value, key=dtypes_value.key)
+        if isinstance(meta, _ChunkMeta) and meta.bands:
+            self._release_bands(meta.bands)
+
     def _set_meta(self, object_id: str, meta: _CommonMeta):
         if isinstance(meta, _ChunkMeta):
             for band in meta.bands:
@@ -59,6 +137,9 @@ class DictMetaStore(AbstractMetaStore):
         prev_meta = self._store.get(object_id)
         if prev_meta:
             meta = meta.merge_from(prev_meta)
+        self._compact_meta(meta)
+        if prev_meta:
+            self._release_meta(prev_meta)
         self._store[object_id] = meta
 
     @implements(AbstractMetaStore.set_meta)
@@ -109,6 +190,7 @@ class DictMetaStore(AbstractMetaStore):
                 chunks.remove(object_id)
                 if len(chunks) == 0:
                     del self._band_chunks[band]
+        self._release_meta(meta)
         del self._store[object_id]
 
     @implements(AbstractMetaStore.del_meta)
@@ -124,7 +206,9 @@ class DictMetaStore(AbstractMetaStore):
     def _add_chunk_bands(self, object_id: str, bands: List[BandType]):
         meta = self._store[object_id]
         assert isinstance(meta, _ChunkMeta)
-        meta.bands = list(OrderedSet(meta.bands) | OrderedSet(bands))
+        new_bands = [band for band in dict.fromkeys(bands) if band not in meta.bands]
+        new_bands = self._share_bands(new_bands)
+        meta.bands = meta.bands + new_bands
         for band in bands:
             self._band_chunks[band].add(object_id)
 
@@ -141,7 +225,8 @@ class DictMetaStore(AbstractMetaStore):
     def _remove_chunk_bands(self, object_id: str, bands: List[BandType]):
         meta = self._store[object_id]
         assert isinstance(meta, _ChunkMeta)
-        meta.bands = list(OrderedSet(meta.bands) - OrderedSet(bands))
+        self._release_bands([band for band in meta.bands if band in bands])
+        meta.bands = [band for band in meta.bands if band not in bands]
         for band in bands:
             self._band_chunks[band].remove(object_id)
 
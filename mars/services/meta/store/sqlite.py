@@ -0,0 +1,352 @@
+# Copyright 1999-2021 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pickle
+import re
+import sqlite3
+import shutil
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+from .... import oscar as mo
+from ....lib.ordered_set import OrderedSet
+from ....utils import implements
+from ....typing import BandType
+from ..core import _CommonMeta, _ChunkMeta
+from .base import AbstractMetaStore, register_meta_store
+from .dictionary import _get_meta_fields
+
+# sqlite limits number of variables in a single statement
+_SQL_BATCH_SIZE = 500
+
+
+def _iter_batches(items: List, batch_size: int = _SQL_BATCH_SIZE):
+    for i in range(0, len(items), batch_size):
+        yield items[i : i + batch_size]
+
+
+@register_meta_store
+class SqliteMetaStore(AbstractMetaStore):
+    """
+    Meta store which keeps metas in a local SQLite database file,
+    with a bounded LRU cache of hot metas in memory. Metas are
+    pickled as single rows, and relations between bands and chunks
+    are kept in an indexed table to serve `get_band_chunks`.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        session_id: str,
+        root_dir: str = None,
+        cache_size: int = 10000,
+        temp_dir: bool = False,
+        **kw,
+    ):
+        super().__init__(session_id)
+        if kw:  # pragma: no cover
+            raise TypeError(f"Keyword arguments {kw!r} cannot be recognized.")
+
+        if root_dir is None and temp_dir:
+            # db file lives in a directory owned by this store,
+            # which is removed when the store is destroyed
+            root_dir = tempfile.mkdtemp(prefix="mars-meta-")
+        else:
+            temp_dir = False
+        self._root_dir = root_dir
+        self._temp_dir = temp_dir
+        self._cache_size = cache_size
+        self._cache: Dict[str, _CommonMeta] = OrderedDict()
+
+        if root_dir is None:
+            self._db_path = ":memory:"
+        else:
+            file_name = re.sub(r"[^\w\-]", "_", session_id)
+            self._db_path = os.path.join(root_dir, f"{file_name}_meta.db")
+        self._conn = sqlite3.connect(self._db_path, isolation_level=None)
+        self._init_db()
+
+    def _init_db(self):
+        conn = self._conn
+        # rollback journal is needed to undo failed batches,
+        # keep it in memory as metas are not persisted across restarts
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS metas "
+            "(object_id TEXT PRIMARY KEY, meta BLOB) WITHOUT ROWID"
+        )
+        # seq records the order chunks added into a band, the first
+        # band of shuffle data stores complete data, thus order matters
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS band_chunks "
+            "(seq INTEGER PRIMARY KEY AUTOINCREMENT, address TEXT, "
+            "band TEXT, object_id TEXT, UNIQUE(address, band, object_id))"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS band_chunks_object_id "
+            "ON band_chunks(object_id)"
+        )
+
+    @classmethod
+    @implements(AbstractMetaStore.create)
+    async def create(cls, config) -> Dict:
+        kwargs = dict()
+        root_dir = config.get("root_dir")
+        if root_dir is not None:
+            os.makedirs(root_dir, exist_ok=True)
+            kwargs["root_dir"] = root_dir
+        else:
+            kwargs["temp_dir"] = True
+        if config.get("cache_size") is not None:
+            kwargs["cache_size"] = config["cache_size"]
+        return kwargs
+
+    @implements(AbstractMetaStore.destroy)
+    async def destroy(self):
+        self._cache.clear()
+        self._conn.close()
+        if self._db_path != ":memory:" and os.path.exists(self._db_path):
+            os.remove(self._db_path)
+        if self._temp_dir:
+            shutil.rmtree(self._root_dir, ignore_errors=True)
+
+    @contextmanager
+    def _transaction(self, object_ids: Iterable[str]):
+        self._conn.execute("BEGIN")
+        try:
+            yield
+        except:  # noqa: E722  # pylint: disable=bare-except
+            self._conn.execute("ROLLBACK")
+            # cached metas may be modified or replaced inside
+            # the failed transaction, reload them from database
+            for object_id in object_ids:
+                self._cache.pop(object_id, None)
+            raise
+        else:
+            self._conn.execute("COMMIT")
+
+    def _cache_meta(self, object_id: str, meta: _CommonMeta):
+        cache = self._cache
+        cache[object_id] = meta
+        cache.move_to_end(object_id)
+        while len(cache) > self._cache_size:
+            cache.popitem(last=False)
+
+    def _load_metas(self, object_ids: Iterable[str]) -> Dict[str, _CommonMeta]:
+        result = dict()
+        to_load = []
+        for object_id in object_ids:
+            try:
+                result[object_id] = self._cache[object_id]
+                self._cache.move_to_end(object_id)
+            except KeyError:
+                to_load.append(object_id)
+
+        for batch in _iter_batches(list(OrderedSet(to_load))):
+            placeholders = ",".join("?" * len(batch))
+            cursor = self._conn.execute(
+                f"SELECT object_id, meta FROM metas "
+                f"WHERE object_id IN ({placeholders})",
+                batch,
+            )
+            for object_id, meta_bytes in cursor:
+                meta = result[object_id] = pickle.loads(meta_bytes)
+                self._cache_meta(object_id, meta)
+        return result
+
+    def _save_metas(self, metas: Dict[str, _CommonMeta]):
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO metas (object_id, meta) VALUES (?, ?)",
+            [
+                (object_id, pickle.dumps(meta, protocol=pickle.HIGHEST_PROTOCOL))
+                for object_id, meta in metas.items()
+            ],
+        )
+        for object_id, meta in metas.items():
+            self._cache_meta(object_id, meta)
+
+    def _add_band_records(self, object_id: str, bands: List[BandType]):
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO band_chunks (address, band, object_id) "
+            "VALUES (?, ?, ?)",
+            [(band[0], band[1], object_id) for band in bands],
+        )
+
+    def _remove_band_records(self, object_id: str, bands: List[BandType]):
+        self._conn.executemany(
+            "DELETE FROM band_chunks WHERE address = ? AND band = ? AND object_id = ?",
+            [(band[0], band[1], object_id) for band in bands],
+        )
+
+    def _set_metas(self, id_to_metas: List[tuple]):
+        prev_metas = self._load_metas(object_id for object_id, _ in id_to_metas)
+        to_save = dict()
+        with self._transaction(object_id for object_id, _ in id_to_metas):
+            for object_id, meta in id_to_metas:
+                if isinstance(meta, _ChunkMeta) and meta.bands:
+                    self._add_band_records(object_id, meta.bands)
+                prev_meta = to_save.get(object_id) or prev_metas.get(object_id)
+                if prev_meta:
+                    meta = meta.merge_from(prev_meta)
+                to_save[object_id] = meta
+            self._save_metas(to_save)
+
+    @implements(AbstractMetaStore.set_meta)
+    @mo.extensible
+    async def set_meta(self, object_id: str, meta: _CommonMeta):
+        self._set_metas([(object_id, meta)])
+
+    @set_meta.batch
+    async def batch_set_meta(self, args_list, kwargs_list):
+        id_to_metas = []
+        for args, kwargs in zip(args_list, kwargs_list):
+            id_to_metas.append(self._extract_set_args(*args, **kwargs))
+        self._set_metas(id_to_metas)
+
+    @staticmethod
+    def _extract_set_args(object_id: str, meta: _CommonMeta):
+        return object_id, meta
+
+    @staticmethod
+    def _filter_fields(
+        meta: Optional[_CommonMeta], object_id: str, fields: List[str], error: str
+    ) -> Optional[Dict]:
+        if error not in ("raise", "ignore"):  # pragma: no cover
+            raise ValueError("error must be raise or ignore")
+        if meta is None:
+            if error == "raise":
+                raise KeyError(object_id)
+            return
+        if fields is None:
+            fields = _get_meta_fields(type(meta))
+        return {k: getattr(meta, k) for k in fields}
+
+    @implements(AbstractMetaStore.get_meta)
+    @mo.extensible
+    async def get_meta(
+        self, object_id: str, fields: List[str] = None, error: str = "raise"
+    ) -> Dict:
+        metas = self._load_metas([object_id])
+        return self._filter_fields(metas.get(object_id), object_id, fields, error)
+
+    @get_meta.batch
+    async def batch_get_meta(self, args_list, kwargs_list):
+        get_args = [
+            self._extract_get_args(*args, **kwargs)
+            for args, kwargs in zip(args_list, kwargs_list)
+        ]
+        metas = self._load_metas(object_id for object_id, _, _ in get_args)
+        return [
+            self._filter_fields(metas.get(object_id), object_id, fields, error)
+            for object_id, fields, error in get_args
+        ]
+
+    @staticmethod
+    def _extract_get_args(
+        object_id: str, fields: List[str] = None, error: str = "raise"
+    ):
+        return object_id, fields, error
+
+    def _del_metas(self, object_ids: List[str]):
+        metas = self._load_metas(object_ids)
+        for object_id in object_ids:
+            if object_id not in metas:
+                raise KeyError(object_id)
+        with self._transaction(metas):
+            for batch in _iter_batches(list(metas)):
+                placeholders = ",".join("?" * len(batch))
+                self._conn.execute(
+                    f"DELETE FROM metas WHERE object_id IN ({placeholders})", batch
+                )
+                self._conn.execute(
+                    f"DELETE FROM band_chunks WHERE object_id IN ({placeholders})",
+                    batch,
+                )
+        for object_id in metas:
+            self._cache.pop(object_id, None)
+
+    @implements(AbstractMetaStore.del_meta)
+    @mo.extensible
+    async def del_meta(self, object_id: str):
+        self._del_metas([object_id])
+
+    @del_meta.batch
+    async def batch_del_meta(self, args_list, kwargs_list):
+        object_ids = []
+        for args, kwargs in zip(args_list, kwargs_list):
+            object_ids.append(self._extract_del_args(*args, **kwargs))
+        self._del_metas(object_ids)
+
+    @staticmethod
+    def _extract_del_args(object_id: str):
+        return object_id
+
+    def _update_chunk_bands(self, id_to_bands: List[tuple], remove: bool):
+        metas = self._load_metas(object_id for object_id, _ in id_to_bands)
+        to_save = dict()
+        with self._transaction(metas):
+            for object_id, bands in id_to_bands:
+                meta = metas[object_id]
+                assert isinstance(meta, _ChunkMeta)
+                if remove:
+                    meta.bands = list(OrderedSet(meta.bands) - OrderedSet(bands))
+                    self._remove_band_records(object_id, bands)
+                else:
+                    meta.bands = list(OrderedSet(meta.bands) | OrderedSet(bands))
+                    self._add_band_records(object_id, bands)
+                to_save[object_id] = meta
+            self._save_metas(to_save)
+
+    @staticmethod
+    def _extract_band_args(object_id: str, bands: List[BandType]):
+        return object_id, bands
+
+    @implements(AbstractMetaStore.add_chunk_bands)
+    @mo.extensible
+    async def add_chunk_bands(self, object_id: str, bands: List[BandType]):
+        self._update_chunk_bands([(object_id, bands)], remove=False)
+
+    @add_chunk_bands.batch
+    async def batch_add_chunk_bands(self, args_list, kwargs_list):
+        id_to_bands = [
+            self._extract_band_args(*args, **kwargs)
+            for args, kwargs in zip(args_list, kwargs_list)
+        ]
+        self._update_chunk_bands(id_to_bands, remove=False)
+
+    @implements(AbstractMetaStore.remove_chunk_bands)
+    @mo.extensible
+    async def remove_chunk_bands(self, object_id: str, bands: List[BandType]):
+        self._update_chunk_bands([(object_id, bands)], remove=True)
+
+    @remove_chunk_bands.batch
+    async def batch_remove_chunk_bands(self, args_list, kwargs_list):
+        id_to_bands = [
+            self._extract_band_args(*args, **kwargs)
+            for args, kwargs in zip(args_list, kwargs_list)
+        ]
+        self._update_chunk_bands(id_to_bands, remove=True)
+
+    async def get_band_chunks(self, band: BandType) -> List[str]:
+        cursor = self._conn.execute(
+            "SELECT object_id FROM band_chunks "
+            "WHERE address = ? AND band = ? ORDER BY seq",
+            (band[0], band[1]),
+        )
+        return [row[0] for row in cursor]
@@ -12,17 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import pickle
+import tempfile
+
 import pytest
 
 from ..... import tensor as mt
 from .....core import tile
-from ...metas import TensorMeta
+from ...metas import TensorMeta, TensorChunkMeta
 from ...store import get_meta_store
 
 
 @pytest.mark.asyncio
-async def test_mock_meta_store():
-    meta_store = get_meta_store("dict")("mock_session_id")
+@pytest.mark.parametrize("store_name", ["dict", "sqlite"])
+async def test_mock_meta_store(store_name):
+    meta_store = get_meta_store(store_name)("mock_session_id")
 
     t = mt.random.rand(10, 10)
     t = tile(t)
@@ -52,3 +57,164 @@ async def test_mock_meta_store():
 
     with pytest.raises(KeyError):
         await meta_store.get_meta(t.key)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_meta_store():
+    with tempfile.TemporaryDirectory() as tempdir:
+        store_type = get_meta_store("sqlite")
+        kwargs = await store_type.create({"root_dir": tempdir, "cache_size": 2})
+        meta_store = store_type("mock_session_id", **kwargs)
+
+        t = tile(mt.random.rand(10, 10, chunk_size=5))
+        band1, band2 = ("address0", "numa-0"), ("address1", "numa-0")
+        await meta_store.set_meta.batch(
+            *(
+                meta_store.set_meta.delay(
+                    c.key,
+                    TensorChunkMeta(
+                        object_id=c.key,
+                        shape=c.shape,
+                        dtype=c.dtype,
+                        index=c.index,
+                        store_size=100,
+                        bands=[band1],
+                    ),
+                )
+                for c in t.chunks
+            )
+        )
+        chunk_keys = [c.key for c in t.chunks]
+        # metas more than cache size are stored in database
+        assert len(meta_store._cache) == 2
+
+        metas = await meta_store.get_meta.batch(
+            *(
+                meta_store.get_meta.delay(k, fields=["index", "bands"])
+                for k in chunk_keys
+            )
+        )
+        assert [m["index"] for m in metas] == [c.index for c in t.chunks]
+        assert all(m["bands"] == [band1] for m in metas)
+        assert await meta_store.get_meta("non_exist", error="ignore") is None
+        with pytest.raises(KeyError):
+            await meta_store.get_meta("non_exist")
+
+        assert await meta_store.get_band_chunks(band1) == chunk_keys
+        await meta_store.add_chunk_bands(chunk_keys[1], [band2])
+        await meta_store.add_chunk_bands(chunk_keys[0], [band2])
+        assert await meta_store.get_band_chunks(band2) == chunk_keys[1::-1]
+        assert (await meta_store.get_meta(chunk_keys[0]))["bands"] == [band1, band2]
+
+        await meta_store.remove_chunk_bands.batch(
+            *(meta_store.remove_chunk_bands.delay(k, [band1]) for k in chunk_keys[:2])
+        )
+        assert await meta_store.get_band_chunks(band1) == chunk_keys[2:]
+        assert (await meta_store.get_meta(chunk_keys[1]))["bands"] == [band2]
+
+        await meta_store.del_meta.batch(
+            *(meta_store.del_meta.delay(k) for k in chunk_keys[:3])
+        )
+        assert await meta_store.get_band_chunks(band1) == chunk_keys[3:]
+        assert await meta_store.get_band_chunks(band2) == []
+        with pytest.raises(KeyError):
+            await meta_store.get_meta(chunk_keys[0])
+
+        db_files = os.listdir(tempdir)
+        assert len(db_files) == 1
+        await meta_store.destroy()
+        assert not os.listdir(tempdir)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_meta_store_rollback():
+    store_type = get_meta_store("sqlite")
+    kwargs = await store_type.create({})
+    meta_store = store_type("mock_session_id", **kwargs)
+    root_dir = meta_store._root_dir
+    assert os.path.isdir(root_dir)
+
+    t = tile(mt.random.rand(10, 10, chunk_size=5))
+    band1, band2 = ("address0", "numa-0"), ("address1", "numa-0")
+    chunk_keys = [c.key for c in t.chunks]
+    metas = [
+        TensorChunkMeta(
+            object_id=c.key,
+            shape=c.shape,
+            dtype=c.dtype,
+            index=c.index,
+            store_size=100,
+            bands=[band1],
+        )
+        for c in t.chunks
+    ]
+    await meta_store.set_meta(chunk_keys[0], metas[0])
+
+    def _failed_save(*_):
+        raise SystemError("mock failure")
+
+    raw_save_metas = meta_store._save_metas
+    meta_store._save_metas = _failed_save
+    # band records added before the failure should be rolled back
+    with pytest.raises(SystemError):
+        await meta_store.set_meta.batch(
+            *(meta_store.set_meta.delay(k, m) for k, m in zip(chunk_keys, metas))
+        )
+    with pytest.raises(SystemError):
+        await meta_store.add_chunk_bands(chunk_keys[0], [band2])
+    meta_store._save_metas = raw_save_metas
+
+    assert await meta_store.get_band_chunks(band1) == chunk_keys[:1]
+    assert await meta_store.get_band_chunks(band2) == []
+    assert (await meta_store.get_meta(chunk_keys[0]))["bands"] == [band1]
+    assert await meta_store.get_meta(chunk_keys[1], error="ignore") is None
+
+    await meta_store.destroy()
+    assert not os.path.exists(root_dir)
+
+
+@pytest.mark.asyncio
+async def test_dict_meta_store_sharing():
+    meta_store = get_meta_store("dict")("mock_session_id")
+
+    t = tile(mt.random.rand(10, 10, chunk_size=5))
+    band = ("address0", "numa-0")
+    for c in t.chunks:
+        meta = TensorChunkMeta(
+            object_id=c.key,
+            shape=c.shape,
+            dtype=c.dtype,
+            index=c.index,
+            bands=[band],
+        )
+        # metas are deserialized from messages in real scenarios
+        await meta_store.set_meta(c.key, pickle.loads(pickle.dumps(meta)))
+    # slots of base meta classes are not duplicated
+    assert "object_id" not in TensorChunkMeta.__slots__
+
+    metas = await meta_store.get_meta.batch(
+        *(meta_store.get_meta.delay(c.key) for c in t.chunks)
+    )
+    assert len({id(m["shape"]) for m in metas}) == 1
+    assert len({id(m["dtype"]) for m in metas}) == 1
+    assert len({id(m["bands"][0]) for m in metas}) == 1
+
+    await meta_store.add_chunk_bands(t.chunks[0].key, [("address1", "numa-0"), band])
+    meta = await meta_store.get_meta(t.chunks[0].key, fields=["bands"])
+    assert meta["bands"] == [band, ("address1", "numa-0")]
+    await meta_store.remove_chunk_bands(t.chunks[0].key, [band])
+    meta = await meta_store.get_meta(t.chunks[0].key, fields=["bands"])
+    assert meta["bands"] == [("address1", "numa-0")]
+    assert await meta_store.get_band_chunks(band) == [c.key for c in t.chunks[1:]]
+
+    # values with nan are not shared as they never dedupe
+    nan_meta = TensorChunkMeta(
+        object_id="nan_chunk", shape=(float("nan"), 5), dtype=t.dtype, bands=[band]
+    )
+    await meta_store.set_meta("nan_chunk", nan_meta)
+    assert len(meta_store._shared_values["shape"]) == 1
+
+    # shared values are released once no metas refer to them
+    for key in [c.key for c in t.chunks] + ["nan_chunk"]:
+        await meta_store.del_meta(key)
+    assert all(len(values) == 0 for values in meta_store._shared_values.values())
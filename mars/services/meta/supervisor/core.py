@@ -64,6 +64,7 @@ class MetaStoreActor(mo.Actor):
                 for ref in self._worker_meta_store_refs
             ]
         )
+        await self._store.destroy()
 
     @staticmethod
     def gen_uid(session_id: str):
@@ -26,16 +26,17 @@ class MetaSupervisorService(AbstractService):
     {
         "meta" : {
             "store": "<meta store name>",
-            # other config related to each store
+            # other config related to each store, for instance,
+            # "root_dir" and "cache_size" for sqlite store
         }
     }
     """
 
     async def start(self):
         service_config = self._config["meta"]
-        meta_store_name = service_config.get("meta", "dict")
+        meta_store_name = service_config.get("store", "dict")
         extra_config = service_config.copy()
-        extra_config.pop("meta", None)
+        extra_config.pop("store", None)
         await mo.create_actor(
             MetaStoreManagerActor,
             meta_store_name,
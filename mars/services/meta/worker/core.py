@@ -69,6 +69,9 @@ class WorkerMetaStoreActor(mo.Actor):
         meta_store_type = get_meta_store(meta_store_name)
         self._store = meta_store_type(session_id, **meta_store_kwargs)
 
+    async def __pre_destroy__(self):
+        await self._store.destroy()
+
     @staticmethod
     def gen_uid(session_id: str):
         return f"{session_id}_worker_meta"
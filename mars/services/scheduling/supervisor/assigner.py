@@ -33,9 +33,17 @@ class AssignerActor(mo.Actor):
     def gen_uid(cls, session_id: str):
         return f"{session_id}_assigner"
 
-    def __init__(self, session_id: str):
+    def __init__(
+        self, session_id: str, mode: str = "default", load_factor: float = 1.0
+    ):
+        if mode not in ("default", "locality"):  # pragma: no cover
+            raise ValueError(f"Unknown assign mode {mode}")
         self._session_id = session_id
         self._slots_ref = None
+        # in locality mode, bands are scored by sizes of input data stored
+        # on them as well as numbers of subtasks queued on them
+        self._locality_aware = mode == "locality"
+        self._load_factor = load_factor
 
         self._cluster_api = None
         self._meta_api = None
@@ -102,14 +110,94 @@ class AssignerActor(mo.Actor):
                 )
         return bands[np.random.choice(len(bands))]
 
+    def _get_band_input_sizes(
+        self,
+        subtask: Subtask,
+        inp_metas: Dict,
+        is_gpu: bool,
+        exclude_bands: Set[BandType],
+        random_when_unavailable: bool,
+    ) -> Dict[BandType, int]:
+        band_prefix = "numa" if not is_gpu else "gpu"
+        filtered_bands = self._get_device_bands(is_gpu)
+
+        def _iter_inp_sizes():
+            for inp in subtask.chunk_graph.iter_indep():
+                if isinstance(inp.op, Fetch):
+                    meta = inp_metas[inp.key]
+                    yield meta["bands"], meta["store_size"]
+                elif isinstance(inp.op, FetchShuffle):
+                    # every reducer fetches a part of mapper data
+                    n_reducers = inp.op.n_reducers or 1
+                    for source_key in inp.op.source_keys:
+                        meta = inp_metas.get(source_key)
+                        if meta is not None:
+                            yield meta["bands"], meta["store_size"] / n_reducers
+
+        band_sizes = defaultdict(lambda: 0)
+        for inp_bands, inp_size in _iter_inp_sizes():
+            for band in inp_bands:
+                if not band[1].startswith(band_prefix):
+                    sel_bands = [
+                        b
+                        for b in self._address_to_bands[band[0]]
+                        if b[1].startswith(band_prefix) and b not in exclude_bands
+                    ]
+                    if sel_bands:
+                        band = sel_bands[np.random.choice(len(sel_bands))]
+                if band not in filtered_bands or band in exclude_bands:
+                    band = self._get_random_band(
+                        is_gpu, exclude_bands, random_when_unavailable
+                    )
+                band_sizes[band] += inp_size
+        return band_sizes
+
+    def _select_bands_by_locality(
+        self,
+        band_sizes: Dict[BandType, int],
+        is_gpu: bool,
+        exclude_bands: Set[BandType],
+        band_loads: Dict[BandType, int],
+        mean_input_size: float,
+        random_when_unavailable: bool,
+    ) -> List[BandType]:
+        candidates = [
+            band for band in self._get_device_bands(is_gpu) if band not in exclude_bands
+        ]
+        if not candidates:
+            return [
+                self._get_random_band(is_gpu, exclude_bands, random_when_unavailable)
+            ]
+
+        total_size = sum(band_sizes.values())
+        # cost of a band consists of bytes to transfer into the band
+        # and the delay caused by subtasks already queued on it,
+        # every queued subtask is weighed as an average input size
+        min_cost = None
+        bands = []
+        for band in candidates:
+            cost = (
+                total_size
+                - band_sizes.get(band, 0)
+                + self._load_factor * band_loads.get(band, 0) * mean_input_size
+            )
+            if min_cost is None or cost < min_cost:
+                bands = [band]
+                min_cost = cost
+            elif cost == min_cost:
+                bands.append(band)
+        return bands
+
     async def assign_subtasks(
         self,
         subtasks: List[Subtask],
         exclude_bands: Set[BandType] = None,
         random_when_unavailable: bool = True,
+        band_to_queued_num: Dict[BandType, int] = None,
     ):
         exclude_bands = exclude_bands or set()
         inp_keys = set()
+        shuffle_keys = set()
         broadcaster_keys = set()
         selected_bands = dict()
 
@@ -142,6 +230,9 @@ class AssignerActor(mo.Actor):
                         broadcaster_keys.add(indep_chunk.key)
                     inp_keys.add(indep_chunk.key)
                 elif isinstance(indep_chunk.op, FetchShuffle):
+                    if self._locality_aware:
+                        shuffle_keys.update(indep_chunk.op.source_keys)
+                        continue
                     selected_bands[subtask.subtask_id] = [
                         self._get_random_band(
                             is_gpu, exclude_bands, random_when_unavailable
@@ -151,44 +242,51 @@ class AssignerActor(mo.Actor):
 
         fields = ["store_size", "bands"]
         inp_keys = list(inp_keys)
+        shuffle_keys = list(shuffle_keys.difference(inp_keys))
+        # metas of inputs and shuffle mappers are fetched in one round trip,
+        # mapper data of shuffle may be absent, thus ignore errors
         metas = await self._meta_api.get_chunk_meta.batch(
-            *(self._meta_api.get_chunk_meta.delay(key, fields) for key in inp_keys)
+            *(self._meta_api.get_chunk_meta.delay(key, fields) for key in inp_keys),
+            *(
+                self._meta_api.get_chunk_meta.delay(key, fields, error="ignore")
+                for key in shuffle_keys
+            ),
         )
+        inp_metas = dict(zip(inp_keys + shuffle_keys, metas))
 
-        inp_metas = dict(zip(inp_keys, metas))
         if broadcaster_keys:
             # set broadcaster's size as 0 to avoid assigning all successors to same band.
             for key in broadcaster_keys:
                 inp_metas[key]["store_size"] = 0
+
+        band_loads = dict(band_to_queued_num or dict())
+        subtask_band_sizes = dict()
+        for subtask in subtasks:
+            if subtask.subtask_id not in selected_bands:
+                is_gpu = any(c.op.gpu for c in subtask.chunk_graph)
+                subtask_band_sizes[subtask.subtask_id] = self._get_band_input_sizes(
+                    subtask, inp_metas, is_gpu, exclude_bands, random_when_unavailable
+                )
+        input_sizes = [sum(sizes.values()) for sizes in subtask_band_sizes.values()]
+        mean_input_size = max(np.mean(input_sizes) if input_sizes else 0, 1)
+
         assigns = []
         for subtask in subtasks:
             is_gpu = any(c.op.gpu for c in subtask.chunk_graph)
-            band_prefix = "numa" if not is_gpu else "gpu"
-            filtered_bands = self._get_device_bands(is_gpu)
 
             if subtask.subtask_id in selected_bands:
                 bands = selected_bands[subtask.subtask_id]
+            elif self._locality_aware:
+                bands = self._select_bands_by_locality(
+                    subtask_band_sizes[subtask.subtask_id],
+                    is_gpu,
+                    exclude_bands,
+                    band_loads,
+                    mean_input_size,
+                    random_when_unavailable,
+                )
             else:
-                band_sizes = defaultdict(lambda: 0)
-                for inp in subtask.chunk_graph.iter_indep():
-                    if not isinstance(inp.op, Fetch):  # pragma: no cover
-                        continue
-                    meta = inp_metas[inp.key]
-                    for band in meta["bands"]:
-                        if not band[1].startswith(band_prefix):
-                            sel_bands = [
-                                b
-                                for b in self._address_to_bands[band[0]]
-                                if b[1].startswith(band_prefix)
-                                and b not in exclude_bands
-                            ]
-                            if sel_bands:
-                                band = sel_bands[np.random.choice(len(sel_bands))]
-                        if band not in filtered_bands or band in exclude_bands:
-                            band = self._get_random_band(
-                                is_gpu, exclude_bands, random_when_unavailable
-                            )
-                        band_sizes[band] += meta["store_size"]
+                band_sizes = subtask_band_sizes[subtask.subtask_id]
                 bands = []
                 max_size = -1
                 for band, size in band_sizes.items():
@@ -198,6 +296,7 @@ class AssignerActor(mo.Actor):
                     elif size == max_size:
                         bands.append(band)
             band = bands[np.random.choice(len(bands))]
+            band_loads[band] = band_loads.get(band, 0) + 1
             if (
                 not random_when_unavailable and band in exclude_bands
             ):  # pragma: no cover
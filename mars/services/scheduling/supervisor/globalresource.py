@@ -16,11 +16,13 @@ import asyncio
 import logging
 import time
 from collections import defaultdict
-from typing import List, DefaultDict, Dict, Tuple
+from typing import Any, List, DefaultDict, Dict, Optional, Tuple
 
 from .... import oscar as mo
+from ....lib.aio import alru_cache
 from ....resource import Resource, ZeroResource
 from ....typing import BandType
+from ....utils import parse_readable_size
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +33,7 @@ class GlobalResourceManagerActor(mo.Actor):
     _band_used_resources: Dict[BandType, Resource]
     _band_total_resources: Dict[BandType, Resource]
 
-    def __init__(self):
+    def __init__(self, fair_share_config: Dict[str, Any] = None):
         self._band_stid_resources = defaultdict(dict)
         self._band_used_resources = defaultdict(lambda: ZeroResource)
         self._band_idle_start_time = dict()
@@ -40,6 +42,25 @@ class GlobalResourceManagerActor(mo.Actor):
         self._cluster_api = None
         self._band_watch_task = None
 
+        fair_share_config = fair_share_config or dict()
+        self._fair_share_enabled = fair_share_config.get("enabled", False)
+        assert self._fair_share_enabled in (True, False)
+        self._default_session_weight = fair_share_config.get("default_weight", 1)
+        self._session_weights = dict(fair_share_config.get("session_weights") or {})
+        max_session_slots = fair_share_config.get("max_session_slots")
+        self._max_session_slots = (
+            parse_readable_size(max_session_slots)
+            if max_session_slots is not None
+            else None
+        )
+        self._reserve_timeout = fair_share_config.get("reserve_timeout", 1)
+        # slots occupied by every session across all bands
+        self._session_used_slots = defaultdict(lambda: 0)
+        # sessions failed to apply resources on bands, in order of arrival
+        self._band_waiting_sessions = defaultdict(dict)
+        # free resources of bands reserved for sessions waking up
+        self._band_reserved_resources = defaultdict(dict)
+
     async def __post_create__(self):
         from ...cluster.api import ClusterAPI
 
@@ -61,6 +82,85 @@ class GlobalResourceManagerActor(mo.Actor):
     async def refresh_bands(self):
         self._band_total_resources = await self._cluster_api.get_all_bands()
 
+    @staticmethod
+    def _get_slots(resource: Resource) -> float:
+        return resource.num_cpus + resource.num_gpus
+
+    def _get_session_share(self, session_id: str) -> float:
+        weight = self._session_weights.get(session_id, self._default_session_weight)
+        return self._session_used_slots[session_id] / weight
+
+    def _get_session_slots_limit(self) -> Optional[float]:
+        if self._max_session_slots is None:
+            return None
+        limit, is_percent = self._max_session_slots
+        if is_percent:
+            total_slots = sum(
+                self._get_slots(resource)
+                for resource in self._band_total_resources.values()
+            )
+            limit = max(1, int(total_slots * limit))
+        return limit
+
+    def set_session_weight(self, session_id: str, weight: float):
+        assert weight > 0
+        self._session_weights[session_id] = weight
+
+    @alru_cache(cache_exceptions=False)
+    async def _get_queueing_ref(self, session_id: str) -> mo.ActorRef:
+        from .queueing import SubtaskQueueingActor
+
+        [address] = await self._cluster_api.get_supervisors_by_keys([session_id])
+        return await mo.actor_ref(
+            SubtaskQueueingActor.gen_uid(session_id), address=address
+        )
+
+    async def _wake_waiting_session(self, band: BandType):
+        """
+        Reserve free resources of the band for the waiting session with
+        the least weighted share, and ask the session to submit again.
+        Other sessions cannot take reserved resources, thus queued subtasks
+        of sessions occupying more slots are preempted.
+        """
+        waiting_sessions = self._band_waiting_sessions.get(band)
+        reserved_resources = self._band_reserved_resources[band]
+        if not waiting_sessions or reserved_resources:
+            return
+        total_resource = self._band_total_resources.get(band)
+        if total_resource is None:  # pragma: no cover
+            return
+        free_resource = total_resource - self._band_used_resources[band]
+        if self._get_slots(free_resource) <= 0:
+            return
+
+        session_id = min(waiting_sessions, key=self._get_session_share)
+        waiting_sessions.pop(session_id)
+        reserved_resources[session_id] = free_resource
+        logger.debug(
+            "Reserve %r on band %s for waiting session %s",
+            free_resource,
+            band,
+            session_id,
+        )
+        try:
+            queueing_ref = await self._get_queueing_ref(session_id)
+            await queueing_ref.submit_subtasks.tell(band)
+        except (mo.ActorNotExist, OSError):  # pragma: no cover
+            # session already destroyed
+            reserved_resources.pop(session_id, None)
+            await self._wake_waiting_session(band)
+            return
+        self.ref().expire_reservation.tell_delay(
+            band, session_id, delay=self._reserve_timeout
+        )
+
+    async def expire_reservation(self, band: BandType, session_id: str):
+        if self._band_reserved_resources[band].pop(session_id, None) is not None:
+            logger.debug(
+                "Reservation on band %s for session %s expired", band, session_id
+            )
+            await self._wake_waiting_session(band)
+
     @mo.extensible
     async def apply_subtask_resources(
         self,
@@ -73,6 +173,10 @@ class GlobalResourceManagerActor(mo.Actor):
             not self._band_total_resources or band not in self._band_total_resources
         ):  # pragma: no cover
             await self.refresh_bands()
+        if self._fair_share_enabled:
+            return await self._apply_fair_subtask_resources(
+                band, session_id, subtask_ids, subtask_resources
+            )
         idx = 0
         # only ready bands will pass
         if band in self._band_total_resources:
@@ -92,6 +196,59 @@ class GlobalResourceManagerActor(mo.Actor):
             )
         return subtask_ids[:idx]
 
+    async def _apply_fair_subtask_resources(
+        self,
+        band: BandType,
+        session_id: str,
+        subtask_ids: List[str],
+        subtask_resources: List[Resource],
+    ) -> List[str]:
+        waiting_sessions = self._band_waiting_sessions[band]
+        waiting_sessions.pop(session_id, None)
+        reserved_resources = self._band_reserved_resources[band]
+        reserved_resources.pop(session_id, None)
+
+        idx = 0
+        limited = False
+        slots_limit = self._get_session_slots_limit()
+        if band in self._band_total_resources:
+            # resources reserved for other sessions are not available
+            available_resource = self._band_total_resources[band]
+            for resource in reserved_resources.values():
+                available_resource = available_resource - resource
+            for stid, subtask_resource in zip(subtask_ids, subtask_resources):
+                band_used_resource = self._band_used_resources[band]
+                if band_used_resource + subtask_resource > available_resource:
+                    break
+                slots = self._get_slots(subtask_resource)
+                if (
+                    slots_limit is not None
+                    and self._session_used_slots[session_id] + slots > slots_limit
+                ):
+                    # slots released by the session itself will trigger
+                    # submission again, thus no need to wait
+                    limited = True
+                    break
+                self._band_stid_resources[band][(session_id, stid)] = subtask_resource
+                self._session_used_slots[session_id] += slots
+                self._update_band_usage(band, subtask_resource)
+                idx += 1
+        if idx < len(subtask_ids) and not limited:
+            waiting_sessions[session_id] = None
+        if idx == 0:
+            logger.debug(
+                "No resources available for session %s, status: %r, "
+                "reserved: %r, request: %r",
+                session_id,
+                self._band_used_resources,
+                reserved_resources,
+                subtask_resources,
+            )
+        if idx == len(subtask_ids):
+            # resources may remain after the session took what it needs
+            await self._wake_waiting_session(band)
+        return subtask_ids[:idx]
+
     @mo.extensible
     def update_subtask_resources(
         self, band: BandType, session_id: str, subtask_id: str, resource: Resource
@@ -103,10 +260,11 @@ class GlobalResourceManagerActor(mo.Actor):
 
         resource_delta = resource - subtask_resources[session_subtask_id]
         subtask_resources[session_subtask_id] = resource
+        self._session_used_slots[session_id] += self._get_slots(resource_delta)
         self._update_band_usage(band, resource_delta)
 
     @mo.extensible
-    def release_subtask_resource(
+    async def release_subtask_resource(
         self, band: BandType, session_id: str, subtask_id: str
     ):
         # todo ensure slots released when subtasks ends in all means
@@ -114,6 +272,13 @@ class GlobalResourceManagerActor(mo.Actor):
             (session_id, subtask_id), ZeroResource
         )
         self._update_band_usage(band, -resource_delta)
+        slots = self._session_used_slots[session_id] - self._get_slots(resource_delta)
+        if slots > 0:
+            self._session_used_slots[session_id] = slots
+        else:
+            self._session_used_slots.pop(session_id, None)
+        if self._fair_share_enabled:
+            await self._wake_waiting_session(band)
 
     def _update_band_usage(self, band: BandType, band_usage_delta: Resource):
         self._band_used_resources[band] += band_usage_delta
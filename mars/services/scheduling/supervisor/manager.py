@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import asyncio
+import functools
 import logging
 import time
 from collections import defaultdict
@@ -83,6 +84,10 @@ class SubtaskManagerActor(mo.Actor):
         self._speculation_config = speculation_config or {}
         self._queueing_ref = None
         self._global_resource_ref = None
+        # band -> subtask id -> future of subtasks submitted in batches
+        self._band_run_futures = defaultdict(dict)
+        # (subtask id, band) -> future of batched subtasks to be awaited
+        self._batch_run_futures = dict()
         self._submitted_subtask_count = Metrics.counter(
             "mars.scheduling.submitted_subtask_count",
             "The count of submitted subtasks to all bands.",
@@ -238,12 +243,21 @@ class SubtaskManagerActor(mo.Actor):
                 subtasks.append(None)
         return subtasks
 
+    @staticmethod
+    def _is_profiling_enabled(subtask: Subtask) -> bool:
+        extra_config = subtask.extra_config
+        return bool(
+            MARS_ENABLE_PROFILING
+            or (extra_config and extra_config.get("enable_profiling"))
+        )
+
     async def submit_subtask_to_band(self, subtask_id: str, band: BandType):
         if subtask_id not in self._subtask_infos:  # pragma: no cover
             logger.info(
                 "Subtask %s is not in added subtasks set, it may be finished or canceled, skip it.",
                 subtask_id,
             )
+            self._batch_run_futures.pop((subtask_id, band), None)
             return
         async with redirect_subtask_errors(
             self, self._get_subtasks_by_ids([subtask_id])
@@ -251,13 +265,9 @@ class SubtaskManagerActor(mo.Actor):
             try:
                 subtask_info = self._subtask_infos[subtask_id]
                 execution_ref = await self._get_execution_ref(band)
-                extra_config = subtask_info.subtask.extra_config
-                enable_profiling = MARS_ENABLE_PROFILING or (
-                    extra_config and extra_config.get("enable_profiling")
-                )
                 profiling_context = (
                     ProfilingContext(subtask_info.subtask.task_id)
-                    if enable_profiling
+                    if self._is_profiling_enabled(subtask_info.subtask)
                     else None
                 )
                 self._submitted_subtask_count.record(
@@ -270,11 +280,14 @@ class SubtaskManagerActor(mo.Actor):
                 )
                 logger.debug("Start run subtask %s in band %s.", subtask_id, band)
                 with Timer() as timer:
-                    task = asyncio.create_task(
-                        execution_ref.run_subtask.options(
-                            profiling_context=profiling_context
-                        ).send(subtask_info.subtask, band[1], self.address)
-                    )
+                    # subtasks submitted in batches have futures of outcomes
+                    task = self._batch_run_futures.pop((subtask_id, band), None)
+                    if task is None:
+                        task = asyncio.create_task(
+                            execution_ref.run_subtask.options(
+                                profiling_context=profiling_context
+                            ).send(subtask_info.subtask, band[1], self.address)
+                        )
                     subtask_info.band_futures[band] = task
                     subtask_info.start_time = time.time()
                     self._speculation_execution_scheduler.add_subtask(subtask_info)
@@ -339,6 +352,102 @@ class SubtaskManagerActor(mo.Actor):
                 if subtask_info.num_reschedules > 0:
                     await self._queueing_ref.submit_subtasks.tell()
 
+    async def submit_subtasks_to_band(self, band: BandType, subtask_ids: List[str]):
+        """
+        Submit a batch of subtasks to a band in one message. Outcomes of
+        subtasks are reported by the band via `report_subtask_outcomes`
+        once they finish.
+        """
+        skipped_ids = [stid for stid in subtask_ids if stid not in self._subtask_infos]
+        if skipped_ids:  # pragma: no cover
+            logger.info(
+                "Subtasks %s are not in added subtasks set, they may be finished "
+                "or canceled, skip them.",
+                skipped_ids,
+            )
+        subtask_ids = [stid for stid in subtask_ids if stid in self._subtask_infos]
+        if not subtask_ids:  # pragma: no cover
+            return
+
+        async with redirect_subtask_errors(
+            self, self._get_subtasks_by_ids(subtask_ids)
+        ):
+            execution_ref = await self._get_execution_ref(band)
+
+        loop = asyncio.get_running_loop()
+        run_futures = dict()
+        for stid in subtask_ids:
+            # profiling contexts are carried by messages of single subtasks
+            if not self._is_profiling_enabled(self._subtask_infos[stid].subtask):
+                future = self._band_run_futures[band][stid] = loop.create_future()
+                self._batch_run_futures[(stid, band)] = future
+                run_futures[stid] = future
+        if run_futures:
+            logger.debug("Start run %d subtasks in band %s.", len(run_futures), band)
+            batch_task = asyncio.create_task(
+                execution_ref.run_subtasks(
+                    self._get_subtasks_by_ids(list(run_futures)), band[1], self.address
+                )
+            )
+            batch_task.add_done_callback(
+                functools.partial(self._set_batch_outcomes, band, run_futures)
+            )
+        # bookkeeping of every subtask runs in its own message under actor lock
+        yield asyncio.gather(
+            *(self.ref().submit_subtask_to_band(stid, band) for stid in subtask_ids),
+            return_exceptions=True,
+        )
+
+    def _set_run_outcome(
+        self,
+        band: BandType,
+        subtask_id: str,
+        future: asyncio.Future,
+        result: Optional[SubtaskResult],
+        error: Optional[BaseException],
+    ):
+        band_futures = self._band_run_futures.get(band, {})
+        if band_futures.get(subtask_id) is future:
+            band_futures.pop(subtask_id)
+            if not band_futures:
+                self._band_run_futures.pop(band, None)
+        if future.done():
+            return
+        if isinstance(error, asyncio.CancelledError):
+            future.cancel()
+        elif error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _set_batch_outcomes(
+        self,
+        band: BandType,
+        run_futures: Dict[str, asyncio.Future],
+        batch_task: asyncio.Task,
+    ):
+        # outcomes missed by reports are set when the batch finishes,
+        # and errors like losing the band are propagated to all subtasks
+        if batch_task.cancelled():
+            outcomes = [(stid, None, asyncio.CancelledError()) for stid in run_futures]
+        elif batch_task.exception() is not None:
+            outcomes = [(stid, None, batch_task.exception()) for stid in run_futures]
+        else:
+            outcomes = batch_task.result()
+        for stid, result, error in outcomes:
+            self._set_run_outcome(band, stid, run_futures[stid], result, error)
+
+    def report_subtask_outcomes(
+        self,
+        band: BandType,
+        outcomes: List[Tuple[str, Optional[SubtaskResult], Optional[BaseException]]],
+    ):
+        band_futures = self._band_run_futures.get(band, {})
+        for stid, result, error in outcomes:
+            future = band_futures.get(stid)
+            if future is not None:
+                self._set_run_outcome(band, stid, future, result, error)
+
     async def cancel_subtasks(
         self, subtask_ids: List[str], kill_timeout: Union[float, int] = None
     ):
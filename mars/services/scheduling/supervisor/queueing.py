@@ -21,9 +21,11 @@ from dataclasses import dataclass
 from typing import DefaultDict, Dict, List, Optional, Tuple, Union, Set
 
 from .... import oscar as mo
+from ....core.operand import Fetch
 from ....lib.aio import alru_cache
 from ....metrics import Metrics
 from ....resource import ZeroResource
+from ....typing import ChunkType
 from ....utils import dataslots
 from ...subtask import Subtask
 from ...task import TaskAPI
@@ -53,7 +55,13 @@ class SubtaskQueueingActor(mo.Actor):
     def gen_uid(cls, session_id: str):
         return f"{session_id}_subtask_queueing"
 
-    def __init__(self, session_id: str, submit_period: Union[float, int] = None):
+    def __init__(
+        self,
+        session_id: str,
+        submit_period: Union[float, int] = None,
+        prefetch_num: int = 0,
+        submit_batch_size: int = 1,
+    ):
         self._session_id = session_id
         self._stid_to_bands = defaultdict(list)
         self._stid_to_items = dict()
@@ -71,6 +79,14 @@ class SubtaskQueueingActor(mo.Actor):
 
         self._periodical_submit_task = None
         self._submit_period = submit_period or _DEFAULT_SUBMIT_PERIOD
+
+        # max number of subtasks submitted to a band in one message
+        self._submit_batch_size = submit_batch_size or 1
+        # number of queued subtasks per band whose inputs are prefetched
+        self._prefetch_num = prefetch_num or 0
+        # ids of subtasks whose inputs are prefetched to bands, the band
+        # is None if the subtask has no input to prefetch
+        self._prefetched_bands: Dict[str, Optional[Tuple]] = dict()
         self._submitted_subtask_number = Metrics.gauge(
             "mars.band.submitted_subtask_number",
             "The number of submitted subtask to a band.",
@@ -161,6 +177,76 @@ class SubtaskQueueingActor(mo.Actor):
             SubtaskManagerActor.gen_uid(self._session_id), address=self.address
         )
 
+    @alru_cache(cache_exceptions=False)
+    async def _get_execution_ref(self, band: Tuple):
+        from ..worker.execution import SubtaskExecutionActor
+
+        return await mo.actor_ref(SubtaskExecutionActor.default_uid(), address=band[0])
+
+    @staticmethod
+    def _get_prefetch_chunks(subtask: Subtask) -> List[ChunkType]:
+        if subtask.chunk_graph is None:
+            return []
+        return [
+            c
+            for c in subtask.chunk_graph.iter_indep()
+            if isinstance(c.op, Fetch) and c.key not in subtask.pure_depend_keys
+        ]
+
+    async def _prefetch_queued_subtasks(self, bands: List[Tuple]):
+        """
+        Ask workers to fetch inputs of subtasks on top of band queues,
+        thus transfer overlaps with computation of running subtasks.
+        Inputs of gpu operands are fetched into storage of the band.
+        """
+        for band in bands:
+            task_queue = self._band_queues.get(band)
+            if not task_queue:
+                continue
+            stid_to_keys = dict()
+            gpu_keys = []
+            for item in heapq.nsmallest(self._prefetch_num, task_queue):
+                stid = item.subtask.subtask_id
+                if stid not in self._stid_to_items or stid in self._prefetched_bands:
+                    continue
+                chunks = self._get_prefetch_chunks(item.subtask)
+                if chunks:
+                    stid_to_keys[stid] = [c.key for c in chunks]
+                    gpu_keys.extend(c.key for c in chunks if c.op.gpu)
+                self._prefetched_bands[stid] = band if chunks else None
+            if not stid_to_keys:
+                continue
+            try:
+                execution_ref = await self._get_execution_ref(band)
+                await execution_ref.prefetch_subtask_inputs.tell(
+                    self._session_id,
+                    stid_to_keys,
+                    band[1],
+                    self.address,
+                    gpu_keys=gpu_keys or None,
+                )
+            except (mo.ActorNotExist, OSError):  # pragma: no cover
+                logger.debug("Failed to submit prefetch requests to %s", band)
+
+    async def _release_prefetched_inputs(
+        self, subtask_ids: List[str], submitted_band: Tuple = None
+    ):
+        """
+        Release inputs prefetched for subtasks unless they are
+        submitted to the band where their inputs are prefetched.
+        """
+        band_to_stids = defaultdict(list)
+        for stid in subtask_ids:
+            band = self._prefetched_bands.pop(stid, None)
+            if band is not None and band != submitted_band:
+                band_to_stids[band].append(stid)
+        for band, stids in band_to_stids.items():
+            try:
+                execution_ref = await self._get_execution_ref(band)
+                await execution_ref.release_prefetched_inputs.tell(stids)
+            except (mo.ActorNotExist, OSError):  # pragma: no cover
+                logger.debug("Failed to release prefetched inputs on %s", band)
+
     async def add_subtasks(
         self,
         subtasks: List[Subtask],
@@ -168,8 +254,11 @@ class SubtaskQueueingActor(mo.Actor):
         exclude_bands: Set[Tuple] = None,
         random_when_unavailable: bool = True,
     ):
+        band_to_queued_num = {
+            band: len(queue) for band, queue in self._band_queues.items()
+        }
         bands = await self._assigner_ref.assign_subtasks(
-            subtasks, exclude_bands, random_when_unavailable
+            subtasks, exclude_bands, random_when_unavailable, band_to_queued_num
         )
         for subtask, band, priority in zip(subtasks, bands, priorities):
             assert band is not None
@@ -263,7 +352,26 @@ class SubtaskQueueingActor(mo.Actor):
                 }
                 self._submitted_subtask_number.record(len(submitted_ids), tags)
                 self._unsubmitted_subtask_number.record(len(non_submitted_ids), tags)
-                if submitted_ids:
+                if submitted_ids and self._submit_batch_size > 1:
+                    submitted_ids_set = set(submitted_ids)
+                    batch_ids = [k for k in subtask_ids if k in submitted_ids_set]
+                    logger.debug(
+                        "Submit %d subtasks to band %r in batches",
+                        len(batch_ids),
+                        band,
+                    )
+                    for start in range(0, len(batch_ids), self._submit_batch_size):
+                        submit_aio_tasks.append(
+                            asyncio.create_task(
+                                manager_ref.submit_subtasks_to_band.tell(
+                                    band,
+                                    batch_ids[start : start + self._submit_batch_size],
+                                )
+                            )
+                        )
+                    await asyncio.sleep(0)
+                    await self._remove_queued_subtasks(batch_ids, band)
+                elif submitted_ids:
                     for stid in subtask_ids:
                         if stid not in submitted_ids:
                             continue
@@ -277,7 +385,9 @@ class SubtaskQueueingActor(mo.Actor):
                             )
                         )
                         await asyncio.sleep(0)
-                        self.remove_queued_subtasks([item.subtask.subtask_id])
+                        await self._remove_queued_subtasks(
+                            [item.subtask.subtask_id], band
+                        )
                 else:
                     logger.debug("No slots available")
 
@@ -286,6 +396,9 @@ class SubtaskQueueingActor(mo.Actor):
                 # other subtasks can be submitted.
                 heapq.heappush(task_queue, submit_items[stid])
 
+        if self._prefetch_num:
+            await self._prefetch_queued_subtasks(bands)
+
         if submit_aio_tasks:
             yield asyncio.gather(*submit_aio_tasks)
 
@@ -308,13 +421,20 @@ class SubtaskQueueingActor(mo.Actor):
             self._stid_to_items[subtask_id] = new_item
             heapq.heappush(self._band_queues[band], new_item)
 
-    def remove_queued_subtasks(self, subtask_ids: List[str]):
+    async def _remove_queued_subtasks(
+        self, subtask_ids: List[str], submitted_band: Tuple = None
+    ):
         for stid in subtask_ids:
             bands = self._stid_to_bands.pop(stid, [])
             self._stid_to_items.pop(stid, None)
             for band in bands:
                 band_queue = self._band_queues.get(band)
                 self._ensure_top_item_valid(band_queue)
+        if self._prefetched_bands:
+            await self._release_prefetched_inputs(subtask_ids, submitted_band)
+
+    async def remove_queued_subtasks(self, subtask_ids: List[str]):
+        await self._remove_queued_subtasks(subtask_ids)
 
     async def all_bands_busy(self) -> bool:
         """Return True if all bands queue has tasks waiting to be submitted."""
@@ -332,6 +452,8 @@ class SubtaskQueueingActor(mo.Actor):
             band_num_queued_subtasks
         )
         items = []
+        # prefetched inputs of subtasks moved from bands are released
+        moved_stids = []
         # rewrite band queues according to feedbacks from assigner
         for band, move in move_queued_subtasks.items():
             task_queue = self._band_queues[band]
@@ -342,9 +464,13 @@ class SubtaskQueueingActor(mo.Actor):
                     item = heapq.heappop(task_queue)
                     self._stid_to_bands[item.subtask.subtask_id].remove(band)
                     items.append(item)
+                    if self._prefetched_bands.get(item.subtask.subtask_id) == band:
+                        moved_stids.append(item.subtask.subtask_id)
                 elif move > 0:
                     item = items.pop()
                     self._stid_to_bands[item.subtask.subtask_id].append(band)
                     heapq.heappush(task_queue, item)
             if len(task_queue) == 0:
                 self._band_queues.pop(band)
+        if moved_stids:
+            await self._release_prefetched_inputs(moved_stids)
@@ -29,6 +29,21 @@ class SchedulingSupervisorService(AbstractService):
     {
         "scheduling" : {
             "submit_period": 1,
+            "submit_batch_size": 1,
+            "assigner": {
+                "mode": "locality",
+                "load_factor": 1.0
+            },
+            "prefetch": {
+                "num_subtasks": 2
+            },
+            "fair_share": {
+                "enabled": false,
+                "default_weight": 1,
+                "session_weights": {},
+                "max_session_slots": "50%",
+                "reserve_timeout": 1
+            },
             "autoscale" : {
                 "enabled": false,
                 "scheduler_backlog_timeout": 20,
@@ -44,8 +59,10 @@ class SchedulingSupervisorService(AbstractService):
     async def start(self):
         from .globalresource import GlobalResourceManagerActor
 
+        fair_share_config = self._config.get("scheduling", {}).get("fair_share", {})
         await mo.create_actor(
             GlobalResourceManagerActor,
+            fair_share_config,
             uid=GlobalResourceManagerActor.default_uid(),
             address=self._address,
         )
@@ -83,12 +100,16 @@ class SchedulingSupervisorService(AbstractService):
         )
         subtask_cancel_timeout = scheduling_config.get("subtask_cancel_timeout", 5)
         speculation_config = scheduling_config.get("speculation", {})
+        prefetch_num = scheduling_config.get("prefetch", {}).get("num_subtasks", 0)
 
         from .assigner import AssignerActor
 
+        assigner_config = scheduling_config.get("assigner", {})
         assigner_coro = mo.create_actor(
             AssignerActor,
             session_id,
+            mode=assigner_config.get("mode", "default"),
+            load_factor=assigner_config.get("load_factor", 1.0),
             address=self._address,
             uid=AssignerActor.gen_uid(session_id),
         )
@@ -99,6 +120,8 @@ class SchedulingSupervisorService(AbstractService):
             SubtaskQueueingActor,
             session_id,
             scheduling_config.get("submit_period"),
+            prefetch_num,
+            scheduling_config.get("submit_batch_size", 1),
             address=self._address,
             uid=SubtaskQueueingActor.gen_uid(session_id),
         )
@@ -18,7 +18,7 @@ import pytest
 
 from ..... import oscar as mo
 from .....core import ChunkGraph
-from .....tensor.fetch import TensorFetch
+from .....tensor.fetch import TensorFetch, TensorFetchShuffle
 from .....tensor.arithmetic import TensorTreeAdd
 from ....cluster import ClusterAPI
 from ....cluster.core import NodeRole, NodeStatus
@@ -240,6 +240,79 @@ async def test_assign_broadcaster(actor_pool):
     assert result == ("address1", "numa-0")
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("actor_pool", [False], indirect=True)
+async def test_assign_by_locality(actor_pool):
+    pool, session_id, _, cluster_api, meta_api = actor_pool
+    assigner_ref = await mo.create_actor(
+        AssignerActor,
+        session_id,
+        mode="locality",
+        load_factor=1.0,
+        uid=AssignerActor.gen_uid(session_id) + "_locality",
+        address=pool.external_address,
+    )
+
+    input1 = TensorFetch(key="a", source_key="a", dtype=np.dtype(int)).new_chunk([])
+    input2 = TensorFetch(key="b", source_key="b", dtype=np.dtype(int)).new_chunk([])
+    result_chunk = TensorTreeAdd(args=[input1, input2]).new_chunk([input1, input2])
+
+    chunk_graph = ChunkGraph([result_chunk])
+    chunk_graph.add_node(input1)
+    chunk_graph.add_node(input2)
+    chunk_graph.add_node(result_chunk)
+    chunk_graph.add_edge(input1, result_chunk)
+    chunk_graph.add_edge(input2, result_chunk)
+
+    await meta_api.set_chunk_meta(
+        input1, memory_size=400, store_size=400, bands=[("address0", "numa-0")]
+    )
+    await meta_api.set_chunk_meta(
+        input2, memory_size=100, store_size=100, bands=[("address1", "numa-0")]
+    )
+
+    subtask = Subtask("test_task", session_id, chunk_graph=chunk_graph)
+    [result] = await assigner_ref.assign_subtasks([subtask])
+    assert result == ("address0", "numa-0")
+
+    # a heavily-loaded band is avoided even if it holds more data
+    [result] = await assigner_ref.assign_subtasks(
+        [subtask], band_to_queued_num={("address0", "numa-0"): 2}
+    )
+    assert result == ("address1", "numa-0")
+
+    # subtasks assigned in the same batch count as load
+    results = await assigner_ref.assign_subtasks([subtask] * 2)
+    assert results == [("address0", "numa-0"), ("address1", "numa-0")]
+
+    # sizes of shuffle inputs are derived from mapper data
+    mapper1 = TensorFetch(key="m1", source_key="m1", dtype=np.dtype(int)).new_chunk([])
+    mapper2 = TensorFetch(key="m2", source_key="m2", dtype=np.dtype(int)).new_chunk([])
+    await meta_api.set_chunk_meta(
+        mapper1, memory_size=1000, store_size=1000, bands=[("address2", "numa-0")]
+    )
+    await meta_api.set_chunk_meta(
+        mapper2, memory_size=200, store_size=200, bands=[("address3", "numa-0")]
+    )
+    shuffle_input = TensorFetchShuffle(
+        source_keys=[mapper1.key, mapper2.key],
+        n_mappers=2,
+        n_reducers=2,
+        dtype=np.dtype(int),
+    ).new_chunk([])
+    reducer_chunk = TensorTreeAdd(args=[shuffle_input]).new_chunk([shuffle_input])
+    chunk_graph = ChunkGraph([reducer_chunk])
+    chunk_graph.add_node(shuffle_input)
+    chunk_graph.add_node(reducer_chunk)
+    chunk_graph.add_edge(shuffle_input, reducer_chunk)
+
+    subtask = Subtask("test_task2", session_id, chunk_graph=chunk_graph)
+    [result] = await assigner_ref.assign_subtasks([subtask])
+    assert result == ("address2", "numa-0")
+
+    await mo.destroy_actor(assigner_ref)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("actor_pool", [True], indirect=True)
 async def test_assign_gpu_tasks(actor_pool):
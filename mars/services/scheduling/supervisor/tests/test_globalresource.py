@@ -20,12 +20,24 @@ from ..... import oscar as mo
 from .....resource import Resource
 from ....cluster import ClusterAPI, MockClusterAPI
 from ....session import MockSessionAPI
-from ...supervisor import GlobalResourceManagerActor
+from ...supervisor import GlobalResourceManagerActor, SubtaskQueueingActor
+
+
+class MockQueueingActor(mo.Actor):
+    def __init__(self):
+        self._submitted_bands = []
+
+    def submit_subtasks(self, band=None, limit=None):
+        self._submitted_bands.append(band)
+
+    def get_submitted_bands(self):
+        return self._submitted_bands
 
 
 @pytest.fixture
-async def actor_pool():
+async def actor_pool(request):
     pool = await mo.create_actor_pool("127.0.0.1", n_process=0)
+    fair_share_config = getattr(request, "param", None)
 
     async with pool:
         session_id = "test_session"
@@ -34,6 +46,7 @@ async def actor_pool():
 
         global_resource_ref = await mo.create_actor(
             GlobalResourceManagerActor,
+            fair_share_config,
             uid=GlobalResourceManagerActor.default_uid(),
             address=pool.external_address,
         )
@@ -68,10 +81,10 @@ async def test_global_resource(actor_pool):
     )
 
     wait_coro = global_resource_ref.wait_band_idle(band)
-    (done, pending) = await asyncio.wait([wait_coro], timeout=0.5)
+    done, pending = await asyncio.wait([wait_coro], timeout=0.5)
     assert not done
     await global_resource_ref.release_subtask_resource(band, session_id, "subtask0")
-    (done, pending) = await asyncio.wait([wait_coro], timeout=0.5)
+    done, pending = await asyncio.wait([wait_coro], timeout=0.5)
     assert done
     assert band in await global_resource_ref.get_idle_bands(0)
     assert ["subtask1"] == await global_resource_ref.apply_subtask_resources(
@@ -80,3 +93,74 @@ async def test_global_resource(actor_pool):
     assert (await global_resource_ref.get_remaining_resources())[
         band
     ] == band_resource - Resource(num_cpus=1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "actor_pool", [{"enabled": True, "reserve_timeout": 10}], indirect=True
+)
+async def test_fair_share(actor_pool):
+    pool, session_id, global_resource_ref = actor_pool
+    other_session_id = "other_session"
+    queueing_ref = await mo.create_actor(
+        MockQueueingActor,
+        uid=SubtaskQueueingActor.gen_uid(other_session_id),
+        address=pool.external_address,
+    )
+
+    cluster_api = await ClusterAPI.create(pool.external_address)
+    bands = await cluster_api.get_all_bands()
+    band = (pool.external_address, "numa-0")
+    num_slots = int(bands[band].num_cpus)
+
+    # batch session occupies all slots
+    stids = [f"subtask{i}" for i in range(num_slots)]
+    assert stids == await global_resource_ref.apply_subtask_resources(
+        band, session_id, stids, [Resource(num_cpus=1)] * num_slots
+    )
+    assert [] == await global_resource_ref.apply_subtask_resources(
+        band, other_session_id, ["other0"], [Resource(num_cpus=1)]
+    )
+    assert [] == await queueing_ref.get_submitted_bands()
+
+    # released slot is reserved for the waiting session
+    await global_resource_ref.release_subtask_resource(band, session_id, "subtask0")
+    assert [band] == await queueing_ref.get_submitted_bands()
+    assert [] == await global_resource_ref.apply_subtask_resources(
+        band, session_id, ["subtask0"], [Resource(num_cpus=1)]
+    )
+    assert ["other0"] == await global_resource_ref.apply_subtask_resources(
+        band, other_session_id, ["other0"], [Resource(num_cpus=1)]
+    )
+
+    # the session with less weighted share is preferred
+    assert [] == await global_resource_ref.apply_subtask_resources(
+        band, other_session_id, ["other1"], [Resource(num_cpus=1)]
+    )
+    await global_resource_ref.set_session_weight(session_id, 0.01)
+    await global_resource_ref.release_subtask_resource(band, session_id, "subtask1")
+    assert [band, band] == await queueing_ref.get_submitted_bands()
+    await mo.destroy_actor(queueing_ref)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "actor_pool", [{"enabled": True, "max_session_slots": 2}], indirect=True
+)
+async def test_session_slots_limit(actor_pool):
+    pool, session_id, global_resource_ref = actor_pool
+    band = (pool.external_address, "numa-0")
+
+    assert [
+        "subtask0",
+        "subtask1",
+    ] == await global_resource_ref.apply_subtask_resources(
+        band,
+        session_id,
+        ["subtask0", "subtask1", "subtask2"],
+        [Resource(num_cpus=1)] * 3,
+    )
+    await global_resource_ref.release_subtask_resource(band, session_id, "subtask0")
+    assert ["subtask2"] == await global_resource_ref.apply_subtask_resources(
+        band, session_id, ["subtask2"], [Resource(num_cpus=1)]
+    )
@@ -87,6 +87,32 @@ class MockSubtaskExecutionActor(mo.StatelessActor):
         ] = asyncio.create_task(asyncio.sleep(20))
         return await task
 
+    async def run_subtasks(
+        self, subtasks: List[Subtask], band_name: str, supervisor_address: str
+    ):
+        outcomes = [
+            (
+                subtask.subtask_id,
+                SubtaskResult(
+                    subtask_id=subtask.subtask_id,
+                    session_id=subtask.session_id,
+                    status=SubtaskStatus.succeeded,
+                ),
+                None,
+            )
+            for subtask in subtasks
+        ]
+        # report the first outcome ahead, and return others unreported
+        # when the batch finishes
+        manager_ref = await mo.actor_ref(
+            SubtaskManagerActor.gen_uid(subtasks[0].session_id),
+            address=supervisor_address,
+        )
+        await manager_ref.report_subtask_outcomes(
+            (self.address, band_name), outcomes[:1]
+        )
+        return outcomes[1:]
+
     def cancel_subtask(self, subtask_id: str, kill_timeout: int = 5):
         for task in self._subtask_aiotasks[subtask_id].values():
             task.cancel()
@@ -198,3 +224,24 @@ async def test_subtask_manager(actor_pool):
     subtask3_result = await task_manager_ref.get_result(subtask3.subtask_id)
     assert subtask3_result.status == SubtaskStatus.errored
     assert isinstance(subtask3_result.error, ValueError)
+
+
+@pytest.mark.asyncio
+async def test_subtask_batch_submit(actor_pool):
+    (
+        pool,
+        session_id,
+        _execution_ref,
+        manager_ref,
+        _queue_ref,
+        task_manager_ref,
+    ) = actor_pool
+
+    subtasks = [Subtask(f"batch_subtask{i}", session_id) for i in range(3)]
+    await manager_ref.add_subtasks(subtasks, [(i,) for i in range(3)])
+    await manager_ref.submit_subtasks_to_band(
+        (pool.external_address, "numa-0"), [subtask.subtask_id for subtask in subtasks]
+    )
+    for subtask in subtasks:
+        result = await task_manager_ref.get_result(subtask.subtask_id)
+        assert result.status == SubtaskStatus.succeeded
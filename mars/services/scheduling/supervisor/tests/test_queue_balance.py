@@ -119,7 +119,11 @@ class MockSlotsActor(mo.Actor):
 
 class MockAssignerActor(mo.Actor):
     def assign_subtasks(
-        self, subtasks: List[Subtask], exclude_bands=None, random_when_unavailable=True
+        self,
+        subtasks: List[Subtask],
+        exclude_bands=None,
+        random_when_unavailable=True,
+        band_to_queued_num=None,
     ):
         return [subtask.expect_bands[0] for subtask in subtasks]
 
@@ -52,7 +52,11 @@ class MockSlotsActor(mo.Actor):
 
 class MockAssignerActor(mo.Actor):
     def assign_subtasks(
-        self, subtasks: List[Subtask], exclude_bands=None, random_when_unavailable=True
+        self,
+        subtasks: List[Subtask],
+        exclude_bands=None,
+        random_when_unavailable=True,
+        band_to_queued_num=None,
     ):
         return [(self.address, "numa-0")] * len(subtasks)
 
@@ -66,6 +70,10 @@ class MockSubtaskManagerActor(mo.Actor):
         self._subtask_ids.append(subtask_id)
         self._bands.append(band)
 
+    def submit_subtasks_to_band(self, band: Tuple, subtask_ids: List[str]):
+        self._subtask_ids.append(subtask_ids)
+        self._bands.append(band)
+
     def dump_data(self):
         return self._subtask_ids, self._bands
 
@@ -110,6 +118,31 @@ async def actor_pool():
             await MockClusterAPI.cleanup(pool.external_address)
 
 
+class MockExecutionActor(mo.Actor):
+    def __init__(self):
+        self._prefetches = []
+        self._releases = []
+
+    def prefetch_subtask_inputs(
+        self,
+        session_id,
+        subtask_id_to_keys,
+        band_name,
+        supervisor_address,
+        gpu_keys=None,
+    ):
+        self._prefetches.append(subtask_id_to_keys)
+
+    def release_prefetched_inputs(self, subtask_ids):
+        self._releases.append(subtask_ids)
+
+    def get_prefetches(self):
+        return self._prefetches
+
+    def get_releases(self):
+        return self._releases
+
+
 @pytest.mark.asyncio
 async def test_subtask_queueing(actor_pool):
     _pool, session_id, queueing_ref, slots_ref, manager_ref = actor_pool
@@ -138,3 +171,86 @@ async def test_subtask_queueing(actor_pool):
     commited_subtasks, _commited_bands = await manager_ref.dump_data()
     assert commited_subtasks == ["4", "3", "0", "2"]
     assert not await queueing_ref.all_bands_busy()
+
+
+@pytest.mark.asyncio
+async def test_subtask_batch_submit(actor_pool):
+    pool, session_id, _queueing_ref, slots_ref, manager_ref = actor_pool
+    await slots_ref.set_capacity(3)
+    queueing_ref = await mo.create_actor(
+        SubtaskQueueingActor,
+        session_id,
+        submit_batch_size=2,
+        uid=SubtaskQueueingActor.gen_uid(session_id) + "_batch",
+        address=pool.external_address,
+    )
+
+    subtasks = [Subtask(str(i)) for i in range(5)]
+    await queueing_ref.add_subtasks(subtasks, [(i,) for i in range(5)])
+    # queue: [4 3 2 1 0]
+    await queueing_ref.submit_subtasks()
+    # queue: [1 0]
+    commited_subtask_ids, commited_bands = await manager_ref.dump_data()
+    assert commited_subtask_ids == [["4", "3"], ["2"]]
+    assert commited_bands == [(pool.external_address, "numa-0")] * 2
+    await mo.destroy_actor(queueing_ref)
+
+
+@pytest.mark.asyncio
+async def test_subtask_prefetch(actor_pool):
+    import numpy as np
+
+    from .....core import ChunkGraph
+    from .....tensor.arithmetic import TensorTreeAdd
+    from .....tensor.fetch import TensorFetch
+    from ...worker import SubtaskExecutionActor
+
+    pool, session_id, queueing_ref, slots_ref, manager_ref = actor_pool
+    await slots_ref.set_capacity(1)
+    execution_ref = await mo.create_actor(
+        MockExecutionActor,
+        uid=SubtaskExecutionActor.default_uid(),
+        address=pool.external_address,
+    )
+    prefetch_queueing_ref = await mo.create_actor(
+        SubtaskQueueingActor,
+        session_id,
+        prefetch_num=2,
+        uid=SubtaskQueueingActor.gen_uid(session_id) + "_prefetch",
+        address=pool.external_address,
+    )
+
+    subtasks, input_keys = [], []
+    for i in range(4):
+        fetch_chunk = TensorFetch(
+            key=f"input{i}", source_key=f"input{i}", dtype=np.dtype(float)
+        ).new_chunk([])
+        result_chunk = TensorTreeAdd(args=[fetch_chunk]).new_chunk(
+            [fetch_chunk], shape=(), dtype=np.dtype(float)
+        )
+        chunk_graph = ChunkGraph([result_chunk])
+        chunk_graph.add_node(fetch_chunk)
+        chunk_graph.add_node(result_chunk)
+        chunk_graph.add_edge(fetch_chunk, result_chunk)
+        input_keys.append(fetch_chunk.key)
+        subtasks.append(Subtask(str(i), session_id=session_id, chunk_graph=chunk_graph))
+
+    await prefetch_queueing_ref.add_subtasks(subtasks, [(i,) for i in range(4)])
+    # queue: [3 2 1 0]
+    await prefetch_queueing_ref.submit_subtasks()
+    # subtask 3 submitted, inputs of 2 and 1 prefetched
+    assert await execution_ref.get_prefetches() == [
+        {"2": [input_keys[2]], "1": [input_keys[1]]}
+    ]
+    await prefetch_queueing_ref.submit_subtasks()
+    # subtask 2 submitted, only inputs of 0 are prefetched
+    assert (await execution_ref.get_prefetches())[1:] == [{"0": [input_keys[0]]}]
+    # submitted subtasks consume prefetched inputs on the band
+    assert await execution_ref.get_releases() == []
+
+    # prefetched inputs are released when subtasks are dequeued
+    await prefetch_queueing_ref.remove_queued_subtasks(["1"])
+    assert await execution_ref.get_releases() == [["1"]]
+
+    await mo.destroy_actor(prefetch_queueing_ref)
+    await mo.destroy_actor(execution_ref)
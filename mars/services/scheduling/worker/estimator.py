@@ -0,0 +1,102 @@
+# Copyright 1999-2022 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from ...subtask import Subtask
+
+
+class SubtaskMemoryEstimator:
+    """
+    Learns ratios between actual peak memory and statically estimated
+    memory of subtasks from execution history. Ratios are kept per
+    session and keyed by types of operands producing subtask results.
+    """
+
+    def __init__(
+        self,
+        decay: float = 0.5,
+        min_ratio: float = 0.1,
+        max_ratio: float = 10.0,
+        min_sample_size: int = 1 << 20,
+        max_sessions: int = 16,
+    ):
+        self._decay = decay
+        self._min_ratio = min_ratio
+        self._max_ratio = max_ratio
+        self._min_sample_size = min_sample_size
+        self._max_sessions = max_sessions
+
+        # session id -> op type -> learned ratio
+        self._session_ratios: Dict[str, Dict[str, float]] = OrderedDict()
+
+    @staticmethod
+    def get_op_type(subtask: Subtask) -> str:
+        op_types = sorted(
+            {type(c.op).__name__ for c in subtask.chunk_graph.result_chunks}
+        )
+        return ",".join(op_types)
+
+    def get_ratio(self, session_id: str, op_type: str) -> Optional[float]:
+        try:
+            return self._session_ratios[session_id].get(op_type)
+        except KeyError:
+            return None
+
+    def get_ratios(self, session_id: str) -> Dict[str, float]:
+        return dict(self._session_ratios.get(session_id, dict()))
+
+    def estimate(self, session_id: str, op_type: str, calc_size: int) -> int:
+        """
+        Adjust statically estimated memory size with learned ratio,
+        sizes are kept as is when nothing is learned for the op type.
+        """
+        ratio = self.get_ratio(session_id, op_type)
+        if ratio is None:
+            return calc_size
+        return int(calc_size * ratio)
+
+    def update(
+        self, session_id: str, op_type: str, calc_size: int, peak_memory: int
+    ) -> Optional[float]:
+        """
+        Record actual peak memory of a finished subtask, returns the
+        updated ratio, or None if the sample is too small to learn from.
+        """
+        if peak_memory is None or (
+            calc_size < self._min_sample_size and peak_memory < self._min_sample_size
+        ):
+            return None
+        sample = peak_memory / max(calc_size, 1)
+        sample = min(max(sample, self._min_ratio), self._max_ratio)
+
+        try:
+            ratios = self._session_ratios[session_id]
+            self._session_ratios.move_to_end(session_id)
+        except KeyError:
+            ratios = self._session_ratios[session_id] = dict()
+            while len(self._session_ratios) > self._max_sessions:
+                self._session_ratios.popitem(last=False)
+
+        try:
+            ratio = ratios[op_type]
+        except KeyError:
+            ratio = ratios[op_type] = sample
+        else:
+            ratio = ratios[op_type] = self._decay * ratio + (1 - self._decay) * sample
+        return ratio
+
+    def remove_session(self, session_id: str):
+        self._session_ratios.pop(session_id, None)
@@ -20,7 +20,7 @@ import pprint
 import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .... import oscar as mo
 from ....core import ExecutionError
@@ -35,6 +35,7 @@ from ...cluster import ClusterAPI
 from ...meta import MetaAPI
 from ...storage import StorageAPI
 from ...subtask import Subtask, SubtaskAPI, SubtaskResult, SubtaskStatus
+from .estimator import SubtaskMemoryEstimator
 from .workerslot import BandSlotManagerActor
 from .quota import QuotaActor
 
@@ -58,6 +59,16 @@ class SubtaskExecutionInfo:
     kill_timeout: Optional[int] = None
 
 
+@dataslots
+@dataclass
+class SubtaskPrefetchInfo:
+    aio_task: asyncio.Task
+    session_id: str
+    band_name: str
+    data_keys: List
+    expire_task: Optional[asyncio.Task] = None
+
+
 async def _retry_run(
     subtask: Subtask, subtask_info: SubtaskExecutionInfo, target_async_func, *args
 ):
@@ -146,14 +157,30 @@ class SubtaskExecutionActor(mo.StatelessActor):
         subtask_max_retries: int = DEFAULT_SUBTASK_MAX_RETRIES,
         enable_kill_slot: bool = True,
         data_prepare_timeout: int = 600,
+        enable_prefetch: bool = False,
+        memory_estimation_config: Optional[Dict] = None,
     ):
         self._cluster_api = None
         self._global_resource_ref = None
         self._subtask_max_retries = subtask_max_retries
         self._enable_kill_slot = enable_kill_slot
         self._data_prepare_timeout = data_prepare_timeout
+        self._enable_prefetch = enable_prefetch
+
+        memory_estimation_config = dict(memory_estimation_config or dict())
+        if memory_estimation_config.pop("enabled", False):
+            self._memory_estimator = SubtaskMemoryEstimator(**memory_estimation_config)
+        else:
+            self._memory_estimator = None
 
         self._subtask_info = dict()
+        self._prefetch_infos: Dict[str, SubtaskPrefetchInfo] = dict()
+        # (supervisor address, session id, band name) -> finished outcomes
+        # of batched subtasks waiting to be reported
+        self._pending_reports = defaultdict(list)
+        # (supervisor address, session id, band name) -> task reporting
+        # pending outcomes
+        self._report_tasks: Dict[Tuple, asyncio.Task] = dict()
         self._submitted_subtask_count = Metrics.counter(
             "mars.band.submitted_subtask_count",
             "The count of submitted subtasks to the current band.",
@@ -164,6 +191,22 @@ class SubtaskExecutionActor(mo.StatelessActor):
             "The count of finished subtasks of the current band.",
             ("band",),
         )
+        self._prefetch_hit_count = Metrics.counter(
+            "mars.band.prefetch_hit_count",
+            "The count of subtasks whose inputs are prefetched before running.",
+            ("band",),
+        )
+        self._prefetch_miss_count = Metrics.counter(
+            "mars.band.prefetch_miss_count",
+            "The count of subtasks whose inputs are not prefetched before running.",
+            ("band",),
+        )
+        self._subtask_memory_ratio = Metrics.gauge(
+            "mars.band.subtask_memory_ratio",
+            "The learned ratio between actual peak memory and estimated memory "
+            "of subtasks.",
+            ("band", "session_id", "op_type"),
+        )
 
     async def __post_create__(self):
         self._cluster_api = await ClusterAPI.create(self.address)
@@ -180,9 +223,26 @@ class SubtaskExecutionActor(mo.StatelessActor):
     async def _get_band_quota_ref(self, band: str) -> mo.ActorRefType[QuotaActor]:
         return await mo.actor_ref(QuotaActor.gen_uid(band), address=self.address)
 
+    @alru_cache(cache_exceptions=False)
+    async def _get_band_quota_size(self, band: str) -> int:
+        quota_ref = await self._get_band_quota_ref(band)
+        return await quota_ref.get_quota_size()
+
+    @staticmethod
+    def _get_input_data_keys(subtask: Subtask):
+        data_keys = []
+        chunk_key_to_data_keys = get_chunk_key_to_data_keys(subtask.chunk_graph)
+        for chunk in subtask.chunk_graph.iter_indep():
+            if chunk.key in subtask.pure_depend_keys:
+                continue
+            if isinstance(chunk.op, Fetch):
+                data_keys.append(chunk.key)
+            elif isinstance(chunk.op, FetchShuffle):
+                data_keys.extend(chunk_key_to_data_keys[chunk.key])
+        return data_keys
+
     async def _prepare_input_data(self, subtask: Subtask, band_name: str):
         queries = []
-        shuffle_queries = []
         storage_api = await StorageAPI.create(
             subtask.session_id, address=self.address, band_name=band_name
         )
@@ -200,18 +260,13 @@ class SubtaskExecutionActor(mo.StatelessActor):
                 )
             elif isinstance(chunk.op, FetchShuffle):
                 for key in chunk_key_to_data_keys[chunk.key]:
-                    shuffle_queries.append(
+                    queries.append(
                         storage_api.fetch.delay(
                             key, band_name=to_fetch_band, error="ignore"
                         )
                     )
         if queries:
             await storage_api.fetch.batch(*queries)
-        if shuffle_queries:
-            # TODO(hks): The batch method doesn't accept different error arguments,
-            #  combine them when it can.
-
-            await storage_api.fetch.batch(*shuffle_queries)
 
     async def _collect_input_sizes(
         self, subtask: Subtask, supervisor_address: str, band_name: str
@@ -257,6 +312,184 @@ class SubtaskExecutionActor(mo.StatelessActor):
 
         return sizes
 
+    async def _prefetch_input_data(
+        self,
+        session_id: str,
+        subtask_id: str,
+        data_keys: List[str],
+        band_name: str,
+        supervisor_address: str,
+        gpu_keys: List[str] = None,
+    ):
+        try:
+            meta_api = await MetaAPI.create(session_id, address=supervisor_address)
+            metas = await meta_api.get_chunk_meta.batch(
+                *(
+                    meta_api.get_chunk_meta.delay(
+                        k, fields=["store_size", "bands"], error="ignore"
+                    )
+                    for k in data_keys
+                )
+            )
+            # only fetch data not stored in current worker
+            remote_keys, remote_size = [], 0
+            for key, meta in zip(data_keys, metas):
+                if meta is None or any(b[0] == self.address for b in meta["bands"]):
+                    continue
+                remote_keys.append(key)
+                remote_size += meta["store_size"]
+            if not remote_keys:
+                return
+
+            # prefetched data counts into memory quota until the subtask runs,
+            # skip prefetching when the quota cannot be satisfied immediately
+            quota_ref = await self._get_band_quota_ref(band_name)
+            quota_key = (session_id, subtask_id, "prefetch")
+            if not await quota_ref.try_request_batch_quota({quota_key: remote_size}):
+                logger.debug(
+                    "Skip prefetching %d bytes for subtask %s due to lack of quota",
+                    remote_size,
+                    subtask_id,
+                )
+                return
+
+            storage_api = await StorageAPI.create(
+                session_id, address=self.address, band_name=band_name
+            )
+            await storage_api.add_reuse_hints(remote_keys, subtask_id)
+            gpu_keys = set(gpu_keys or ())
+            fetches = []
+            for key in remote_keys:
+                if key in gpu_keys:  # pragma: no cover
+                    fetches.append(
+                        storage_api.fetch.delay(
+                            key, band_name=band_name, error="ignore", pin=False
+                        )
+                    )
+                else:
+                    fetches.append(
+                        storage_api.fetch.delay(
+                            key,
+                            level=StorageLevel.MEMORY,
+                            band_name="numa-0",
+                            error="ignore",
+                            pin=False,
+                        )
+                    )
+            await storage_api.fetch.batch(*fetches)
+            logger.debug("Prefetched %d bytes for subtask %s", remote_size, subtask_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            # prefetch is best-effort, data will be fetched again when running
+            logger.warning(
+                "Failed to prefetch inputs for subtask %s", subtask_id, exc_info=True
+            )
+
+    async def _release_prefetch(self, subtask_id: str, info: SubtaskPrefetchInfo):
+        quota_ref = await self._get_band_quota_ref(info.band_name)
+        await quota_ref.release_quotas(((info.session_id, subtask_id, "prefetch"),))
+
+    async def _wait_prefetch(self, subtask: Subtask):
+        info = self._prefetch_infos.pop(subtask.subtask_id, None)
+        if info is None:
+            if self._enable_prefetch:
+                self._prefetch_miss_count.record(1, {"band": self.address})
+            return
+        if info.expire_task is not None:
+            info.expire_task.cancel()
+        if info.aio_task.done():
+            self._prefetch_hit_count.record(1, {"band": self.address})
+        else:
+            self._prefetch_miss_count.record(1, {"band": self.address})
+        try:
+            await info.aio_task
+        finally:
+            await self._release_prefetch(subtask.subtask_id, info)
+
+    async def release_prefetched_inputs(self, subtask_ids: List[str]):
+        """
+        Release resources held by prefetched inputs of subtasks which
+        are dequeued, cancelled or moved to other bands by supervisors,
+        or not run on this worker in time.
+
+        Parameters
+        ----------
+        subtask_ids: list
+            ids of subtasks whose prefetched inputs are released
+        """
+        for subtask_id in subtask_ids:
+            info = self._prefetch_infos.pop(subtask_id, None)
+            if info is None:
+                continue
+            logger.debug("Release prefetched inputs of subtask %s", subtask_id)
+            if info.expire_task is not None:
+                info.expire_task.cancel()
+            # make sure quota is not requested after released
+            info.aio_task.cancel()
+            try:
+                await info.aio_task
+            except asyncio.CancelledError:
+                pass
+            storage_api = await StorageAPI.create(
+                info.session_id, address=self.address, band_name=info.band_name
+            )
+            await storage_api.remove_reuse_hints(info.data_keys, subtask_id)
+            await self._release_prefetch(subtask_id, info)
+
+    async def prefetch_subtask_inputs(
+        self,
+        session_id: str,
+        subtask_id_to_keys: Dict[str, List[str]],
+        band_name: str,
+        supervisor_address: str,
+        gpu_keys: List[str] = None,
+    ):
+        """
+        Fetch inputs of subtasks queued for the band in advance,
+        thus data transfer can overlap with computation.
+
+        Parameters
+        ----------
+        session_id: str
+            session id
+        subtask_id_to_keys: dict
+            mapping from id of queued subtask to chunk keys of its inputs
+        band_name: str
+            name of band the subtasks queued on
+        supervisor_address: str
+            address of supervisor managing the session
+        gpu_keys: list
+            keys of inputs consumed by gpu operands, which are
+            fetched into storage of the band instead of main memory
+        """
+        for subtask_id, data_keys in subtask_id_to_keys.items():
+            if (
+                not data_keys
+                or subtask_id in self._subtask_info
+                or subtask_id in self._prefetch_infos
+            ):
+                continue
+            aio_task = asyncio.create_task(
+                self._prefetch_input_data(
+                    session_id,
+                    subtask_id,
+                    data_keys,
+                    band_name,
+                    supervisor_address,
+                    gpu_keys=gpu_keys,
+                )
+            )
+            info = self._prefetch_infos[subtask_id] = SubtaskPrefetchInfo(
+                aio_task, session_id, band_name, data_keys
+            )
+            # supervisors release prefetched inputs when subtasks are
+            # dequeued or moved, the expiry is a fallback when the
+            # release message is lost
+            info.expire_task = self.ref().release_prefetched_inputs.tell_delay(
+                [subtask_id], delay=self._data_prepare_timeout
+            )
+
     @classmethod
     def _estimate_sizes(cls, subtask: Subtask, input_sizes: Dict):
         size_context = dict(input_sizes.items())
@@ -336,6 +569,53 @@ class SubtaskExecutionActor(mo.StatelessActor):
                     total_memory_cost -= pop_result_cost
         return sum(t[0] for t in size_context.values()), max_memory_cost
 
+    async def _estimate_quota_size(
+        self, subtask: Subtask, band_name: str, op_type: str, calc_size: int
+    ) -> int:
+        quota_size = self._memory_estimator.estimate(
+            subtask.session_id, op_type, calc_size
+        )
+        if quota_size > calc_size:
+            # learned sizes shall not make requests exceeding capacity
+            band_quota_size = await self._get_band_quota_size(band_name)
+            quota_size = max(calc_size, min(quota_size, band_quota_size))
+        return quota_size
+
+    def _learn_memory_cost(
+        self,
+        subtask: Subtask,
+        band_name: str,
+        op_type: str,
+        calc_size: int,
+        result: SubtaskResult,
+    ):
+        if result.status != SubtaskStatus.succeeded:
+            return
+        ratio = self._memory_estimator.update(
+            subtask.session_id, op_type, calc_size, result.peak_memory
+        )
+        if ratio is None:
+            return
+        logger.debug(
+            "Memory ratio of %s in session %s updated to %.3f by subtask %s, "
+            "estimated size %d, peak memory %d",
+            op_type,
+            subtask.session_id,
+            ratio,
+            subtask.subtask_id,
+            calc_size,
+            result.peak_memory,
+        )
+        self._subtask_memory_ratio.record(
+            ratio,
+            {"band": band_name, "session_id": subtask.session_id, "op_type": op_type},
+        )
+
+    def get_memory_ratios(self, session_id: str) -> Dict[str, float]:
+        if self._memory_estimator is None:
+            return dict()
+        return self._memory_estimator.get_ratios(session_id)
+
     @classmethod
     def _check_cancelling(cls, subtask_info: SubtaskExecutionInfo):
         if subtask_info.cancelling:
@@ -351,7 +631,19 @@ class SubtaskExecutionActor(mo.StatelessActor):
             stage_id=subtask.stage_id,
             status=SubtaskStatus.pending,
         )
+        input_data_keys = self._get_input_data_keys(subtask)
+        hinted_storage_api = None
         try:
+            # let spill strategies know the data will be reused soon
+            storage_api = await StorageAPI.create(
+                subtask.session_id, address=self.address, band_name=band_name
+            )
+            await storage_api.add_reuse_hints(input_data_keys, subtask.subtask_id)
+            hinted_storage_api = storage_api
+
+            if input_data_keys:
+                await self._wait_prefetch(subtask)
+
             logger.debug("Preparing data for subtask %s", subtask.subtask_id)
             prepare_data_task = asyncio.create_task(
                 _retry_run(
@@ -370,16 +662,30 @@ class SubtaskExecutionActor(mo.StatelessActor):
             )
             self._check_cancelling(subtask_info)
 
-            batch_quota_req = {(subtask.session_id, subtask.subtask_id): calc_size}
+            op_type, quota_size = None, calc_size
+            if self._memory_estimator is not None:
+                op_type = self._memory_estimator.get_op_type(subtask)
+                quota_size = await self._estimate_quota_size(
+                    subtask, band_name, op_type, calc_size
+                )
+            batch_quota_req = {(subtask.session_id, subtask.subtask_id): quota_size}
             logger.debug("Start actual running of subtask %s", subtask.subtask_id)
             subtask_info.result = await self._retry_run_subtask(
                 subtask, band_name, subtask_api, batch_quota_req
             )
+            if op_type is not None:
+                self._learn_memory_cost(
+                    subtask, band_name, op_type, calc_size, subtask_info.result
+                )
         except:  # noqa: E722  # pylint: disable=bare-except
             _fill_subtask_result_with_exception(subtask, subtask_info)
         finally:
             # make sure new slot usages are uploaded in time
             try:
+                if hinted_storage_api is not None:
+                    await hinted_storage_api.remove_reuse_hints(
+                        input_data_keys, subtask.subtask_id
+                    )
                 slot_manager_ref = await self._get_slot_manager_ref(band_name)
                 await slot_manager_ref.upload_slot_usages(periodical=False)
             except:  # noqa: E722  # pylint: disable=bare-except
@@ -529,6 +835,91 @@ class SubtaskExecutionActor(mo.StatelessActor):
         logger.debug("Subtask %s finished with result %s", subtask.subtask_id, result)
         return result
 
+    @alru_cache(cache_exceptions=False)
+    async def _get_manager_ref(self, session_id: str, supervisor_address: str):
+        from ..supervisor import SubtaskManagerActor
+
+        return await mo.actor_ref(
+            SubtaskManagerActor.gen_uid(session_id), address=supervisor_address
+        )
+
+    @staticmethod
+    def _get_run_outcome(
+        subtask_id: str, task: asyncio.Task
+    ) -> Tuple[str, Optional[SubtaskResult], Optional[BaseException]]:
+        if task.cancelled():
+            return subtask_id, None, asyncio.CancelledError()
+        elif task.exception() is not None:
+            return subtask_id, None, task.exception()
+        else:
+            return subtask_id, task.result(), None
+
+    async def _report_outcomes(
+        self, session_id: str, supervisor_address: str, band_name: str
+    ) -> bool:
+        # wait for subtasks finished at the same time
+        await asyncio.sleep(0)
+        report_key = (supervisor_address, session_id, band_name)
+        self._report_tasks.pop(report_key, None)
+        outcomes = self._pending_reports.pop(report_key, None)
+        if not outcomes:  # pragma: no cover
+            return True
+        try:
+            manager_ref = await self._get_manager_ref(session_id, supervisor_address)
+            await manager_ref.report_subtask_outcomes.tell(
+                (self.address, band_name), outcomes
+            )
+            return True
+        except (mo.ActorNotExist, OSError):  # pragma: no cover
+            # outcomes are still returned by `run_subtasks`
+            logger.debug("Failed to report outcomes to %s", supervisor_address)
+            return False
+
+    async def run_subtasks(
+        self, subtasks: List[Subtask], band_name: str, supervisor_address: str
+    ) -> List[Tuple[str, Optional[SubtaskResult], Optional[BaseException]]]:
+        """
+        Run a batch of subtasks submitted in one message. Outcomes of
+        subtasks are reported to the supervisor once they finish, with
+        outcomes finished together coalesced into one message, while the
+        call itself returns after all subtasks in the batch finish, with
+        outcomes failed to be reported.
+        """
+        if not subtasks:  # pragma: no cover
+            return []
+        session_id = subtasks[0].session_id
+        report_key = (supervisor_address, session_id, band_name)
+
+        # subtask id -> task reporting its outcome
+        report_tasks = dict()
+
+        def _on_done(subtask_id: str, task: asyncio.Task):
+            outcomes = self._pending_reports[report_key]
+            outcomes.append(self._get_run_outcome(subtask_id, task))
+            if len(outcomes) == 1:
+                self._report_tasks[report_key] = asyncio.create_task(
+                    self._report_outcomes(session_id, supervisor_address, band_name)
+                )
+            report_tasks[subtask_id] = self._report_tasks[report_key]
+
+        tasks = []
+        for subtask in subtasks:
+            task = asyncio.create_task(
+                self.run_subtask(subtask, band_name, supervisor_address)
+            )
+            task.add_done_callback(functools.partial(_on_done, subtask.subtask_id))
+            tasks.append(task)
+        await asyncio.wait(tasks)
+        reported = await asyncio.gather(
+            *(report_tasks[subtask.subtask_id] for subtask in subtasks)
+        )
+        # outcomes already reported are not returned again
+        return [
+            self._get_run_outcome(subtask.subtask_id, task)
+            for subtask, task, is_reported in zip(subtasks, tasks, reported)
+            if not is_reported
+        ]
+
     async def cancel_subtask(self, subtask_id: str, kill_timeout: Optional[int] = 5):
         try:
             subtask_info = self._subtask_info[subtask_id]
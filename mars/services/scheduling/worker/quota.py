@@ -154,6 +154,23 @@ class QuotaActor(mo.Actor):
 
         return waiter()
 
+    async def try_request_batch_quota(self, batch: Dict) -> bool:
+        """
+        Request for resources in a batch without waiting
+        :param batch: the request dict in form {request_key: request_size, ...}
+        :return: True if the request is allocated, otherwise False
+        """
+        sorted_req = sorted(batch.items(), key=lambda tp: tp[0])
+        keys = tuple(tp[0] for tp in sorted_req)
+        quota_sizes = tuple(tp[1] for tp in sorted_req)
+        delta = sum(v - self._allocations.get(k, 0) for k, v in batch.items())
+        # queued requests take precedence
+        if self._requests or not await self._has_space(delta):
+            self._log_allocate("Quota request %r rejected on %s.", batch, self.uid)
+            return False
+        await self.alter_allocations(keys, quota_sizes, allocate=True)
+        return True
+
     async def remove_requests(self, keys: Tuple):
         self._requests.pop(keys, None)
         await self._process_requests()
@@ -208,6 +225,9 @@ class QuotaActor(mo.Actor):
         # get total allocated size, for debug purpose
         return self._total_allocated
 
+    def get_quota_size(self):
+        return self._quota_size
+
     async def alter_allocations(
         self,
         keys: Tuple,
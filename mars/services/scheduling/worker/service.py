@@ -32,7 +32,16 @@ class SchedulingWorkerService(AbstractService):
             "mem_hard_limit": "95%",
             "enable_kill_slot": true,
             "data_prepare_timeout": 600,
-            "subtask_max_retries": 1
+            "subtask_max_retries": 1,
+            "prefetch": {
+                "num_subtasks": 2
+            },
+            "memory_estimation": {
+                "enabled": false,
+                "decay": 0.5,
+                "min_ratio": 0.1,
+                "max_ratio": 10.0
+            }
         }
     }
     """
@@ -55,6 +64,8 @@ class SchedulingWorkerService(AbstractService):
             "subtask_max_retries", DEFAULT_SUBTASK_MAX_RETRIES
         )
         data_prepare_timeout = scheduling_config.get("data_prepare_timeout", 600)
+        prefetch_num = scheduling_config.get("prefetch", {}).get("num_subtasks", 0)
+        memory_estimation_config = scheduling_config.get("memory_estimation", {})
 
         await mo.create_actor(
             WorkerSlotManagerActor,
@@ -76,6 +87,8 @@ class SchedulingWorkerService(AbstractService):
             subtask_max_retries=subtask_max_retries,
             enable_kill_slot=enable_kill_slot,
             data_prepare_timeout=data_prepare_timeout,
+            enable_prefetch=bool(prefetch_num),
+            memory_estimation_config=memory_estimation_config,
             uid=SubtaskExecutionActor.default_uid(),
             address=address,
         )
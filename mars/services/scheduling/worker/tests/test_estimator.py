@@ -0,0 +1,67 @@
+# Copyright 1999-2022 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from .....core import ChunkGraph
+from .....tensor.arithmetic import TensorAdd
+from .....tensor.fetch import TensorFetch
+from ....subtask import Subtask
+from ..estimator import SubtaskMemoryEstimator
+
+
+def _gen_subtask(session_id: str) -> Subtask:
+    inp = TensorFetch().new_chunk([], _key="INPUT")
+    out = TensorAdd(lhs=inp, rhs=1).new_chunk([inp])
+    chunk_graph = ChunkGraph([out])
+    chunk_graph.add_node(inp)
+    chunk_graph.add_node(out)
+    chunk_graph.add_edge(inp, out)
+    return Subtask("test_subtask", session_id=session_id, chunk_graph=chunk_graph)
+
+
+def test_memory_estimator():
+    estimator = SubtaskMemoryEstimator(
+        decay=0.5, min_ratio=0.5, max_ratio=4.0, min_sample_size=1024, max_sessions=2
+    )
+    op_type = estimator.get_op_type(_gen_subtask("session1"))
+    assert op_type == "TensorAdd"
+
+    # nothing learned, sizes are kept
+    assert estimator.estimate("session1", op_type, 10000) == 10000
+    # samples too small are ignored
+    assert estimator.update("session1", op_type, 100, 200) is None
+    assert estimator.update("session1", op_type, 10000, None) is None
+    assert estimator.get_ratio("session1", op_type) is None
+
+    assert estimator.update("session1", op_type, 10000, 20000) == pytest.approx(2.0)
+    assert estimator.update("session1", op_type, 10000, 10000) == pytest.approx(1.5)
+    assert estimator.estimate("session1", op_type, 10000) == 15000
+    # ratios are bounded
+    assert estimator.update("session1", op_type, 10000, 0) == pytest.approx(1.0)
+    assert estimator.update("session1", op_type, 1024, 1 << 30) == pytest.approx(2.5)
+
+    # ratios are isolated between sessions
+    assert estimator.estimate("session2", op_type, 10000) == 10000
+    estimator.update("session2", op_type, 10000, 5000)
+    assert estimator.get_ratios("session2") == {op_type: pytest.approx(0.5)}
+    assert estimator.get_ratios("session1") == {op_type: pytest.approx(2.5)}
+
+    # least recently updated sessions are evicted
+    estimator.update("session3", op_type, 10000, 10000)
+    assert estimator.get_ratios("session1") == dict()
+    assert estimator.get_ratio("session2", op_type) == pytest.approx(0.5)
+
+    estimator.remove_session("session2")
+    assert estimator.get_ratios("session2") == dict()
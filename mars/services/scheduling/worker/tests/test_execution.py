@@ -37,7 +37,7 @@ from .....remote.core import RemoteFunction
 from .....resource import Resource
 from .....tensor.fetch import TensorFetch
 from .....tensor.arithmetic import TensorTreeAdd
-from .....utils import Timer
+from .....utils import Timer, get_next_port
 from ....cluster import MockClusterAPI
 from ....lifecycle import MockLifecycleAPI
 from ....meta import MockMetaAPI, MockWorkerMetaAPI
@@ -286,6 +286,94 @@ async def test_execute_tensor(actor_pool):
     assert result_meta["shape"] == result.shape
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("actor_pool", [(1, True)], indirect=True)
+async def test_prefetch_inputs(actor_pool):
+    pool, session_id, meta_api, worker_meta_api, storage_api, execution_ref = actor_pool
+    quota_ref = await mo.actor_ref(
+        QuotaActor.gen_uid("numa-0"), address=pool.external_address
+    )
+
+    data1 = np.random.rand(10, 10)
+    data2 = np.random.rand(10, 10)
+
+    input1 = TensorFetch(
+        key="input1", source_key="input1", dtype=np.dtype(int)
+    ).new_chunk([])
+    input2 = TensorFetch(
+        key="input2", source_key="input2", dtype=np.dtype(int)
+    ).new_chunk([])
+    result_chunk = TensorTreeAdd(args=[input1, input2]).new_chunk(
+        [input1, input2], shape=data1.shape, dtype=data1.dtype
+    )
+
+    await meta_api.set_chunk_meta(
+        input1,
+        memory_size=data1.nbytes,
+        store_size=data1.nbytes,
+        bands=[(pool.external_address, "numa-0")],
+    )
+    # pretend input2 is stored in another worker, prefetch will fail
+    # as the worker does not exist and inputs will be fetched when running
+    await meta_api.set_chunk_meta(
+        input2,
+        memory_size=data2.nbytes,
+        store_size=data2.nbytes,
+        bands=[(f"127.0.0.1:{get_next_port()}", "numa-0")],
+    )
+    await storage_api.put(input1.key, data1)
+    await storage_api.put(input2.key, data2)
+
+    chunk_graph = ChunkGraph([result_chunk])
+    chunk_graph.add_node(input1)
+    chunk_graph.add_node(input2)
+    chunk_graph.add_node(result_chunk)
+    chunk_graph.add_edge(input1, result_chunk)
+    chunk_graph.add_edge(input2, result_chunk)
+
+    subtask = Subtask("test_subtask", session_id=session_id, chunk_graph=chunk_graph)
+    prefetch_key = (session_id, subtask.subtask_id, "prefetch")
+    await execution_ref.prefetch_subtask_inputs(
+        session_id,
+        {subtask.subtask_id: [input1.key, input2.key]},
+        "numa-0",
+        pool.external_address,
+    )
+    # only remote inputs are counted into quota
+    for _ in range(50):
+        allocations = (await quota_ref.dump_data()).allocations
+        if prefetch_key in allocations:
+            break
+        await asyncio.sleep(0.1)
+    assert allocations[prefetch_key] == data2.nbytes
+
+    await execution_ref.run_subtask(subtask, "numa-0", pool.external_address)
+    result = await storage_api.get(result_chunk.key)
+    np.testing.assert_array_equal(data1 + data2, result)
+
+    # quota for prefetch is released when subtask runs
+    allocations = (await quota_ref.dump_data()).allocations
+    assert prefetch_key not in allocations
+
+    # quota for prefetch is released when supervisor dequeues the subtask
+    subtask2 = Subtask("test_subtask2", session_id=session_id, chunk_graph=chunk_graph)
+    prefetch_key2 = (session_id, subtask2.subtask_id, "prefetch")
+    await execution_ref.prefetch_subtask_inputs(
+        session_id,
+        {subtask2.subtask_id: [input1.key, input2.key]},
+        "numa-0",
+        pool.external_address,
+    )
+    for _ in range(50):
+        allocations = (await quota_ref.dump_data()).allocations
+        if prefetch_key2 in allocations:
+            break
+        await asyncio.sleep(0.1)
+    await execution_ref.release_prefetched_inputs([subtask2.subtask_id])
+    allocations = (await quota_ref.dump_data()).allocations
+    assert prefetch_key2 not in allocations
+
+
 _cancel_phases = [
     "prepare",
     "quota",
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import sys
+from collections import defaultdict
 from typing import Any, List, Tuple, Type, TypeVar, Union
 
 from .... import oscar as mo
@@ -40,6 +42,7 @@ class StorageAPI(AbstractStorageAPI):
         self._address = address
         self._session_id = session_id
         self._band_name = band_name
+        self._use_reuse_hints = None
 
     async def _init(self):
         self._storage_handler_ref = await mo.actor_ref(
@@ -174,6 +177,7 @@ class StorageAPI(AbstractStorageAPI):
         band_name: str = None,
         remote_address: str = None,
         error: str = "raise",
+        pin: bool = True,
     ):
         """
         Fetch object from remote worker or load object from disk.
@@ -191,25 +195,31 @@ class StorageAPI(AbstractStorageAPI):
             remote address that stores the data
         error: str
             raise or ignore
+        pin: bool
+            pin the data to avoid being spilled until unpinned
         """
         await self._storage_handler_ref.fetch_batch(
-            self._session_id, [data_key], level, band_name, remote_address, error
+            self._session_id, [data_key], level, band_name, remote_address, error, pin
         )
 
     @fetch.batch
     async def batch_fetch(self, args_list, kwargs_list):
-        extracted_args = []
-        data_keys = []
+        args_to_data_keys = defaultdict(list)
         for args, kwargs in zip(args_list, kwargs_list):
-            data_key, level, band_name, dest_address, error = self.fetch.bind(
+            data_key, level, band_name, dest_address, error, pin = self.fetch.bind(
                 *args, **kwargs
             )
-            if extracted_args:
-                assert extracted_args == (level, band_name, dest_address, error)
-            extracted_args = (level, band_name, dest_address, error)
-            data_keys.append(data_key)
-        await self._storage_handler_ref.fetch_batch(
-            self._session_id, data_keys, *extracted_args
+            extracted_args = (level, band_name, dest_address, error, pin)
+            args_to_data_keys[extracted_args].append(data_key)
+        # fetches with different arguments are sent as separate batches,
+        # thus transfers of different batches can overlap
+        await asyncio.gather(
+            *(
+                self._storage_handler_ref.fetch_batch(
+                    self._session_id, data_keys, *extracted_args
+                )
+                for extracted_args, data_keys in args_to_data_keys.items()
+            )
         )
 
     @mo.extensible
@@ -228,13 +238,58 @@ class StorageAPI(AbstractStorageAPI):
 
     @unpin.batch
     async def batch_unpin(self, args_list, kwargs_list):
-        unpins = []
+        error_to_data_keys = defaultdict(list)
         for args, kwargs in zip(args_list, kwargs_list):
             data_key, error = self.unpin.bind(*args, **kwargs)
-            unpins.append(
-                self._storage_handler_ref.unpin.delay(self._session_id, data_key, error)
+            error_to_data_keys[error].append(data_key)
+        # the handler only batches unpins with the same error argument,
+        # unpins with different ones are sent in one round trip
+        batch = mo.ActorCallBatch()
+        for error, data_keys in error_to_data_keys.items():
+            batch.add_batch(
+                self._storage_handler_ref,
+                "unpin",
+                [(self._session_id, data_key, error) for data_key in data_keys],
+            )
+        await batch.send()
+
+    async def _check_reuse_hints(self) -> bool:
+        if self._use_reuse_hints is None:
+            self._use_reuse_hints = await self._data_manager_ref.use_reuse_hints()
+        return self._use_reuse_hints
+
+    async def add_reuse_hints(self, data_keys: List, consumer_id: str):
+        """
+        Tell storage that data will be consumed by a scheduled consumer,
+        spill strategies may use the hints to decide which data to spill.
+
+        Parameters
+        ----------
+        data_keys: list
+            data keys to consume
+        consumer_id: str
+            id of the consumer, usually a subtask id
+        """
+        if data_keys and await self._check_reuse_hints():
+            await self._data_manager_ref.add_reuse_hints(
+                self._session_id, data_keys, self._band_name, consumer_id
+            )
+
+    async def remove_reuse_hints(self, data_keys: List, consumer_id: str):
+        """
+        Tell storage that data will not be consumed by the consumer any more.
+
+        Parameters
+        ----------
+        data_keys: list
+            data keys registered by `add_reuse_hints`
+        consumer_id: str
+            id of the consumer, usually a subtask id
+        """
+        if data_keys and await self._check_reuse_hints():
+            await self._data_manager_ref.remove_reuse_hints(
+                self._session_id, data_keys, self._band_name, consumer_id
             )
-        return await self._storage_handler_ref.unpin.batch(*unpins)
 
     async def open_reader(self, data_key: str) -> StorageFileObject:
         """
@@ -195,9 +195,10 @@ class DataManagerActor(mo.Actor):
     _sub_key_to_sub_info: Dict[Tuple, SubInfo]
     _store_key_to_sub_infos: Dict[Tuple, Dict[Tuple, SubInfo]]
 
-    def __init__(self, bands: List):
-        from .spill import FIFOStrategy
+    def __init__(self, bands: List, spill_strategy: str = None):
+        from .spill import get_spill_strategy_type
 
+        strategy_type = get_spill_strategy_type(spill_strategy)
         # mapping key is (session_id, data_key)
         # mapping value is list of InternalDataInfo
         self._bands = bands
@@ -212,10 +213,13 @@ class DataManagerActor(mo.Actor):
         # it records offset and size.
         self._sub_key_to_sub_info = dict()
         self._store_key_to_sub_infos = dict()
+        # sequence to order consumers registered by reuse hints
+        self._reuse_hint_seq = 0
+        self._use_reuse_hints = strategy_type.use_reuse_hints
         for level in StorageLevel.__members__.values():
             for band_name in bands:
                 self._data_info_list[level, band_name] = dict()
-                self._spill_strategy[level, band_name] = FIFOStrategy(level)
+                self._spill_strategy[level, band_name] = strategy_type(level)
 
     @mo.extensible
     def get_data_infos(
@@ -366,6 +370,40 @@ class DataManagerActor(mo.Actor):
                 levels.add(level)
         return list(levels)
 
+    def use_reuse_hints(self) -> bool:
+        return self._use_reuse_hints
+
+    def add_reuse_hints(
+        self,
+        session_id: str,
+        data_keys: List[Union[str, Tuple]],
+        band_name: str,
+        consumer_id: str,
+    ):
+        self._reuse_hint_seq += 1
+        for level in StorageLevel.__members__.values():
+            strategy = self._spill_strategy.get((level, band_name))
+            if strategy is None:  # pragma: no cover
+                continue
+            for data_key in data_keys:
+                strategy.record_reuse_hint(
+                    (session_id, data_key), consumer_id, self._reuse_hint_seq
+                )
+
+    def remove_reuse_hints(
+        self,
+        session_id: str,
+        data_keys: List[Union[str, Tuple]],
+        band_name: str,
+        consumer_id: str,
+    ):
+        for level in StorageLevel.__members__.values():
+            strategy = self._spill_strategy.get((level, band_name))
+            if strategy is None:  # pragma: no cover
+                continue
+            for data_key in data_keys:
+                strategy.remove_reuse_hint((session_id, data_key), consumer_id)
+
     def get_spillable_size(self, level: StorageLevel, band_name: str):
         return self._spill_strategy[level, band_name].get_spillable_size()
 
@@ -382,12 +420,21 @@ class StorageManagerActor(mo.StatelessActor):
     _data_manager: mo.ActorRefType[DataManagerActor]
 
     def __init__(
-        self, storage_configs: Dict, transfer_block_size: int = None, **kwargs
+        self,
+        storage_configs: Dict,
+        transfer_block_size: int = None,
+        spill_strategy: str = None,
+        transfer_channels: int = None,
+        transfer_pipeline_depth: int = None,
+        transfer_compression: str = None,
+        transfer_compression_adaptive: bool = True,
+        **kwargs,
     ):
         from .handler import StorageHandlerActor
 
         self._handler_cls = kwargs.pop("storage_handler_cls", StorageHandlerActor)
         self._storage_configs = storage_configs
+        self._spill_strategy = spill_strategy
         self._all_bands = None
         self._cluster_api = None
         self._upload_task = None
@@ -399,6 +446,10 @@ class StorageManagerActor(mo.StatelessActor):
 
         # transfer config
         self._transfer_block_size = transfer_block_size
+        self._transfer_channels = transfer_channels
+        self._transfer_pipeline_depth = transfer_pipeline_depth
+        self._transfer_compression = transfer_compression
+        self._transfer_compression_adaptive = transfer_compression_adaptive
         self._quotas = None
         self._spill_managers = None
 
@@ -418,6 +469,7 @@ class StorageManagerActor(mo.StatelessActor):
         self._data_manager = await mo.create_actor(
             DataManagerActor,
             self._all_bands,
+            spill_strategy=self._spill_strategy,
             uid=DataManagerActor.default_uid(),
             address=self.address,
         )
@@ -530,6 +582,10 @@ class StorageManagerActor(mo.StatelessActor):
                             band_name,
                             data_manager_ref=self._data_manager,
                             storage_handler_ref=handler_ref,
+                            transfer_channels=self._transfer_channels,
+                            transfer_pipeline_depth=self._transfer_pipeline_depth,
+                            transfer_compression=self._transfer_compression,
+                            transfer_compression_adaptive=self._transfer_compression_adaptive,
                             uid=SenderManagerActor.gen_uid(band_name),
                             address=self.address,
                             allocate_strategy=sender_strategy,
@@ -570,6 +626,10 @@ class StorageManagerActor(mo.StatelessActor):
                     SenderManagerActor,
                     data_manager_ref=self._data_manager,
                     storage_handler_ref=handler_ref,
+                    transfer_channels=self._transfer_channels,
+                    transfer_pipeline_depth=self._transfer_pipeline_depth,
+                    transfer_compression=self._transfer_compression,
+                    transfer_compression_adaptive=self._transfer_compression_adaptive,
                     uid=SenderManagerActor.gen_uid(default_band_name),
                     address=self.address,
                     allocate_strategy=sender_strategy,
@@ -18,6 +18,7 @@ from collections import defaultdict
 from typing import Any, Dict, List, Union
 
 from ... import oscar as mo
+from ...metrics import Metrics
 from ...serialization import AioDeserializer
 from ...storage import StorageLevel, get_storage_backend
 from ...storage.core import StorageFileObject
@@ -65,6 +66,17 @@ class StorageHandlerActor(mo.Actor):
         self._band_name = band_name
         self._supervisor_address = None
 
+        self._spilled_bytes = Metrics.counter(
+            "mars.storage.spilled_bytes",
+            "The bytes of data spilled from the storage level.",
+            ("address", "band", "level"),
+        )
+        self._reloaded_bytes = Metrics.counter(
+            "mars.storage.reloaded_bytes",
+            "The bytes of data read back from the spilled storage level.",
+            ("address", "band", "level"),
+        )
+
     @classmethod
     def gen_uid(cls, band_name: str):
         return f"storage_handler_{band_name}"
@@ -88,7 +100,19 @@ class StorageHandlerActor(mo.Actor):
             level = self.highest_level
         return self._clients[level].is_seekable
 
+    def _record_reloaded(self, data_info: DataInfo):
+        if data_info.level != self.highest_level:
+            self._reloaded_bytes.record(
+                data_info.store_size,
+                {
+                    "address": self.address,
+                    "band": self._band_name,
+                    "level": data_info.level.name,
+                },
+            )
+
     async def _get_data(self, data_info: DataInfo, conditions: List[Any]):
+        self._record_reloaded(data_info)
         if data_info.offset is not None:
             reader = await self._clients[data_info.level].open_reader(
                 data_info.object_id
@@ -170,6 +194,7 @@ class StorageHandlerActor(mo.Actor):
             if data_info is None:
                 results.append(None)
             elif data_info.offset is not None:
+                self._record_reloaded(data_info)
                 reader = object_id_to_reader[data_info.object_id]
                 await reader.seek(data_info.offset)
                 result = await AioDeserializer(reader).run()
@@ -203,14 +228,26 @@ class StorageHandlerActor(mo.Actor):
         await self.request_quota_with_spill(level, size)
         object_info = await self._clients[level].put(obj)
         data_info = build_data_info(object_info, level, size, self._band_name)
-        await self._data_manager_ref.put_data_info(
-            session_id, data_key, data_info, object_info
+        # calls to data manager, quota and spill manager are
+        # sent in one round trip as they are in the same pool
+        batch = mo.ActorCallBatch()
+        batch.add(
+            self._data_manager_ref,
+            "put_data_info",
+            session_id,
+            data_key,
+            data_info,
+            object_info,
         )
         if object_info.size is not None and data_info.memory_size != object_info.size:
-            await self._quota_refs[level].update_quota(
-                object_info.size - data_info.memory_size
+            batch.add(
+                self._quota_refs[level],
+                "update_quota",
+                object_info.size - data_info.memory_size,
             )
-        await self.notify_spillable_space(level)
+        batch.add(self._spill_manager_refs[level], "has_spill_task")
+        has_spill_task = (await batch.send())[-1]
+        await self.notify_spillable_space(level, has_spill_task=has_spill_task)
         return data_info
 
     @put.batch
@@ -248,14 +285,13 @@ class StorageHandlerActor(mo.Actor):
                 # we request memory size before putting, when put finishes,
                 # update quota to the true store size
                 quota_delta += object_info.size - data_info.memory_size
-            put_infos.append(
-                self._data_manager_ref.put_data_info.delay(
-                    session_id, data_key, data_info, object_info
-                )
-            )
-        await self._quota_refs[level].update_quota(quota_delta)
-        await self._data_manager_ref.put_data_info.batch(*put_infos)
-        await self.notify_spillable_space(level)
+            put_infos.append((session_id, data_key, data_info, object_info))
+        batch = mo.ActorCallBatch()
+        batch.add(self._quota_refs[level], "update_quota", quota_delta)
+        batch.add_batch(self._data_manager_ref, "put_data_info", put_infos)
+        batch.add(self._spill_manager_refs[level], "has_spill_task")
+        has_spill_task = (await batch.send())[-1]
+        await self.notify_spillable_space(level, has_spill_task=has_spill_task)
         return data_infos
 
     async def delete_object(
@@ -530,6 +566,7 @@ class StorageHandlerActor(mo.Actor):
         band_name: str,
         address: str,
         error: str,
+        pin: bool = True,
     ):
         if error not in ("raise", "ignore"):  # pragma: no cover
             raise ValueError("error must be raise or ignore")
@@ -552,7 +589,7 @@ class StorageHandlerActor(mo.Actor):
             if info is not None:
                 if band_name and band_name != info.band:
                     missing_keys.append(data_key)
-                else:
+                elif pin:
                     pin_delays.append(
                         self._data_manager_ref.pin.delay(
                             session_id, data_key, self._band_name
@@ -629,8 +666,10 @@ class StorageHandlerActor(mo.Actor):
                 "Spill is triggered, request %s bytes of %s finished", size, level
             )
 
-    async def notify_spillable_space(self, level):
-        if await self._spill_manager_refs[level].has_spill_task():
+    async def notify_spillable_space(self, level, has_spill_task: bool = None):
+        if has_spill_task is None:
+            has_spill_task = await self._spill_manager_refs[level].has_spill_task()
+        if has_spill_task:
             total, used = await self._quota_refs[level].get_quota()
             tasks = []
             if total is not None:
@@ -648,7 +687,7 @@ class StorageHandlerActor(mo.Actor):
         from .spill import spill
 
         try:
-            await spill(
+            spilled_size = await spill(
                 request_size, level, self._band_name, self._data_manager_ref, self
             )
         except NoDataToSpill:
@@ -656,7 +695,13 @@ class StorageHandlerActor(mo.Actor):
                 "No data to spill %s bytes, waiting more space", request_size
             )
             size = await self._spill_manager_refs[level].wait_for_space(object_size)
-            await spill(size, level, self._band_name, self._data_manager_ref, self)
+            spilled_size = await spill(
+                size, level, self._band_name, self._data_manager_ref, self
+            )
+        self._spilled_bytes.record(
+            spilled_size,
+            {"address": self.address, "band": self._band_name, "level": level.name},
+        )
 
     async def list(self, level: StorageLevel) -> List:
         return await self._data_manager_ref.list(level, self._band_name)
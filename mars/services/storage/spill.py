@@ -16,7 +16,7 @@ import asyncio
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import List, Tuple
+from typing import Any, Iterable, List, Tuple, Type
 
 from ... import oscar as mo
 from ...storage import StorageLevel
@@ -30,6 +30,9 @@ DEFAULT_SPILL_BLOCK_SIZE = 128 * 1024
 
 
 class SpillStrategy(ABC):
+    # whether the strategy needs hints of scheduled consumers
+    use_reuse_hints = False
+
     @abstractmethod
     def record_put_info(self, key, data_size: int):
         """
@@ -48,6 +51,22 @@ class SpillStrategy(ABC):
         Return sizes and keys for spilling according to spill size
         """
 
+    def record_access_info(self, key):
+        """
+        Record that the data is accessed by a consumer
+        """
+
+    def record_reuse_hint(self, key, consumer_id: Any, seq: int):
+        """
+        Record that the data will be consumed by a scheduled consumer,
+        `seq` increases with the order consumers are scheduled
+        """
+
+    def remove_reuse_hint(self, key, consumer_id: Any):
+        """
+        Record that a scheduled consumer does not need the data any more
+        """
+
 
 class FIFOStrategy(SpillStrategy):
     def __init__(self, level: StorageLevel):
@@ -84,11 +103,17 @@ class FIFOStrategy(SpillStrategy):
                 total_size += data_size
         return total_size
 
+    def _iter_spill_candidates(self) -> Iterable[Tuple[Any, int]]:
+        """
+        Iterate (key, size) pairs in the order they should be spilled
+        """
+        return self._data_sizes.items()
+
     def get_spill_keys(self, size: int) -> Tuple[List, List]:
         spill_sizes = []
         spill_keys = []
         spill_size = 0
-        for data_key, data_size in self._data_sizes.items():
+        for data_key, data_size in self._iter_spill_candidates():
             if spill_size >= size:
                 break
             if data_key in self._pinned_keys:
@@ -114,6 +139,111 @@ class FIFOStrategy(SpillStrategy):
         return spill_sizes, spill_keys
 
 
+class SizeAwareLRUStrategy(FIFOStrategy):
+    """
+    Size-aware LRU / LFU strategy implemented with GreedyDual-Size-Frequency.
+    Every object gets a priority of `clock + access_count / size`, objects
+    with lowest priorities are spilled first and the clock is raised to the
+    priority of the last spilled object, thus large objects and objects
+    not accessed recently are spilled earlier.
+    """
+
+    def __init__(self, level: StorageLevel):
+        super().__init__(level)
+        self._clock = 0.0
+        self._access_counts = dict()
+        self._priorities = dict()
+
+    def _update_priority(self, key):
+        size = max(self._data_sizes.get(key, 1), 1)
+        self._priorities[key] = self._clock + self._access_counts.get(key, 1) / size
+
+    def record_put_info(self, key, data_size: int):
+        super().record_put_info(key, data_size)
+        self._access_counts[key] = self._access_counts.get(key, 0) + 1
+        self._update_priority(key)
+
+    def record_delete_info(self, key):
+        super().record_delete_info(key)
+        self._access_counts.pop(key, None)
+        self._priorities.pop(key, None)
+
+    def record_access_info(self, key):
+        if key not in self._data_sizes:
+            return
+        self._access_counts[key] += 1
+        self._update_priority(key)
+
+    def pin_data(self, key):
+        super().pin_data(key)
+        self.record_access_info(key)
+
+    def _iter_spill_candidates(self) -> Iterable[Tuple[Any, int]]:
+        for key in sorted(self._priorities, key=self._priorities.__getitem__):
+            yield key, self._data_sizes[key]
+
+    def get_spill_keys(self, size: int) -> Tuple[List, List]:
+        spill_sizes, spill_keys = super().get_spill_keys(size)
+        if spill_keys:
+            self._clock = max(self._priorities[k] for k in spill_keys)
+        return spill_sizes, spill_keys
+
+
+class ReuseDistanceStrategy(FIFOStrategy):
+    """
+    Belady-style strategy which spills data with longest reuse distance.
+    Data without any scheduled consumers are spilled first in FIFO order,
+    then data whose earliest scheduled consumer comes latest.
+    """
+
+    use_reuse_hints = True
+
+    def __init__(self, level: StorageLevel):
+        super().__init__(level)
+        # mapping from data key to {consumer_id: seq}
+        self._consumers = defaultdict(dict)
+
+    def record_reuse_hint(self, key, consumer_id: Any, seq: int):
+        self._consumers[key][consumer_id] = seq
+
+    def remove_reuse_hint(self, key, consumer_id: Any):
+        consumers = self._consumers.get(key)
+        if consumers is None:
+            return
+        consumers.pop(consumer_id, None)
+        if not consumers:
+            del self._consumers[key]
+
+    def _iter_spill_candidates(self) -> Iterable[Tuple[Any, int]]:
+        reused = []
+        for key, size in self._data_sizes.items():
+            consumers = self._consumers.get(key)
+            if not consumers:
+                yield key, size
+            else:
+                reused.append((min(consumers.values()), key, size))
+        reused.sort(key=lambda t: t[0], reverse=True)
+        for _, key, size in reused:
+            yield key, size
+
+
+_spill_strategy_types = {
+    "fifo": FIFOStrategy,
+    "lru": SizeAwareLRUStrategy,
+    "reuse_distance": ReuseDistanceStrategy,
+}
+
+
+def get_spill_strategy_type(name: str) -> Type[FIFOStrategy]:
+    try:
+        return _spill_strategy_types[name or "fifo"]
+    except KeyError:
+        raise ValueError(
+            f"Unknown spill strategy {name}, "
+            f"available strategies: {list(_spill_strategy_types)}"
+        ) from None
+
+
 class SpillManagerActor(mo.StatelessActor):
     """
     The actor to handle the race condition when NoDataToSpill happens.
@@ -207,3 +337,4 @@ async def spill(
             logger.debug("Data %s %s is deleted during spill", session_id, key)
             await storage_handler.delete(session_id, key, error="ignore")
     logger.debug("Spill finishes, release %s bytes of %s", sum(spill_sizes), level)
+    return sum(spill_sizes)
@@ -234,3 +234,107 @@ async def test_spill_event(create_actors_with_delay):
     disk_object_list = await storage_handler1.list(StorageLevel.DISK)
     assert len(memory_object_list) == 1
     assert len(disk_object_list) == 1
+
+
+def test_spill_strategies():
+    from ..errors import NoDataToSpill
+    from ..spill import (
+        FIFOStrategy,
+        ReuseDistanceStrategy,
+        SizeAwareLRUStrategy,
+        get_spill_strategy_type,
+    )
+
+    assert get_spill_strategy_type(None) is FIFOStrategy
+    assert get_spill_strategy_type("lru") is SizeAwareLRUStrategy
+    assert get_spill_strategy_type("reuse_distance") is ReuseDistanceStrategy
+    with pytest.raises(ValueError):
+        get_spill_strategy_type("unknown")
+
+    # fifo spills the oldest data
+    strategy = FIFOStrategy(StorageLevel.MEMORY)
+    for i in range(4):
+        strategy.record_put_info(f"k{i}", 10)
+    strategy.pin_data("k0")
+    assert strategy.get_spillable_size() == 30
+    assert strategy.get_spill_keys(15) == ([10, 10], ["k1", "k2"])
+    with pytest.raises(NoDataToSpill):
+        strategy.get_spill_keys(15)
+
+    # size-aware lru spills large and cold data first
+    strategy = SizeAwareLRUStrategy(StorageLevel.MEMORY)
+    strategy.record_put_info("small", 10)
+    strategy.record_put_info("large", 100)
+    strategy.record_put_info("hot", 100)
+    strategy.record_access_info("hot")
+    strategy.record_access_info("hot")
+    assert strategy.get_spill_keys(10) == ([100], ["large"])
+    # frequently accessed data is kept longer
+    strategy.record_put_info("new", 100)
+    assert strategy.get_spill_keys(10) == ([100], ["new"])
+    strategy.record_delete_info("new")
+    assert strategy.get_spill_keys(10) == ([100], ["hot"])
+    assert strategy.get_spill_keys(10) == ([10], ["small"])
+
+    # reuse distance spills data without consumers,
+    # then data whose consumers come latest
+    strategy = ReuseDistanceStrategy(StorageLevel.MEMORY)
+    for i in range(4):
+        strategy.record_put_info(f"k{i}", 10)
+    strategy.record_reuse_hint("k0", "subtask1", 1)
+    strategy.record_reuse_hint("k1", "subtask2", 2)
+    strategy.record_reuse_hint("k2", "subtask3", 3)
+    strategy.record_reuse_hint("k2", "subtask1", 1)
+    assert strategy.get_spill_keys(10) == ([10], ["k3"])
+    assert strategy.get_spill_keys(10) == ([10], ["k1"])
+    strategy.remove_reuse_hint("k2", "subtask1")
+    strategy.remove_reuse_hint("k2", "subtask3")
+    assert strategy.get_spill_keys(10) == ([10], ["k2"])
+
+
+@pytest.fixture
+async def create_actors_with_strategy(actor_pool, request):
+    storage_configs = _build_storage_config()
+    manager_ref = await mo.create_actor(
+        StorageManagerActor,
+        storage_configs,
+        spill_strategy=request.param,
+        uid=StorageManagerActor.default_uid(),
+        address=actor_pool.external_address,
+    )
+
+    yield actor_pool.external_address
+    await mo.destroy_actor(manager_ref)
+
+
+@pytest.mark.parametrize(
+    "create_actors_with_strategy", ["lru", "reuse_distance"], indirect=True
+)
+@pytest.mark.asyncio
+async def test_spill_with_strategy(create_actors_with_strategy):
+    from ..api import StorageAPI
+
+    worker_address = create_actors_with_strategy
+    session_id = "mock_session"
+    storage_api = await StorageAPI.create(session_id, worker_address)
+
+    # keys with scheduled consumers are kept in memory
+    await storage_api.add_reuse_hints(["mock_key_0", "mock_key_1"], "subtask")
+
+    data_list = []
+    for i in range(10):
+        data = np.random.randint(0, 10000, (8000,), np.int16)
+        await storage_api.put(f"mock_key_{i}", data)
+        data_list.append(data)
+
+    memory_object_list = await storage_api.list(StorageLevel.MEMORY)
+    disk_object_list = await storage_api.list(StorageLevel.DISK)
+    assert len(memory_object_list) == 3
+    assert len(disk_object_list) == 7
+    if create_actors_with_strategy == "reuse_distance":
+        memory_keys = set(k for _, k in memory_object_list)
+        assert {"mock_key_0", "mock_key_1"}.issubset(memory_keys)
+    await storage_api.remove_reuse_hints(["mock_key_0", "mock_key_1"], "subtask")
+
+    for i, data in enumerate(data_list):
+        np.testing.assert_array_equal(data, await storage_api.get(f"mock_key_{i}"))
@@ -59,8 +59,9 @@ async def actor_pools():
 
 
 @pytest.fixture
-async def create_actors(actor_pools):
+async def create_actors(actor_pools, request):
     worker_pool_1, worker_pool_2 = actor_pools
+    transfer_config = getattr(request, "param", None) or dict()
 
     if sys.platform == "darwin":
         plasma_dir = "/tmp"
@@ -76,6 +77,7 @@ async def create_actors(actor_pools):
     manager_ref1 = await mo.create_actor(
         StorageManagerActor,
         storage_configs,
+        **transfer_config,
         uid=StorageManagerActor.default_uid(),
         address=worker_pool_1.external_address,
     )
@@ -83,6 +85,7 @@ async def create_actors(actor_pools):
     manager_ref2 = await mo.create_actor(
         StorageManagerActor,
         storage_configs,
+        **transfer_config,
         uid=StorageManagerActor.default_uid(),
         address=worker_pool_2.external_address,
     )
@@ -320,3 +323,123 @@ async def test_transfer_same_data(create_actors):
     await asyncio.gather(task1, task2)
     get_data1 = await storage_handler2.get(session_id, "data_key1")
     np.testing.assert_array_equal(data1, get_data1)
+
+
+@pytest.mark.parametrize(
+    "create_actors",
+    [
+        dict(transfer_pipeline_depth=2),
+        dict(transfer_channels=2, transfer_pipeline_depth=2),
+        dict(transfer_channels=3),
+        dict(transfer_compression="lz4"),
+        dict(transfer_channels=2, transfer_compression="lz4"),
+    ],
+    indirect=True,
+)
+@pytest.mark.asyncio
+async def test_pipelined_transfer(create_actors):
+    worker_address_1, worker_address_2 = create_actors
+
+    session_id = "mock_session"
+    data_list = [np.random.rand(50 * (i + 1), 10) for i in range(4)]
+    data_keys = [f"data_key{i}" for i in range(len(data_list))]
+    storage_handler1 = await mo.actor_ref(
+        uid=StorageHandlerActor.gen_uid("numa-0"), address=worker_address_1
+    )
+    storage_handler2 = await mo.actor_ref(
+        uid=StorageHandlerActor.gen_uid("numa-0"), address=worker_address_2
+    )
+    for data_key, data in zip(data_keys, data_list):
+        await storage_handler1.put(session_id, data_key, data, StorageLevel.MEMORY)
+
+    sender_actor = await mo.actor_ref(
+        address=worker_address_1, uid=SenderManagerActor.gen_uid("numa-0")
+    )
+    await sender_actor.send_batch_data(
+        session_id, data_keys, worker_address_2, StorageLevel.MEMORY, block_size=1000
+    )
+    for data_key, data in zip(data_keys, data_list):
+        get_data = await storage_handler2.get(session_id, data_key)
+        np.testing.assert_array_equal(data, get_data)
+
+
+# test for blocks received concurrently and out of order
+class MockReceiverManagerActor3(ReceiverManagerActor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._n_receiving = 0
+        self._max_receiving = 0
+
+    async def receive_part_data(self, *args, **kwargs):
+        self._n_receiving += 1
+        self._max_receiving = max(self._max_receiving, self._n_receiving)
+        try:
+            await asyncio.sleep(np.random.rand() * 0.1)
+            return await super().receive_part_data(*args, **kwargs)
+        finally:
+            self._n_receiving -= 1
+
+    def get_max_receiving(self):
+        return self._max_receiving
+
+
+class MockSenderManagerActor3(SenderManagerActor):
+    @staticmethod
+    async def get_receiver_ref(address: str, band_name: str):
+        return await mo.actor_ref(
+            address=address, uid=MockReceiverManagerActor3.default_uid()
+        )
+
+
+@pytest.mark.asyncio
+async def test_transfer_in_flight_blocks(create_actors):
+    worker_address_1, worker_address_2 = create_actors
+
+    quota_refs = {
+        StorageLevel.MEMORY: await mo.actor_ref(
+            StorageQuotaActor,
+            StorageLevel.MEMORY,
+            5 * 1024 * 1024,
+            address=worker_address_2,
+            uid=StorageQuotaActor.gen_uid("numa-0", StorageLevel.MEMORY),
+        )
+    }
+    data_manager_ref = await mo.actor_ref(
+        uid=DataManagerActor.default_uid(), address=worker_address_1
+    )
+    storage_handler1 = await mo.actor_ref(
+        uid=StorageHandlerActor.gen_uid("numa-0"), address=worker_address_1
+    )
+    storage_handler2 = await mo.actor_ref(
+        uid=StorageHandlerActor.gen_uid("numa-0"), address=worker_address_2
+    )
+
+    sender_actor = await mo.create_actor(
+        MockSenderManagerActor3,
+        data_manager_ref=data_manager_ref,
+        transfer_pipeline_depth=3,
+        uid=MockSenderManagerActor3.default_uid(),
+        address=worker_address_1,
+        allocate_strategy=IdleLabel("io", "mock_sender"),
+    )
+    receiver_actor = await mo.create_actor(
+        MockReceiverManagerActor3,
+        quota_refs,
+        uid=MockReceiverManagerActor3.default_uid(),
+        address=worker_address_2,
+        allocate_strategy=IdleLabel("io", "mock_receiver"),
+    )
+
+    data_list = [np.random.rand(100 * (i + 1), 10) for i in range(2)]
+    data_keys = [f"data_key{i}" for i in range(len(data_list))]
+    for data_key, data in zip(data_keys, data_list):
+        await storage_handler1.put("mock", data_key, data, StorageLevel.MEMORY)
+
+    await sender_actor.send_batch_data(
+        "mock", data_keys, worker_address_2, StorageLevel.MEMORY, block_size=1000
+    )
+    # several blocks are sent before former ones are written
+    assert 1 < await receiver_actor.get_max_receiving() <= 3
+    for data_key, data in zip(data_keys, data_list):
+        get_data = await storage_handler2.get("mock", data_key)
+        np.testing.assert_array_equal(data, get_data)
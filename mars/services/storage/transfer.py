@@ -14,22 +14,113 @@
 
 import asyncio
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from ... import oscar as mo
 from ...lib.aio import alru_cache
+from ...lib.compression import BlockCompressor, decompress_block
 from ...storage import StorageLevel
 from ...utils import dataslots
 from .core import DataManagerActor, WrappedStorageFileObject
 from .handler import StorageHandlerActor
 
 DEFAULT_TRANSFER_BLOCK_SIZE = 4 * 1024**2
+DEFAULT_TRANSFER_CHANNELS = 1
+DEFAULT_TRANSFER_PIPELINE_DEPTH = 0
 
 
 logger = logging.getLogger(__name__)
 
 
+class _BufferedSender:
+    def __init__(
+        self,
+        receiver_ref: mo.ActorRefType["ReceiverManagerActor"],
+        session_id: str,
+        block_size: int,
+        compressor: Optional[BlockCompressor] = None,
+        max_in_flight: int = 1,
+    ):
+        self._receiver_ref = receiver_ref
+        self._session_id = session_id
+        self._block_size = block_size
+        self._compressor = compressor
+
+        self._buffers = []
+        self._send_keys = []
+        self._eof_marks = []
+        self._part_indexes = []
+        self._key_to_n_parts = defaultdict(lambda: 0)
+
+        # blocks sent but not written by the receiver yet
+        self._max_in_flight = max_in_flight
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._send_tasks = set()
+
+    async def _send_part_data(self, buffers, send_keys, eof_marks, part_indexes):
+        try:
+            if self._compressor is not None:
+                buffers = await asyncio.to_thread(
+                    lambda: [self._compressor.compress(b) if b else b for b in buffers]
+                )
+            await self._receiver_ref.receive_part_data(
+                buffers,
+                self._session_id,
+                send_keys,
+                eof_marks,
+                compressed=self._compressor is not None,
+                part_indexes=part_indexes,
+            )
+        finally:
+            self._in_flight.release()
+
+    async def _send_buffered(self):
+        if not self._buffers:
+            return
+        args = (self._buffers, self._send_keys, self._eof_marks, self._part_indexes)
+        self._buffers = []
+        self._send_keys = []
+        self._eof_marks = []
+        self._part_indexes = []
+
+        await self._in_flight.acquire()
+        if self._max_in_flight == 1:
+            return await self._send_part_data(*args)
+        # raise errors in former sends as early as possible
+        for task in [t for t in self._send_tasks if t.done()]:
+            self._send_tasks.remove(task)
+            if task.exception() is not None:
+                self._in_flight.release()
+                raise task.exception()
+        self._send_tasks.add(asyncio.create_task(self._send_part_data(*args)))
+
+    async def flush(self):
+        await self._send_buffered()
+        send_tasks, self._send_tasks = self._send_tasks, set()
+        try:
+            await asyncio.gather(*send_tasks)
+        finally:
+            for task in send_tasks:
+                if not task.done():
+                    task.cancel()
+
+    def cancel(self):
+        for task in self._send_tasks:
+            task.cancel()
+        self._send_tasks = set()
+
+    async def send(self, buffer, eof_mark, key):
+        self._eof_marks.append(eof_mark)
+        self._buffers.append(buffer)
+        self._send_keys.append(key)
+        self._part_indexes.append(self._key_to_n_parts[key])
+        self._key_to_n_parts[key] += 1
+        if sum(len(b) for b in self._buffers) >= self._block_size:
+            await self._send_buffered()
+
+
 class SenderManagerActor(mo.StatelessActor):
     def __init__(
         self,
@@ -37,11 +128,26 @@ class SenderManagerActor(mo.StatelessActor):
         transfer_block_size: int = None,
         data_manager_ref: mo.ActorRefType[DataManagerActor] = None,
         storage_handler_ref: mo.ActorRefType[StorageHandlerActor] = None,
+        transfer_channels: int = None,
+        transfer_pipeline_depth: int = None,
+        transfer_compression: str = None,
+        transfer_compression_adaptive: bool = True,
     ):
         self._band_name = band_name
         self._data_manager_ref = data_manager_ref
         self._storage_handler = storage_handler_ref
         self._transfer_block_size = transfer_block_size or DEFAULT_TRANSFER_BLOCK_SIZE
+        self._transfer_channels = transfer_channels or DEFAULT_TRANSFER_CHANNELS
+        self._transfer_pipeline_depth = (
+            transfer_pipeline_depth or DEFAULT_TRANSFER_PIPELINE_DEPTH
+        )
+        self._compressor = (
+            BlockCompressor(
+                transfer_compression, adaptive=transfer_compression_adaptive
+            )
+            if transfer_compression
+            else None
+        )
 
     @classmethod
     def gen_uid(cls, band_name: str):
@@ -60,6 +166,14 @@ class SenderManagerActor(mo.StatelessActor):
             address=address, uid=ReceiverManagerActor.gen_uid(band_name)
         )
 
+    async def _open_readers(self, session_id: str, data_keys: List[str]):
+        open_reader_tasks = []
+        for data_key in data_keys:
+            open_reader_tasks.append(
+                self._storage_handler.open_reader.delay(session_id, data_key)
+            )
+        return await self._storage_handler.open_reader.batch(*open_reader_tasks)
+
     async def _send_data(
         self,
         receiver_ref: mo.ActorRefType["ReceiverManagerActor"],
@@ -67,36 +181,10 @@ class SenderManagerActor(mo.StatelessActor):
         data_keys: List[str],
         block_size: int,
     ):
-        class BufferedSender:
-            def __init__(self):
-                self._buffers = []
-                self._send_keys = []
-                self._eof_marks = []
-
-            async def flush(self):
-                if self._buffers:
-                    await receiver_ref.receive_part_data(
-                        self._buffers, session_id, self._send_keys, self._eof_marks
-                    )
-
-                self._buffers = []
-                self._send_keys = []
-                self._eof_marks = []
-
-            async def send(self, buffer, eof_mark, key):
-                self._eof_marks.append(eof_mark)
-                self._buffers.append(buffer)
-                self._send_keys.append(key)
-                if sum(len(b) for b in self._buffers) >= block_size:
-                    await self.flush()
-
-        sender = BufferedSender()
-        open_reader_tasks = []
-        for data_key in data_keys:
-            open_reader_tasks.append(
-                self._storage_handler.open_reader.delay(session_id, data_key)
-            )
-        readers = await self._storage_handler.open_reader.batch(*open_reader_tasks)
+        sender = _BufferedSender(
+            receiver_ref, session_id, block_size, compressor=self._compressor
+        )
+        readers = await self._open_readers(session_id, data_keys)
 
         for data_key, reader in zip(data_keys, readers):
             while True:
@@ -115,6 +203,99 @@ class SenderManagerActor(mo.StatelessActor):
                     break
         await sender.flush()
 
+    def _split_channels(
+        self, data_keys: List[str], data_sizes: List[int]
+    ) -> List[List[str]]:
+        # assign larger data first to the channel with least data,
+        # every data key is sent within one channel to keep its blocks ordered
+        n_channels = min(self._transfer_channels, len(data_keys))
+        channel_keys = [[] for _ in range(n_channels)]
+        channel_sizes = [0] * n_channels
+        for data_size, data_key in sorted(
+            zip(data_sizes, data_keys), key=lambda t: t[0], reverse=True
+        ):
+            idx = channel_sizes.index(min(channel_sizes))
+            channel_keys[idx].append(data_key)
+            channel_sizes[idx] += data_size
+        return channel_keys
+
+    async def _send_channel_data(
+        self,
+        receiver_ref: mo.ActorRefType["ReceiverManagerActor"],
+        session_id: str,
+        keys_and_readers: List[Tuple],
+        block_size: int,
+    ):
+        # blocks read ahead are queued, thus reading the next block can
+        # be overlapped with sending the previous ones, and at most
+        # `transfer_pipeline_depth` blocks are sent before written
+        depth = max(self._transfer_pipeline_depth, 1)
+        queue = asyncio.Queue(maxsize=depth)
+
+        async def read_blocks():
+            try:
+                for data_key, reader in keys_and_readers:
+                    while True:
+                        part_data = await reader.read(block_size)
+                        is_eof = not part_data
+                        await queue.put((part_data, is_eof, data_key))
+                        if is_eof:
+                            break
+            except Exception:
+                # stop sending, the error is raised when awaiting the task
+                await queue.put(None)
+                raise
+            await queue.put(None)
+
+        sender = _BufferedSender(
+            receiver_ref,
+            session_id,
+            block_size,
+            compressor=self._compressor,
+            max_in_flight=depth,
+        )
+        read_task = asyncio.create_task(read_blocks())
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                await sender.send(*item)
+            await read_task
+            await sender.flush()
+        finally:
+            if not read_task.done():
+                read_task.cancel()
+            sender.cancel()
+
+    async def _send_data_pipelined(
+        self,
+        receiver_ref: mo.ActorRefType["ReceiverManagerActor"],
+        session_id: str,
+        data_keys: List[str],
+        data_sizes: List[int],
+        block_size: int,
+    ):
+        readers = await self._open_readers(session_id, data_keys)
+        key_to_reader = dict(zip(data_keys, readers))
+        channel_tasks = [
+            asyncio.create_task(
+                self._send_channel_data(
+                    receiver_ref,
+                    session_id,
+                    [(data_key, key_to_reader[data_key]) for data_key in keys],
+                    block_size,
+                )
+            )
+            for keys in self._split_channels(data_keys, data_sizes)
+        ]
+        try:
+            await asyncio.gather(*channel_tasks)
+        finally:
+            for task in channel_tasks:
+                if not task.done():
+                    task.cancel()
+
     @mo.extensible
     async def send_batch_data(
         self,
@@ -178,14 +359,24 @@ class SenderManagerActor(mo.StatelessActor):
             session_id, data_keys, data_sizes, level, sub_infos
         )
         to_send_keys = []
+        to_send_sizes = []
         to_wait_keys = []
-        for data_key, is_transferring in zip(data_keys, is_transferring_list):
+        for data_key, data_size, is_transferring in zip(
+            data_keys, data_sizes, is_transferring_list
+        ):
             if is_transferring:
                 to_wait_keys.append(data_key)
             else:
                 to_send_keys.append(data_key)
+                to_send_sizes.append(data_size)
 
-        if to_send_keys:
+        if to_send_keys and (
+            self._transfer_pipeline_depth > 0 or self._transfer_channels > 1
+        ):
+            await self._send_data_pipelined(
+                receiver_ref, session_id, to_send_keys, to_send_sizes, block_size
+            )
+        elif to_send_keys:
             await self._send_data(receiver_ref, session_id, to_send_keys, block_size)
         if to_wait_keys:
             await receiver_ref.wait_transfer_done(session_id, to_wait_keys)
@@ -214,6 +405,10 @@ class WritingInfo:
     level: StorageLevel
     event: asyncio.Event
     ref_counts: int
+    # parts of one data key may be received concurrently,
+    # writers wait on the condition till former parts are written
+    part_written: asyncio.Condition = None
+    n_written_parts: int = 0
 
 
 class ReceiverManagerActor(mo.StatelessActor):
@@ -271,7 +466,12 @@ class ReceiverManagerActor(mo.StatelessActor):
             )
             for data_key, writer in zip(tasks, writers):
                 self._writing_infos[(session_id, data_key)] = WritingInfo(
-                    writer, data_key_to_size[data_key], level, asyncio.Event(), 1
+                    writer,
+                    data_key_to_size[data_key],
+                    level,
+                    asyncio.Event(),
+                    1,
+                    asyncio.Condition(),
                 )
                 if key_to_sub_infos[data_key] is not None:
                     writer._sub_key_infos = key_to_sub_infos[data_key]
@@ -297,17 +497,52 @@ class ReceiverManagerActor(mo.StatelessActor):
                 future.cancel()
                 raise
 
+    async def _write_part(
+        self, session_id: str, data_key: str, data, part_index: Optional[int]
+    ) -> bool:
+        info = self._writing_infos[(session_id, data_key)]
+        if part_index is None:
+            if data:
+                await info.writer.write(data)
+            return True
+        async with info.part_written:
+            # stop writing if the transfer is cancelled and cleaned up
+            await info.part_written.wait_for(
+                lambda: info.n_written_parts == part_index
+                or self._writing_infos.get((session_id, data_key)) is not info
+            )
+            if self._writing_infos.get((session_id, data_key)) is not info:
+                return False
+            if data:
+                await info.writer.write(data)
+            info.n_written_parts += 1
+            info.part_written.notify_all()
+        return True
+
     async def do_write(
-        self, data: list, session_id: str, data_keys: List[str], eof_marks: List[bool]
+        self,
+        data: list,
+        session_id: str,
+        data_keys: List[str],
+        eof_marks: List[bool],
+        compressed: bool = False,
+        part_indexes: List[int] = None,
     ):
+        if compressed:
+            data = await asyncio.to_thread(
+                lambda: [decompress_block(d) if d else d for d in data]
+            )
+        part_indexes = part_indexes or [None] * len(data_keys)
         # close may be a high-cost operation, use create_task
         close_tasks = []
         finished_keys = []
-        for data, data_key, is_eof in zip(data, data_keys, eof_marks):
-            writer = self._writing_infos[(session_id, data_key)].writer
-            if data:
-                await writer.write(data)
+        for data, data_key, is_eof, part_index in zip(
+            data, data_keys, eof_marks, part_indexes
+        ):
+            if not await self._write_part(session_id, data_key, data, part_index):
+                return
             if is_eof:
+                writer = self._writing_infos[(session_id, data_key)].writer
                 close_tasks.append(writer.close())
                 finished_keys.append(data_key)
         await asyncio.gather(*close_tasks)
@@ -318,10 +553,23 @@ class ReceiverManagerActor(mo.StatelessActor):
                 self._decref_writing_key(session_id, data_key)
 
     async def receive_part_data(
-        self, data: list, session_id: str, data_keys: List[str], eof_marks: List[bool]
+        self,
+        data: list,
+        session_id: str,
+        data_keys: List[str],
+        eof_marks: List[bool],
+        compressed: bool = False,
+        part_indexes: List[int] = None,
     ):
         write_task = asyncio.create_task(
-            self.do_write(data, session_id, data_keys, eof_marks)
+            self.do_write(
+                data,
+                session_id,
+                data_keys,
+                eof_marks,
+                compressed=compressed,
+                part_indexes=part_indexes,
+            )
         )
         try:
             await asyncio.shield(write_task)
@@ -338,6 +586,9 @@ class ReceiverManagerActor(mo.StatelessActor):
                             await info.writer.clean_up()
                             info.event.set()
                             self._decref_writing_key(session_id, data_key)
+                            # wake up writes of later parts in flight
+                            async with info.part_written:
+                                info.part_written.notify_all()
                             write_task.cancel()
                             await write_task
             raise
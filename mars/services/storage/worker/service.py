@@ -26,7 +26,21 @@ class StorageWorkerService(AbstractService):
     {
         "storage": {
             "backends": ["plasma"],
+            "default_config": {
+                "transfer_block_size": "<block size>",
+                "transfer_channels": "<number of parallel channels>",
+                "transfer_pipeline_depth": "<number of blocks in flight per channel>",
+                "transfer_compression": "lz4 | zstd | null",
+                "transfer_compression_adaptive": "<skip incompressible blocks>",
+                "spill_strategy": "fifo | lru | reuse_distance",
+            },
             "<storage backend name>"： "<setup params>",
+            "disk": {
+                "root_dirs": "<root directories>",
+                "compression": "lz4 | zstd | null",
+                "compression_adaptive": "<skip incompressible blocks>",
+                "mmap_read": "<read local files via memory mapping>",
+            },
         }
     }
     """
@@ -36,6 +50,13 @@ class StorageWorkerService(AbstractService):
         backends = storage_configs.get("backends")
         options = storage_configs.get("default_config", dict())
         transfer_block_size = options.get("transfer_block_size", None)
+        spill_strategy = options.get("spill_strategy", None)
+        transfer_channels = options.get("transfer_channels", None)
+        transfer_pipeline_depth = options.get("transfer_pipeline_depth", None)
+        transfer_compression = options.get("transfer_compression", None)
+        transfer_compression_adaptive = options.get(
+            "transfer_compression_adaptive", True
+        )
         backend_config = {}
         for backend in backends:
             storage_config = storage_configs.get(backend, dict())
@@ -66,6 +87,11 @@ class StorageWorkerService(AbstractService):
             StorageManagerActor,
             backend_config,
             transfer_block_size,
+            spill_strategy=spill_strategy,
+            transfer_channels=transfer_channels,
+            transfer_pipeline_depth=transfer_pipeline_depth,
+            transfer_compression=transfer_compression,
+            transfer_compression_adaptive=transfer_compression_adaptive,
             uid=StorageManagerActor.default_uid(),
             address=self._address,
         )
@@ -184,6 +184,8 @@ class SubtaskResult(Serializable):
     # The following is the execution information of the subtask
     execution_start_time: float = Float64Field("execution_start_time")
     execution_end_time: float = Float64Field("execution_end_time")
+    # peak memory in bytes used by the slot process during execution
+    peak_memory: int = Int64Field("peak_memory", default=None)
 
     def update(self, result: Optional["SubtaskResult"]):
         if result and result.bands:
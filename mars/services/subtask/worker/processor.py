@@ -13,12 +13,15 @@
 # limitations under the License.
 
 import asyncio
+import contextvars
 import logging
 import sys
 import time
 from collections import defaultdict
 from typing import Any, Dict, List, Optional, Set, Type, Tuple
 
+import psutil
+
 from .... import oscar as mo
 from ....core import ChunkGraph, OperandType, enter_mode, ExecutionError
 from ....core.context import get_context
@@ -44,22 +47,23 @@ from ..utils import iter_input_data_keys, iter_output_data, get_mapper_data_keys
 logger = logging.getLogger(__name__)
 
 
-class ProcessorContext(dict):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._current_chunk = None
+# chunk being executed, kept in context variables as
+# operands in one subtask may be executed concurrently
+_current_chunk = contextvars.ContextVar("current_chunk", default=None)
+
 
+class ProcessorContext(dict):
     def __getattr__(self, attr):
         ctx = get_context()
         return getattr(ctx, attr)
 
     def set_current_chunk(self, chunk: ChunkType):
         """Set current executing chunk."""
-        self._current_chunk = chunk
+        _current_chunk.set(chunk)
 
     def get_current_chunk(self) -> ChunkType:
         """Get current executing chunk."""
-        return self._current_chunk
+        return _current_chunk.get()
 
 
 BASIC_META_FIELDS = ["memory_size", "store_size", "bands", "object_ref"]
@@ -114,6 +118,9 @@ class SubtaskProcessor:
         self._processor_context = ProcessorContext()
         # chunk key to real data keys
         self._chunk_key_to_data_keys = dict()
+        # process and its rss before execution to measure peak memory
+        self._process = psutil.Process()
+        self._base_rss = None
 
         # other service APIs
         self._session_api = session_api
@@ -191,6 +198,17 @@ class SubtaskProcessor:
         get_context().set_running_operand_key(self._session_id, op.key)
         return asyncio.to_thread(self._execute_operand, ctx, op)
 
+    def _record_peak_memory(self):
+        try:
+            rss = self._process.memory_info().rss
+        except psutil.Error:  # pragma: no cover
+            return
+        if self._base_rss is None:
+            self._base_rss = rss
+        self.result.peak_memory = max(
+            self.result.peak_memory or 0, rss - self._base_rss
+        )
+
     def set_op_progress(self, op_key: str, progress: float):
         if op_key in self._op_progress:  # pragma: no branch
             self._op_progress[op_key] = progress
@@ -205,93 +223,157 @@ class SubtaskProcessor:
             # wrap exception in execution to avoid side effects
             raise ExecutionError(ex).with_traceback(ex.__traceback__) from None
 
-    async def _execute_graph(self, chunk_graph: ChunkGraph):
+    def _get_parallelism(self) -> int:
+        resource = self.subtask.required_resource
+        if resource is None or resource.num_gpus > 0:
+            return 1
+        return max(int(resource.num_cpus), 1)
+
+    async def _execute_chunk(self, chunk: ChunkType):
         loop = asyncio.get_running_loop()
-        ref_counts = self._init_ref_counts()
+        if chunk.key not in self._processor_context:
+            # since `op.execute` may be a time-consuming operation,
+            # we make it run in a thread pool to not block current thread.
+            logger.debug(
+                "Start executing operand: %s, chunk: %s, subtask id: %s",
+                chunk.op,
+                chunk,
+                self.subtask.subtask_id,
+            )
+            self._processor_context.set_current_chunk(chunk)
+            future = asyncio.create_task(
+                await self._async_execute_operand(self._processor_context, chunk.op)
+            )
+            to_wait = loop.create_future()
 
-        # from data_key to results
-        for chunk in chunk_graph.topological_iter():
-            if chunk.key not in self._processor_context:
-                # since `op.execute` may be a time-consuming operation,
-                # we make it run in a thread pool to not block current thread.
+            def cb(fut):
+                if not to_wait.done():
+                    if fut.exception():
+                        to_wait.set_exception(fut.exception())
+                    else:
+                        to_wait.set_result(fut.result())
+
+            future.add_done_callback(cb)
+
+            try:
+                await to_wait
+                self._record_peak_memory()
                 logger.debug(
-                    "Start executing operand: %s, chunk: %s, subtask id: %s",
+                    "Finish executing operand: %s, chunk: %s, subtask id: %s",
                     chunk.op,
                     chunk,
                     self.subtask.subtask_id,
                 )
-                self._processor_context.set_current_chunk(chunk)
-                future = asyncio.create_task(
-                    await self._async_execute_operand(self._processor_context, chunk.op)
+            except asyncio.CancelledError:
+                logger.debug(
+                    "Receive cancel instruction for operand: %s,"
+                    "chunk: %s, subtask id: %s",
+                    chunk.op,
+                    chunk,
+                    self.subtask.subtask_id,
                 )
-                to_wait = loop.create_future()
-
-                def cb(fut):
-                    if not to_wait.done():
-                        if fut.exception():
-                            to_wait.set_exception(fut.exception())
-                        else:
-                            to_wait.set_result(fut.result())
-
-                future.add_done_callback(cb)
-
-                try:
-                    await to_wait
-                    logger.debug(
-                        "Finish executing operand: %s, chunk: %s, subtask id: %s",
-                        chunk.op,
-                        chunk,
-                        self.subtask.subtask_id,
-                    )
-                except asyncio.CancelledError:
-                    logger.debug(
-                        "Receive cancel instruction for operand: %s,"
-                        "chunk: %s, subtask id: %s",
-                        chunk.op,
-                        chunk,
-                        self.subtask.subtask_id,
-                    )
-                    # wait for this computation to finish
-                    await future
-                    # if cancelled, stop next computation
-                    logger.debug(
-                        "Cancelled operand: %s, chunk: %s, subtask id: %s",
-                        chunk.op,
-                        chunk,
-                        self.subtask.subtask_id,
-                    )
-                    self.result.status = SubtaskStatus.cancelled
-                    raise
+                # wait for this computation to finish
+                await future
+                # if cancelled, stop next computation
+                logger.debug(
+                    "Cancelled operand: %s, chunk: %s, subtask id: %s",
+                    chunk.op,
+                    chunk,
+                    self.subtask.subtask_id,
+                )
+                self.result.status = SubtaskStatus.cancelled
+                raise
 
-            self.set_op_progress(chunk.op.key, 1.0)
+        self.set_op_progress(chunk.op.key, 1.0)
 
-            for inp in chunk_graph.iter_predecessors(chunk):
-                ref_counts[inp.key] -= 1
-                if ref_counts[inp.key] == 0:
-                    # ref count reaches 0, remove it
-                    for key in self._chunk_key_to_data_keys[inp.key]:
-                        if key in self._processor_context:
-                            del self._processor_context[key]
+    def _release_inputs(
+        self, chunk_graph: ChunkGraph, chunk: ChunkType, ref_counts: Dict[str, int]
+    ):
+        for inp in chunk_graph.iter_predecessors(chunk):
+            ref_counts[inp.key] -= 1
+            if ref_counts[inp.key] == 0:
+                # ref count reaches 0, remove it
+                for key in self._chunk_key_to_data_keys[inp.key]:
+                    if key in self._processor_context:
+                        del self._processor_context[key]
+
+    async def _execute_graph(self, chunk_graph: ChunkGraph):
+        ref_counts = self._init_ref_counts()
+        parallelism = self._get_parallelism()
+        if parallelism <= 1:
+            for chunk in chunk_graph.topological_iter():
+                await self._execute_chunk(chunk)
+                self._release_inputs(chunk_graph, chunk, ref_counts)
+            return
+
+        # execute operands whose inputs are ready concurrently
+        # when the subtask owns more than one cpu
+        semaphore = asyncio.Semaphore(parallelism)
+
+        async def execute_chunk(c: ChunkType):
+            async with semaphore:
+                await self._execute_chunk(c)
+
+        n_waiting_inputs = dict()
+        ready_chunks = []
+        for chunk in chunk_graph.topological_iter():
+            n_waiting_inputs[chunk.key] = chunk_graph.count_predecessors(chunk)
+            if n_waiting_inputs[chunk.key] == 0:
+                ready_chunks.append(chunk)
+
+        # chunks sharing one operand are produced by a single execution
+        op_key_to_tasks = dict()
+        task_to_chunks = defaultdict(list)
+        running = set()
+        try:
+            while ready_chunks or running:
+                finished_chunks = []
+                for chunk in ready_chunks:
+                    task = op_key_to_tasks.get(chunk.op.key)
+                    if task is None:
+                        task = op_key_to_tasks[chunk.op.key] = asyncio.create_task(
+                            execute_chunk(chunk)
+                        )
+                        running.add(task)
+                    if task.done():
+                        finished_chunks.append(chunk)
+                    else:
+                        task_to_chunks[task].append(chunk)
+                ready_chunks = []
+
+                if not finished_chunks:
+                    done, running = await asyncio.wait(
+                        running, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        task.result()
+                        finished_chunks.extend(task_to_chunks.pop(task))
+
+                for chunk in finished_chunks:
+                    self._release_inputs(chunk_graph, chunk, ref_counts)
+                    for succ in chunk_graph.iter_successors(chunk):
+                        n_waiting_inputs[succ.key] -= 1
+                        if n_waiting_inputs[succ.key] == 0:
+                            ready_chunks.append(succ)
+        finally:
+            # running operands cannot be interrupted, wait for them
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.wait(running)
 
     async def _unpin_data(self, data_keys):
         # unpin input keys
         unpins = []
-        shuffle_unpins = []
         for key in data_keys:
             if isinstance(key, tuple):
                 # a tuple key means it's a shuffle key,
                 # some shuffle data is None and not stored in storage
-                shuffle_unpins.append(
-                    self._storage_api.unpin.delay(key, error="ignore")
-                )
+                unpins.append(self._storage_api.unpin.delay(key, error="ignore"))
             else:
                 unpins.append(self._storage_api.unpin.delay(key))
         if unpins:
             await self._storage_api.unpin.batch(*unpins)
-        if shuffle_unpins:
-            # TODO(hks): The batch method doesn't accept different error arguments,
-            #  combine them when it can.
-            await self._storage_api.unpin.batch(*shuffle_unpins)
 
     async def _store_data(self, chunk_graph: ChunkGraph):
         # store data into storage
@@ -561,6 +643,7 @@ class SubtaskProcessor:
             }
 
             # load inputs data
+            self._record_peak_memory()
             input_keys = await self._load_input_data()
             try:
                 # execute chunk graph
@@ -629,6 +712,7 @@ class SubtaskProcessor:
     async def report_progress_periodically(self, interval=0.5, eps=0.001):
         last_progress = self.result.progress
         while not self.result.status.is_done:
+            self._record_peak_memory()
             size = self._actual_chunk_count
             progress = sum(self._op_progress.values()) / size
             assert progress <= 1
@@ -152,6 +152,31 @@ async def test_subtask_success(actor_pool):
     assert await subtask_runner.is_runner_free() is True
 
 
+@pytest.mark.asyncio
+async def test_parallel_subtask(actor_pool):
+    pool, session_id, meta_api, storage_api, manager = actor_pool
+
+    raw = np.random.rand(10, 10)
+    a = mt.tensor(raw, chunk_size=10)
+    q, r = mt.linalg.qr(a)
+    b = q.dot(r) + a * 2 + (a + 1).sum(axis=0)
+
+    subtask = _gen_subtask(b, session_id)
+    # independent operands executed concurrently
+    subtask.required_resource = Resource(num_cpus=2)
+    subtask_runner: SubtaskRunnerRef = await mo.actor_ref(
+        SubtaskRunnerActor.gen_uid("numa-0", 0), address=pool.external_address
+    )
+    await subtask_runner.run_subtask(subtask)
+    result = await subtask_runner.get_subtask_result()
+    assert result.status == SubtaskStatus.succeeded
+
+    expected = raw * 3 + (raw + 1).sum(axis=0)
+    result_key = subtask.chunk_graph.results[0].key
+    result = await storage_api.get(result_key)
+    np.testing.assert_allclose(expected, result)
+
+
 @pytest.mark.asyncio
 async def test_shuffle_subtask(actor_pool):
     pool, session_id, meta_api, storage_api, manager = actor_pool
@@ -291,6 +316,39 @@ async def test_subtask_op_progress(actor_pool):
     assert result.progress == 1.0
 
 
+@pytest.mark.asyncio
+async def test_parallel_subtask_op_progress(actor_pool):
+    pool, session_id, meta_api, storage_api, manager = actor_pool
+    subtask_runner: SubtaskRunnerRef = await mo.actor_ref(
+        SubtaskRunnerActor.gen_uid("numa-0", 0), address=pool.external_address
+    )
+
+    def progress_sleep(delay: float, progress: float, interval: float):
+        time.sleep(delay)
+        get_context().set_progress(progress)
+        time.sleep(interval)
+
+    a = mr.spawn(progress_sleep, args=(0.2, 0.5, 2.0))
+    b = mr.spawn(progress_sleep, args=(0.4, 0.25, 0.4))
+    c = mr.spawn(lambda *_: None, args=(a, b))
+
+    subtask = _gen_subtask(c, session_id)
+    subtask.required_resource = Resource(num_cpus=2)
+    aio_task = asyncio.create_task(subtask_runner.run_subtask(subtask))
+    try:
+        await asyncio.sleep(1.5)
+        # progress of every operand is reported against itself
+        # even if operands are executed concurrently
+        result = await subtask_runner.get_subtask_result()
+        assert result.progress == pytest.approx((0.5 + 1.0) / 3)
+    finally:
+        await aio_task
+
+    result = await subtask_runner.get_subtask_result()
+    assert result.status == SubtaskStatus.succeeded
+    assert result.progress == 1.0
+
+
 def test_update_subtask_result():
     subtask_result = SubtaskResult(
         subtask_id="test_subtask_abc",
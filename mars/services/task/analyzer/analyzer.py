@@ -15,9 +15,9 @@
 import itertools
 import logging
 from collections import deque, defaultdict
-from typing import Dict, List, Tuple, Type, Union
+from typing import Dict, List, Optional, Tuple, Type, Union
 
-from ....config import Config
+from ....config import Config, options
 from ....core import ChunkGraph, ChunkType, enter_mode
 from ....core.operand import (
     Fetch,
@@ -29,12 +29,14 @@ from ....core.operand import (
     ShuffleFetchType,
 )
 from ....lib.ordered_set import OrderedSet
+from ....metrics import Metrics
 from ....resource import Resource
 from ....typing import BandType, OperandType
-from ....utils import build_fetch, build_fetch_shuffle, tokenize
+from ....utils import Timer, build_fetch, build_fetch_shuffle, tokenize
 from ...subtask import SubtaskGraph, Subtask
 from ..core import Task, new_task_id, MapReduceInfo
 from .assigner import AbstractGraphAssigner, GraphAssigner
+from .cache import AnalysisTemplate, get_analysis_cache
 from .fusion import Coloring
 
 logger = logging.getLogger(__name__)
@@ -94,6 +96,12 @@ class GraphAnalyzer:
         self._chunk_to_copied = dict()
         self._logic_key_generator = LogicKeyGenerator()
 
+        self._analysis_time = Metrics.gauge(
+            "mars.subtask_graph_analysis_time_secs",
+            "Time consuming in seconds to assign and color a chunk graph",
+            ("session_id", "task_id", "stage_id", "cache_hit"),
+        )
+
     @classmethod
     def next_map_reduce_id(cls) -> int:
         return next(cls._map_reduce_id)
@@ -374,18 +382,9 @@ class GraphAnalyzer:
         )
         self._map_reduce_id_to_infos[map_reduce_id] = map_reduce_info
 
-    @enter_mode(build=True)
-    def gen_subtask_graph(
+    def _assign_and_color(
         self, op_to_bands: Dict[str, BandType] = None
-    ) -> SubtaskGraph:
-        """
-        Analyze chunk graph and generate subtask graph.
-
-        Returns
-        -------
-        subtask_graph: SubtaskGraph
-            Subtask graph.
-        """
+    ) -> Tuple[Dict[ChunkType, BandType], Dict[ChunkType, int]]:
         # reassign worker when specified reassign_worker = True
         # or it's a reducer operands
         reassign_worker_ops = [
@@ -440,21 +439,11 @@ class GraphAnalyzer:
             for start_op in start_ops:
                 for start_chunk in op_key_to_chunks[start_op.key]:
                     init_chunk_to_bands[start_chunk] = chunk_to_bands[start_chunk]
-            if (
-                self._has_shuffle
-                and self._shuffle_fetch_type == ShuffleFetchType.FETCH_BY_INDEX
-            ):
-                # ensure no shuffle mapper chunks fused into same subtask.
-                initial_same_color_num = 1
-            else:
-                initial_same_color_num = getattr(
-                    self._config, "initial_same_color_num", None
-                )
             coloring = Coloring(
                 self._chunk_graph,
                 list(self._band_resource),
                 init_chunk_to_bands,
-                initial_same_color_num=initial_same_color_num,
+                initial_same_color_num=self._get_initial_same_color_num(),
                 as_broadcaster_successor_num=getattr(
                     self._config, "as_broadcaster_successor_num", None
                 ),
@@ -475,13 +464,6 @@ class GraphAnalyzer:
             if not isinstance(chunk.op, Fetch):
                 color_to_chunks[color].append(chunk)
 
-        # gen subtask graph
-        subtask_graph = SubtaskGraph()
-        chunk_to_fetch_chunk = dict()
-        chunk_to_subtask = self._chunk_to_subtasks
-        # states
-        visited = set()
-        logic_key_to_subtasks = defaultdict(list)
         if self._shuffle_fetch_type == ShuffleFetchType.FETCH_BY_INDEX:
             for chunk in self._chunk_graph.topological_iter():
                 if not isinstance(chunk.op, ShuffleProxy):
@@ -508,6 +490,145 @@ class GraphAnalyzer:
                             mapper_color = coloring.next_color()
                             chunk_to_colors[mapper] = mapper_color
                             color_to_chunks[mapper_color] = [mapper]
+        return chunk_to_bands, chunk_to_colors
+
+    def _get_initial_same_color_num(self) -> Optional[int]:
+        if (
+            self._has_shuffle
+            and self._shuffle_fetch_type == ShuffleFetchType.FETCH_BY_INDEX
+        ):
+            # ensure no shuffle mapper chunks fused into same subtask.
+            return 1
+        else:
+            return getattr(self._config, "initial_same_color_num", None)
+
+    def _gen_fingerprint(
+        self,
+        chunks: List[ChunkType],
+        chunk_to_pos: Dict[ChunkType, int],
+        op_to_bands: Dict[str, BandType] = None,
+    ) -> Tuple:
+        """
+        Generate structural fingerprint of the chunk graph, which contains
+        everything affecting assignment and coloring except keys of chunks.
+        """
+        op_to_bands = op_to_bands or dict()
+        op_key_to_pos = dict()
+        chunk_items = []
+        for chunk in chunks:
+            op = chunk.op
+            op_pos = op_key_to_pos.setdefault(op.key, len(op_key_to_pos))
+            hint = op.scheduling_hint
+            chunk_items.append(
+                (
+                    type(op),
+                    op.stage,
+                    op_pos,
+                    tuple(
+                        chunk_to_pos[pred]
+                        for pred in self._chunk_graph.iter_predecessors(chunk)
+                    ),
+                    op.gpu,
+                    op.priority,
+                    op.expect_worker,
+                    op.expect_band,
+                    need_reassign_worker(op),
+                    hint.can_be_fused() if hint is not None else None,
+                    chunk.is_mapper,
+                    op_to_bands.get(op.key),
+                )
+            )
+        band_slots = tuple(
+            (band, resource.num_cpus, resource.num_gpus)
+            for band, resource in self._band_resource.items()
+        )
+        return (
+            tuple(chunk_items),
+            band_slots,
+            self._fuse_enabled,
+            self._shuffle_fetch_type,
+            self._get_initial_same_color_num(),
+            getattr(self._config, "as_broadcaster_successor_num", None),
+            options.combine_size,
+            self._graph_assigner_cls,
+        )
+
+    def _analyze_with_cache(
+        self, op_to_bands: Dict[str, BandType] = None
+    ) -> Tuple[Dict[ChunkType, BandType], Dict[ChunkType, int]]:
+        cache = get_analysis_cache(
+            getattr(self._config, "subtask_graph_cache_size", None)
+        )
+        cache_hit = False
+        with Timer() as timer:
+            if cache is None:
+                chunk_to_bands, chunk_to_colors = self._assign_and_color(op_to_bands)
+            else:
+                # order of nodes in graph is decided by the way graph built,
+                # while topological order may vary among identical graphs
+                chunks = list(self._chunk_graph)
+                chunk_to_pos = {c: i for i, c in enumerate(chunks)}
+                fingerprint = self._gen_fingerprint(chunks, chunk_to_pos, op_to_bands)
+                template = cache.get(fingerprint)
+                if template is not None:
+                    # rebind results onto chunks of current graph
+                    cache_hit = True
+                    chunk_to_bands = {
+                        chunks[pos]: band for pos, band in template.pos_to_bands.items()
+                    }
+                    chunk_to_colors = {
+                        c: template.colors[chunk_to_pos[c]]
+                        for c in self._chunk_graph.topological_iter()
+                    }
+                else:
+                    chunk_to_bands, chunk_to_colors = self._assign_and_color(
+                        op_to_bands
+                    )
+                    template = AnalysisTemplate(
+                        pos_to_bands={
+                            chunk_to_pos[c]: band
+                            for c, band in chunk_to_bands.items()
+                            if c in chunk_to_pos
+                        },
+                        colors=tuple(chunk_to_colors[c] for c in chunks),
+                    )
+                    cache.put(fingerprint, template)
+        self._analysis_time.record(
+            timer.duration,
+            {
+                "session_id": self._task.session_id,
+                "task_id": self._task.task_id,
+                "stage_id": self._stage_id,
+                "cache_hit": str(cache_hit),
+            },
+        )
+        return chunk_to_bands, chunk_to_colors
+
+    @enter_mode(build=True)
+    def gen_subtask_graph(
+        self, op_to_bands: Dict[str, BandType] = None
+    ) -> SubtaskGraph:
+        """
+        Analyze chunk graph and generate subtask graph.
+
+        Returns
+        -------
+        subtask_graph: SubtaskGraph
+            Subtask graph.
+        """
+        chunk_to_bands, chunk_to_colors = self._analyze_with_cache(op_to_bands)
+        color_to_chunks = defaultdict(list)
+        for chunk, color in chunk_to_colors.items():
+            if not isinstance(chunk.op, Fetch):
+                color_to_chunks[color].append(chunk)
+
+        # gen subtask graph
+        subtask_graph = SubtaskGraph()
+        chunk_to_fetch_chunk = dict()
+        chunk_to_subtask = self._chunk_to_subtasks
+        # states
+        visited = set()
+        logic_key_to_subtasks = defaultdict(list)
         for chunk in self._chunk_graph.topological_iter():
             if chunk in visited or isinstance(chunk.op, Fetch):
                 # skip fetch chunk
@@ -15,7 +15,7 @@
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from operator import itemgetter
-from typing import List, Dict, Union
+from typing import List, Dict, Tuple
 
 import numpy as np
 
@@ -79,6 +79,10 @@ class AbstractGraphAssigner(ABC):
 
 
 class GraphAssigner(AbstractGraphAssigner):
+    # levels of breath-first search narrower than this
+    # are processed without array operations
+    _vectorize_threshold = 64
+
     def __init__(
         self,
         chunk_graph: ChunkGraph,
@@ -135,49 +139,157 @@ class GraphAssigner(AbstractGraphAssigner):
     @classmethod
     def _assign_by_bfs(
         cls,
-        undirected_chunk_graph: ChunkGraph,
-        start: ChunkData,
+        undirected_chunk_graph: Tuple[np.ndarray, np.ndarray],
+        start: int,
         band: BandType,
         initial_sizes: Dict[BandType, int],
         spread_limits: Dict[BandType, float],
-        key_to_assign: OrderedSet,
-        assigned_record: Dict[str, Union[str, BandType]],
-    ):
+        chunk_op_ids: np.ndarray,
+        op_to_assign: np.ndarray,
+        op_assigned: np.ndarray,
+        visit_marks: np.ndarray,
+        visit_mark: int,
+    ) -> np.ndarray:
         """
         Assign initial nodes using breath-first search given initial sizes and
         limitations of spread range.
+
+        Chunks and operands are represented by integer ids, the search
+        proceeds level by level over the CSR adjacency and visits nodes in
+        the same order as `DAG.bfs` does. Wide levels are processed with
+        array operations, while narrow ones are iterated directly to
+        avoid overhead of NumPy calls. Ids of operands recorded for the
+        band are returned in visiting order.
         """
         if initial_sizes[band] <= 0:
-            return
+            return np.empty(0, dtype=np.int64)
+
+        indptr, indices = undirected_chunk_graph
+        spread_limit = spread_limits[band]
+        initial_size = initial_sizes[band]
 
         assigned = 0
         spread_range = 0
-        for chunk in undirected_chunk_graph.bfs(start=start, visit_predicate="all"):
-            op_key = chunk.op.key
-            if op_key in assigned_record:
-                continue
-            spread_range += 1
-            # `op_key` may not be in `key_to_assign`,
-            # but we need to record it to avoid iterate the node repeatedly.
-            assigned_record[op_key] = band
-            if op_key not in key_to_assign:
-                continue
-            assigned += 1
-            if spread_range >= spread_limits[band] or assigned >= initial_sizes[band]:
+        assigned_op_ids = []
+        frontier = np.array([start], dtype=np.int64)
+        visit_marks[start] = visit_mark
+        stopped = False
+        while frontier.size > 0:
+            op_ids = chunk_op_ids[frontier]
+            if op_ids.size < cls._vectorize_threshold:
+                level_op_ids = []
+                for op_id in op_ids.tolist():
+                    if op_assigned[op_id]:
+                        continue
+                    spread_range += 1
+                    # `op_id` may not be in `op_to_assign`, but we need
+                    # to record it to avoid iterate the node repeatedly.
+                    op_assigned[op_id] = True
+                    level_op_ids.append(op_id)
+                    if not op_to_assign[op_id]:
+                        continue
+                    assigned += 1
+                    if spread_range >= spread_limit or assigned >= initial_size:
+                        stopped = True
+                        break
+                assigned_op_ids.append(np.asarray(level_op_ids, dtype=np.int64))
+            else:
+                # operands already assigned are skipped, and chunks of
+                # the same operand are only counted once
+                op_ids = op_ids[~op_assigned[op_ids]]
+                _, first_idx = np.unique(op_ids, return_index=True)
+                op_ids = op_ids[np.sort(first_idx)]
+                to_assign = op_to_assign[op_ids]
+                spread_ranges = spread_range + np.arange(1, op_ids.size + 1)
+                assigned_nums = assigned + np.cumsum(to_assign)
+                stops = to_assign & (
+                    (spread_ranges >= spread_limit) | (assigned_nums >= initial_size)
+                )
+                stopped = bool(stops.any())
+                last = int(stops.argmax()) if stopped else op_ids.size - 1
+                if last >= 0:
+                    op_ids = op_ids[: last + 1]
+                    spread_range = int(spread_ranges[last])
+                    assigned = int(assigned_nums[last])
+                    op_assigned[op_ids] = True
+                    assigned_op_ids.append(op_ids)
+            if stopped:
                 break
+
+            # gather unvisited neighbors of the frontier in order
+            if frontier.size < cls._vectorize_threshold:
+                next_frontier = []
+                for node in frontier.tolist():
+                    for neighbor in indices[indptr[node] : indptr[node + 1]].tolist():
+                        if visit_marks[neighbor] != visit_mark:
+                            visit_marks[neighbor] = visit_mark
+                            next_frontier.append(neighbor)
+                frontier = np.asarray(next_frontier, dtype=np.int64)
+            else:
+                starts = indptr[frontier]
+                lengths = indptr[frontier + 1] - starts
+                offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+                neighbors = indices[offsets + np.arange(offsets.size)]
+                neighbors = neighbors[visit_marks[neighbors] != visit_mark]
+                _, first_idx = np.unique(neighbors, return_index=True)
+                frontier = neighbors[np.sort(first_idx)]
+                visit_marks[frontier] = visit_mark
         initial_sizes[band] -= assigned
+        if not assigned_op_ids:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(assigned_op_ids)
 
     def _build_undirected_chunk_graph(
-        self, chunk_to_assign: List[ChunkData]
-    ) -> ChunkGraph:
-        chunk_graph = self._chunk_graph.copy()
-        # remove edges for all chunk_to_assign which may contain chunks
-        # that need be reassigned
-        for chunk in chunk_to_assign:
-            if chunk_graph.count_predecessors(chunk) > 0:
-                for pred in list(chunk_graph.predecessors(chunk)):
-                    chunk_graph.remove_edge(pred, chunk)
-        return chunk_graph.build_undirected()
+        self, chunk_to_idx: Dict[ChunkData, int], chunk_to_assign: List[ChunkData]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build CSR adjacency of the undirected chunk graph, edges into
+        chunk_to_assign are removed as they may contain chunks that need
+        be reassigned. Neighbors are ordered the same as those of
+        `self._chunk_graph.copy().build_undirected()` after edges removed.
+
+        Returns
+        -------
+        indptr, indices : np.ndarray
+            Neighbors of chunk i are `indices[indptr[i]:indptr[i + 1]]`.
+        """
+        graph = self._chunk_graph
+        n_chunks = len(chunk_to_idx)
+        src = []
+        dst = []
+        for chunk, idx in chunk_to_idx.items():
+            for succ in graph.iter_successors(chunk):
+                src.append(idx)
+                dst.append(chunk_to_idx[succ])
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        n_edges = src.size
+
+        # `DAG.copy` adds a node when it or its successor is first met,
+        # find the first position of every node in that sequence
+        out_degrees = np.bincount(src, minlength=n_chunks)
+        seq = np.empty(n_chunks + n_edges, dtype=np.int64)
+        seq[np.arange(n_chunks) + np.cumsum(out_degrees) - out_degrees] = np.arange(
+            n_chunks
+        )
+        seq[src + 1 + np.arange(n_edges)] = dst
+        _, first_pos = np.unique(seq, return_index=True)
+
+        is_to_assign = np.zeros(n_chunks, dtype=bool)
+        is_to_assign[[chunk_to_idx[c] for c in chunk_to_assign]] = True
+        kept = ~is_to_assign[dst]
+        src, dst = src[kept], dst[kept]
+        order = np.argsort(first_pos[src], kind="stable")
+        src, dst = src[order], dst[order]
+
+        owners = np.empty(src.size * 2, dtype=np.int64)
+        owners[0::2], owners[1::2] = src, dst
+        neighbors = np.empty(src.size * 2, dtype=np.int64)
+        neighbors[0::2], neighbors[1::2] = dst, src
+        indices = neighbors[np.argsort(owners, kind="stable")]
+        indptr = np.zeros(n_chunks + 1, dtype=np.int64)
+        np.cumsum(np.bincount(owners, minlength=n_chunks), out=indptr[1:])
+        return indptr, indices
 
     @implements(AbstractGraphAssigner.assign)
     def assign(
@@ -190,8 +302,16 @@ class GraphAssigner(AbstractGraphAssigner):
         initial_assigned_op_keys = set(cur_assigns)
 
         op_key_to_chunks = defaultdict(list)
+        chunk_to_idx = dict()
+        op_key_to_idx = dict()
+        chunk_op_ids = []
         for chunk in graph:
-            op_key_to_chunks[chunk.op.key].append(chunk)
+            op_key = chunk.op.key
+            op_key_to_chunks[op_key].append(chunk)
+            chunk_to_idx[chunk] = len(chunk_to_idx)
+            chunk_op_ids.append(op_key_to_idx.setdefault(op_key, len(op_key_to_idx)))
+        chunk_op_ids = np.asarray(chunk_op_ids, dtype=np.int64)
+        op_keys_by_idx = list(op_key_to_idx)
 
         op_keys = OrderedSet(self._op_keys)
         chunk_to_assign = [
@@ -203,8 +323,18 @@ class GraphAssigner(AbstractGraphAssigner):
         for band in cur_assigns.values():
             assigned_counts[band] += 1
 
+        # states of operands, indexed by op ids
+        op_to_assign = np.zeros(len(op_key_to_idx), dtype=bool)
+        op_to_assign[[op_key_to_idx[k] for k in op_keys if k in op_key_to_idx]] = True
+        op_assigned = np.zeros(len(op_key_to_idx), dtype=bool)
+        initial_op_ids = [op_key_to_idx[k] for k in cur_assigns if k in op_key_to_idx]
+        op_assigned[initial_op_ids] = True
+        visit_marks = np.full(len(chunk_to_idx), -1, dtype=np.int64)
+
         # build undirected graph
-        undirected_chunk_graph = self._build_undirected_chunk_graph(chunk_to_assign)
+        undirected_chunk_graph = self._build_undirected_chunk_graph(
+            chunk_to_idx, chunk_to_assign
+        )
 
         # calculate the number of chunks to be assigned to each band
         # given number of bands and existing assignments
@@ -219,20 +349,27 @@ class GraphAssigner(AbstractGraphAssigner):
         # assign from other chunks to be assigned
         # TODO: sort by what?
         sorted_candidates = chunk_to_assign.copy()
+        n_searches = 0
         while max(band_quotas.values()):
-            band = max(band_quotas, key=lambda k: band_quotas[k])
+            band = max(band_quotas, key=band_quotas.get)
             cur = sorted_candidates.pop()
             while cur.op.key in cur_assigns:
                 cur = sorted_candidates.pop()
-            self._assign_by_bfs(
+            assigned_op_ids = self._assign_by_bfs(
                 undirected_chunk_graph,
-                cur,
+                chunk_to_idx[cur],
                 band,
                 band_quotas,
                 spread_ranges,
-                op_keys,
-                cur_assigns,
+                chunk_op_ids,
+                op_to_assign,
+                op_assigned,
+                visit_marks,
+                n_searches,
             )
+            n_searches += 1
+            for op_id in assigned_op_ids.tolist():
+                cur_assigns[op_keys_by_idx[op_id]] = band
 
         key_to_assign = {n.op.key for n in chunk_to_assign} | initial_assigned_op_keys
         for op_key, band in cur_assigns.items():
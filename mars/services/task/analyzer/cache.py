@@ -0,0 +1,91 @@
+# Copyright 1999-2021 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Tuple
+
+from ....typing import BandType
+from ....utils import dataslots
+
+
+@dataslots
+@dataclass
+class AnalysisTemplate:
+    """
+    Results of analysis for a chunk graph, chunks are
+    represented by their positions in the chunk graph.
+    """
+
+    # position of chunk -> band assigned
+    pos_to_bands: Dict[int, BandType]
+    # colors of chunks ordered by positions
+    colors: Tuple[int]
+
+
+class AnalysisCache:
+    """
+    LRU cache of analysis results keyed by structural fingerprints of
+    chunk graphs, thus graphs that only differ in keys of chunks,
+    e.g. same pipeline submitted with different input data, can reuse
+    bands and colors generated before.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._templates: Dict[Hashable, AnalysisTemplate] = OrderedDict()
+        # graphs are analyzed in threads
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self):
+        return len(self._templates)
+
+    def get(self, fingerprint: Hashable) -> Optional[AnalysisTemplate]:
+        with self._lock:
+            template = self._templates.get(fingerprint)
+            if template is not None:
+                self._templates.move_to_end(fingerprint)
+            return template
+
+    def put(self, fingerprint: Hashable, template: AnalysisTemplate):
+        with self._lock:
+            self._templates[fingerprint] = template
+            self._templates.move_to_end(fingerprint)
+            while len(self._templates) > self._size:
+                self._templates.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+
+
+_analysis_cache: Optional[AnalysisCache] = None
+
+
+def get_analysis_cache(size: int) -> Optional[AnalysisCache]:
+    """
+    Get process-wide analysis cache, None will be returned if size is 0.
+    """
+    global _analysis_cache
+
+    if not size:
+        return None
+    if _analysis_cache is None or _analysis_cache.size != size:
+        _analysis_cache = AnalysisCache(size)
+    return _analysis_cache
@@ -21,6 +21,7 @@ from .....core.operand.shuffle import ShuffleFetchType, ShuffleProxy
 from .....resource import Resource
 from ...core import Task
 from ..analyzer import GraphAnalyzer
+from ..cache import get_analysis_cache
 
 
 t1 = mt.random.RandomState(0).rand(31, 27, chunk_size=10)
@@ -80,3 +81,50 @@ def test_shuffle_graph(tileable, fuse):
             assert len(mapper_subtask.chunk_graph.results) == 1
         mapper_chunks = chunk_graph.predecessors(proxy_chunk)
         assert len(mapper_subtasks) == len(mapper_chunks)
+
+
+@pytest.mark.parametrize("fuse", [True, False])
+def test_analysis_cache(fuse):
+    def _gen_subtask_graph(seed):
+        t = mt.random.RandomState(seed).rand(31, 27, chunk_size=10)
+        tileable = md.DataFrame(t, columns=[f"c{i}" for i in range(27)]).describe()
+        chunk_graph = tileable.build_graph(tile=True)
+        all_bands = [(f"address_{i}", "numa-0") for i in range(5)]
+        band_resource = dict((band, Resource(num_cpus=1)) for band in all_bands)
+        task = Task("mock_task", "mock_session", fuse_enabled=fuse)
+        config = Config()
+        config.register_option("subtask_graph_cache_size", 4)
+        analyzer = GraphAnalyzer(
+            chunk_graph,
+            band_resource,
+            task,
+            config,
+            dict(),
+            shuffle_fetch_type=ShuffleFetchType.FETCH_BY_INDEX,
+        )
+        return analyzer.gen_subtask_graph()
+
+    cache = get_analysis_cache(4)
+    cache.clear()
+    subtask_graph1 = _gen_subtask_graph(0)
+    assert len(cache) == 1
+    # structurally identical graph with different keys
+    subtask_graph2 = _gen_subtask_graph(1)
+    assert len(cache) == 1
+
+    def _get_structure(subtask_graph):
+        return sorted(
+            (
+                len(st.chunk_graph),
+                tuple(st.expect_bands or ()),
+                len(subtask_graph.predecessors(st)),
+            )
+            for st in subtask_graph
+        )
+
+    assert len(subtask_graph1) == len(subtask_graph2)
+    assert _get_structure(subtask_graph1) == _get_structure(subtask_graph2)
+    keys1 = {c.key for st in subtask_graph1 for c in st.chunk_graph}
+    keys2 = {c.key for st in subtask_graph2 for c in st.chunk_graph}
+    assert keys1 != keys2
+    cache.clear()
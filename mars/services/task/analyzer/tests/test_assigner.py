@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import defaultdict
+from unittest import mock
+
 import numpy as np
 import pandas as pd
+import pytest
 
 from ..... import dataframe as md
 from .....config import Config
@@ -106,3 +110,75 @@ def test_shuffle_assign():
             init_assigns.add(assign)
     # init and reducers are assigned on all bands
     assert len(init_assigns) == len(reducer_assigns) == 8
+
+
+def _legacy_assign(assigner: GraphAssigner, cur_assigns):
+    # assign via breath-first search over the copied undirected chunk graph
+    graph = assigner._chunk_graph
+    op_key_to_chunks = defaultdict(list)
+    for chunk in graph:
+        op_key_to_chunks[chunk.op.key].append(chunk)
+    op_keys = assigner._op_keys
+    initial_assigned_op_keys = set(cur_assigns)
+    chunk_to_assign = [op_key_to_chunks[k][0] for k in op_keys if k not in cur_assigns]
+    assigned_counts = defaultdict(lambda: 0)
+    for band in cur_assigns.values():
+        assigned_counts[band] += 1
+    undirected_graph = graph.copy()
+    for chunk in chunk_to_assign:
+        for pred in list(undirected_graph.predecessors(chunk)):
+            undirected_graph.remove_edge(pred, chunk)
+    undirected_graph = undirected_graph.build_undirected()
+    band_quotas = assigner._calc_band_assign_limits(
+        len(chunk_to_assign) + sum(assigned_counts.values()), assigned_counts
+    )
+    spread_limit = len(graph) * 1.0 / len(assigner.get_device_band_slots())
+    candidates = chunk_to_assign.copy()
+    while max(band_quotas.values()):
+        band = max(band_quotas, key=band_quotas.get)
+        cur = candidates.pop()
+        while cur.op.key in cur_assigns:
+            cur = candidates.pop()
+        assigned = spread_range = 0
+        for chunk in undirected_graph.bfs(start=cur, visit_predicate="all"):
+            if chunk.op.key in cur_assigns:
+                continue
+            spread_range += 1
+            cur_assigns[chunk.op.key] = band
+            if chunk.op.key not in op_keys:
+                continue
+            assigned += 1
+            if spread_range >= spread_limit or assigned >= band_quotas[band]:
+                break
+        band_quotas[band] -= assigned
+    key_to_assign = {c.op.key for c in chunk_to_assign} | initial_assigned_op_keys
+    return [
+        (chunk, band)
+        for op_key, band in cur_assigns.items()
+        if op_key in key_to_assign
+        for chunk in op_key_to_chunks[op_key]
+    ]
+
+
+@pytest.mark.parametrize("vectorize_threshold", [0, 64])
+def test_assign_same_as_legacy(vectorize_threshold):
+    band_num = 8
+    all_bands = [(f"address_{i}", "numa-0") for i in range(band_num)]
+    band_resource = dict((band, Resource(num_cpus=1)) for band in all_bands)
+
+    pdf = pd.DataFrame(np.random.rand(64, 4))
+    df = md.DataFrame(pdf, chunk_size=4)
+    r = df.groupby(0).sum(method="shuffle") + md.DataFrame(pdf, chunk_size=8).sum()
+    chunk_graph = build_graph([r], tile=True)
+
+    reassign_worker_ops = [
+        chunk.op for chunk in chunk_graph if need_reassign_worker(chunk.op)
+    ]
+    start_ops = list(GraphAnalyzer._iter_start_ops(chunk_graph))
+    to_assign_ops = start_ops + reassign_worker_ops
+
+    assigner = GraphAssigner(chunk_graph, to_assign_ops, band_resource)
+    expected = _legacy_assign(assigner, dict())
+    with mock.patch.object(GraphAssigner, "_vectorize_threshold", vectorize_threshold):
+        assigns = assigner.assign()
+    assert list(assigns.items()) == expected
@@ -22,6 +22,8 @@ task_options.register_option("optimize_tileable_graph", True, validator=is_bool)
 task_options.register_option("optimize_chunk_graph", True, validator=is_bool)
 task_options.register_option("fuse_enabled", True, validator=is_bool)
 task_options.register_option("reserved_finish_tasks", 25, validator=is_integer)
+# number of analysis results of chunk graphs cached by structures, 0 to disable
+task_options.register_option("subtask_graph_cache_size", 0, validator=is_integer)
 
 # worker
 task_options.register_option("runtime_engines", ["numexpr", "cupy"], validator=is_list)
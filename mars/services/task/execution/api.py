@@ -139,6 +139,7 @@ def register_config_cls(config_cls: Type[ExecutionConfig]):
 class ExecutionChunkResult:
     meta: Dict  # The chunk meta for iterative tiling.
     context: Any  # The context info, e.g. ray.ObjectRef.
+    memory_size: int = None  # The actual memory size for adaptive tiling.
 
 
 class TaskExecutor(ABC):
@@ -119,13 +119,15 @@ class TaskStageProcessor:
             get_meta.append(
                 self._meta_api.get_chunk_meta.delay(
                     chunk.key,
-                    # only fetch bands from supervisor meta
-                    fields=["bands"],
+                    # only fetch bands and memory size from supervisor meta
+                    fields=["bands", "memory_size"],
                 )
             )
         metas = await self._meta_api.get_chunk_meta.batch(*get_meta)
         execution_chunk_results = {
-            chunk: ExecutionChunkResult(meta=meta, context=None)
+            chunk: ExecutionChunkResult(
+                meta=meta, context=None, memory_size=meta.pop("memory_size", None)
+            )
             for chunk, meta in zip(chunks, metas)
         }
         await self._update_result_meta(execution_chunk_results)
@@ -784,7 +784,9 @@ class RayTaskExecutor(TaskExecutor):
                 chunk_params = key_to_meta.get(chunk_key)
                 if chunk_params is not None:
                     chunk_to_meta[chunk] = ExecutionChunkResult(
-                        chunk_params, object_ref
+                        chunk_params,
+                        object_ref,
+                        memory_size=self._task_chunks_meta[chunk_key].memory_size,
                     )
 
         logger.info("Waiting for stage %s complete.", stage_id)
@@ -19,7 +19,7 @@ import tempfile
 import time
 from typing import Dict, Iterator, Optional, List, Set
 
-from ....core import ChunkGraph, TileableGraph, Chunk, TileContext
+from ....core import ChunkGraph, TileableGraph, Chunk, TileContext, FUSE_CHUNK_TYPE
 from ....core.operand import Fetch
 from ....metrics import Metrics
 from ....optimization.logical import OptimizationRecords
@@ -260,6 +260,7 @@ class TaskProcessor:
         else:
             optimization_records = None
         self._update_stage_meta(chunk_to_result, tile_context, optimization_records)
+        self._record_stage_memory_sizes(chunk_to_result, optimization_records)
 
     def _get_stage_tile_context(self, result_chunks: Set[Chunk]) -> TileContext:
         collected = self._stage_tileables
@@ -298,6 +299,27 @@ class TaskProcessor:
             tiled_tileable.refresh_params()
             tileable.params = tiled_tileable.params
 
+    def _record_stage_memory_sizes(
+        self,
+        chunk_to_result: Dict[Chunk, ExecutionChunkResult],
+        optimization_records: OptimizationRecords,
+    ):
+        # record actual sizes of stage results, thus downstream
+        # operands can adapt their tiling to the sizes
+        chunk_key_to_memory_size = dict()
+        for c, r in chunk_to_result.items():
+            if r.memory_size is None:
+                continue
+            if isinstance(c, FUSE_CHUNK_TYPE):
+                c = c.chunk
+            chunk_key_to_memory_size[c.key] = r.memory_size
+            original_chunk = (
+                optimization_records and optimization_records.get_original_entity(c)
+            )
+            if original_chunk is not None:
+                chunk_key_to_memory_size[original_chunk.key] = r.memory_size
+        self.tile_context.record_memory_sizes(chunk_key_to_memory_size)
+
     @classmethod
     def _update_result_meta(
         cls, chunk_to_result: Dict[Chunk, ExecutionChunkResult], tileable: TileableType
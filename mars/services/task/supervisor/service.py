@@ -29,7 +29,8 @@ class TaskSupervisorService(AbstractService):
                 "optimize_tileable_graph": True,
                 "optimize_chunk_graph": True,
                 "fuse_enabled": True,
-                "reserved_finish_tasks": 10
+                "reserved_finish_tasks": 10,
+                "subtask_graph_cache_size": 0
             },
             "execution_config": {
                 "backend": "mars",
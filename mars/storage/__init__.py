@@ -18,6 +18,7 @@ from .base import StorageLevel, get_storage_backend
 from .cuda import CudaStorage
 from .filesystem import FileSystemStorage
 from .ray import RayStorage
+from .segment import SegmentDiskStorage
 from .shared_memory import SharedMemoryStorage
 
 try:
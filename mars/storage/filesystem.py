@@ -14,16 +14,108 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import mmap
 import os
+import sys
 import uuid
 from typing import Dict, List, Optional, Tuple
 
 from ..lib.aio import AioFilesystem
-from ..lib.filesystem import FileSystem, get_fs
+from ..lib.compression import (
+    BlockCompressor,
+    CompressedFileWriter,
+    DecompressedFileReader,
+)
+from ..lib.filesystem import FileSystem, LocalFileSystem, get_fs
 from ..serialization import AioSerializer, AioDeserializer
+from ..serialization.core import BytesSerializer
 from ..utils import mod_hash, implements
 from .base import StorageBackend, ObjectInfo, StorageLevel, register_storage_backend
-from .core import StorageFileObject
+from .core import BufferWrappedFileObject, StorageFileObject
+
+
+class MmapFileObject(BufferWrappedFileObject):
+    """
+    Read only file object which maps content of a local file into memory,
+    buffers read are views over the mapping, thus deserializing objects
+    from them does not copy data.
+    """
+
+    def __init__(self, object_id: str):
+        super().__init__(object_id, "r")
+        self._mmap = None
+
+    def _get_path(self) -> str:
+        return self._object_id
+
+    def _locate(self, file) -> Tuple[int, int]:
+        """
+        Get offset and size of content in the file.
+        """
+        return 0, os.fstat(file.fileno()).st_size
+
+    def _read_init(self):
+        with open(self._get_path(), "rb") as f:
+            offset, self._size = self._locate(f)
+            # offsets of mmap shall be multiples of the allocation granularity
+            map_offset = offset - offset % mmap.ALLOCATIONGRANULARITY
+            length = offset - map_offset + self._size
+            if length == 0:
+                self._buffer = self._mv = memoryview(b"")
+                return
+            # copy on write, thus deserialized objects are writable
+            self._mmap = mmap.mmap(
+                f.fileno(), length, access=mmap.ACCESS_COPY, offset=map_offset
+            )
+        self._buffer = self._mv = memoryview(self._mmap)[offset - map_offset :]
+
+    def _write_init(self):  # pragma: no cover
+        raise NotImplementedError(f"{type(self).__name__} is read only")
+
+    def _read_close(self):
+        # objects deserialized may still hold views of mapped memory,
+        # thus the mapping is released when all views are collected
+        self._mmap = None
+
+    def _write_close(self):  # pragma: no cover
+        pass
+
+
+def _get_bytes_buffer_indices(serialized: Tuple) -> List[int]:
+    """
+    Get indices of buffers deserialized as bytes objects
+    from headers generated by `serialize`.
+    """
+    indices = []
+    buf_pos = 0
+    # drop extra meta field
+    stack = [serialized[-1]]
+    while stack:
+        node = stack.pop()
+        serializer_id, _obj_id, num_subs, final = node[:4]
+        if final or num_subs == 0:
+            # leaf nodes consume buffers in order
+            if serializer_id == BytesSerializer.serializer_id:
+                indices.extend(range(buf_pos, buf_pos + num_subs))
+            buf_pos += num_subs
+        else:
+            stack.extend(reversed(node[-num_subs:]))
+    return indices
+
+
+class MappedDeserializer(AioDeserializer):
+    """
+    Deserializer for mapped files. Bytes objects are copied out of
+    mapped buffers, thus they are deserialized as bytes rather than
+    memoryviews, the same as they are read from normal files.
+    """
+
+    async def _deserialize(self, header: Tuple, buffers: List):
+        for idx in _get_bytes_buffer_indices(header):
+            if type(buffers[idx]) is memoryview:
+                buffers[idx] = buffers[idx].tobytes()
+        return await super()._deserialize(header, buffers)
 
 
 @register_storage_backend
@@ -31,12 +123,31 @@ class FileSystemStorage(StorageBackend):
     name = "filesystem"
 
     def __init__(
-        self, fs: FileSystem, root_dirs: List[str], level: StorageLevel, size: int
+        self,
+        fs: FileSystem,
+        root_dirs: List[str],
+        level: StorageLevel,
+        size: int,
+        compression: Optional[str] = None,
+        compression_adaptive: bool = True,
+        mmap_read: bool = None,
     ):
+        self._raw_fs = fs
         self._fs = AioFilesystem(fs)
         self._root_dirs = root_dirs
         self._level = level
         self._size = size
+        self._compressor = (
+            BlockCompressor(compression, adaptive=compression_adaptive)
+            if compression
+            else None
+        )
+        if mmap_read is None:
+            # mapped files cannot be deleted on windows
+            mmap_read = not sys.platform.startswith("win")
+        self._mmap_read = (
+            mmap_read and isinstance(fs, LocalFileSystem) and self._compressor is None
+        )
 
     @classmethod
     @implements(StorageBackend.setup)
@@ -45,6 +156,9 @@ class FileSystemStorage(StorageBackend):
         level = kwargs.pop("level")
         size = kwargs.pop("size", None)
         fs = kwargs.pop("fs", None)
+        compression = kwargs.pop("compression", None)
+        compression_adaptive = kwargs.pop("compression_adaptive", True)
+        mmap_read = kwargs.pop("mmap_read", None)
         if kwargs:  # pragma: no cover
             raise TypeError(
                 f'FileSystemStorage got unexpected config: {",".join(kwargs)}'
@@ -62,6 +176,14 @@ class FileSystemStorage(StorageBackend):
             if not fs.exists(d):
                 fs.mkdir(d)
         params = dict(fs=fs, root_dirs=root_dirs, level=level, size=size)
+        if compression:
+            # check if the codec is available
+            BlockCompressor(compression)
+            params.update(
+                compression=compression, compression_adaptive=compression_adaptive
+            )
+        if mmap_read is not None:
+            params["mmap_read"] = mmap_read
         return params, params
 
     @staticmethod
@@ -88,14 +210,29 @@ class FileSystemStorage(StorageBackend):
         selected_dir = self._root_dirs[selected_index]
         return os.path.join(selected_dir, file_name)
 
+    async def _open_file(self, path: str, mode: str) -> StorageFileObject:
+        if mode == "rb" and self._mmap_read:
+            return StorageFileObject(MmapFileObject(path), path)
+        if self._compressor is None:
+            file = await self._fs.open(path, mode)
+            return StorageFileObject(file, file.name)
+        # data is compressed and decompressed transparently,
+        # wrappers work on files of the underlying filesystem
+        file = await asyncio.to_thread(self._raw_fs.open, path, mode)
+        if mode == "wb":
+            wrapped = CompressedFileWriter(file, self._compressor)
+        else:
+            wrapped = DecompressedFileReader(file)
+        return StorageFileObject(wrapped, path)
+
     @implements(StorageBackend.get)
     async def get(self, object_id, **kwargs) -> object:
         if kwargs:  # pragma: no cover
             raise NotImplementedError(f'Got unsupported args: {",".join(kwargs)}')
 
-        file = await self._fs.open(object_id, "rb")
+        file = await self._open_file(object_id, "rb")
         async with file as f:
-            deserializer = AioDeserializer(f)
+            deserializer = MappedDeserializer(f)
             return await deserializer.run()
 
     @implements(StorageBackend.put)
@@ -105,7 +242,7 @@ class FileSystemStorage(StorageBackend):
         buffer_size = sum(getattr(buf, "nbytes", len(buf)) for buf in buffers)
 
         path = self._generate_path()
-        file = await self._fs.open(path, "wb")
+        file = await self._open_file(path, "wb")
         async with file as f:
             for buffer in buffers:
                 await f.write(buffer)
@@ -131,13 +268,11 @@ class FileSystemStorage(StorageBackend):
     @implements(StorageBackend.open_writer)
     async def open_writer(self, size=None) -> StorageFileObject:
         path = self._generate_path()
-        file = await self._fs.open(path, "wb")
-        return StorageFileObject(file, file.name)
+        return await self._open_file(path, "wb")
 
     @implements(StorageBackend.open_reader)
     async def open_reader(self, object_id) -> StorageFileObject:
-        file = await self._fs.open(object_id, "rb")
-        return StorageFileObject(file, file.name)
+        return await self._open_file(object_id, "rb")
 
 
 @register_storage_backend
@@ -0,0 +1,571 @@
+# Copyright 1999-2022 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import functools
+import logging
+import os
+import struct
+import threading
+import uuid
+from typing import Dict, List, Set, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from ..lib.compression import CompressedFileWriter, DecompressedFileReader
+from ..serialization import AioSerializer
+from ..utils import implements, mod_hash, parse_readable_size
+from .base import StorageBackend, ObjectInfo, register_storage_backend
+from .core import StorageFileObject
+from .filesystem import DiskStorage, MappedDeserializer, MmapFileObject
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_SIZE = 64 * 1024**2
+# segments are compacted when deleted sizes reach the ratio of file sizes
+DEFAULT_COMPACT_RATIO = 0.5
+_COPY_BUFFER_SIZE = 4 * 1024**2
+
+# every object is stored as a size header followed by its content
+_header_pack = struct.Struct("<Q")
+# size in header of objects still being written
+_WRITING_SIZE = (1 << 64) - 1
+# records in deletion logs, offsets and lengths of deleted objects
+_deletion_pack = struct.Struct("<QQ")
+_deletion_suffix = ".del"
+# tables of objects moved by compaction, lines of old offsets and new object ids
+_moved_suffix = ".moved"
+_tmp_suffix = ".tmp"
+
+
+def _parse_object_id(object_id: str) -> Tuple[str, int]:
+    path, offset = object_id.rsplit(":", 1)
+    return path, int(offset)
+
+
+def _read_header(file, offset: int) -> int:
+    file.seek(offset)
+    (size,) = _header_pack.unpack(file.read(_header_pack.size))
+    return size
+
+
+@functools.lru_cache(64)
+def _load_moved_ids(path: str) -> Dict[int, str]:
+    # tables are never changed once written
+    moved_ids = dict()
+    with open(path + _moved_suffix, "r") as f:
+        for line in f:
+            offset, object_id = line.rstrip("\n").split(" ", 1)
+            moved_ids[int(offset)] = object_id
+    return moved_ids
+
+
+def _resolve_object_id(object_id: str) -> str:
+    """
+    Follow objects moved by compaction to their current locations.
+    """
+    path, offset = _parse_object_id(object_id)
+    while not os.path.exists(path):
+        try:
+            object_id = _load_moved_ids(path)[offset]
+        except (FileNotFoundError, KeyError):
+            raise FileNotFoundError(f"Object {object_id} does not exist") from None
+        path, offset = _parse_object_id(object_id)
+    return object_id
+
+
+def _open_object(object_id: str):
+    """
+    Open the segment holding the object, returns the file and the offset.
+    """
+    while True:
+        path, offset = _parse_object_id(_resolve_object_id(object_id))
+        try:
+            return open(path, "rb"), offset
+        except FileNotFoundError:
+            # segment compacted after resolved
+            if not os.path.exists(path + _moved_suffix):  # pragma: no cover
+                raise
+
+
+def _lock_file(fd: int, exclusive: bool, blocking: bool = True) -> bool:
+    if fcntl is None:  # pragma: no cover
+        return True
+    flags = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+    if not blocking:
+        flags |= fcntl.LOCK_NB
+    try:
+        fcntl.flock(fd, flags)
+    except BlockingIOError:
+        return False
+    return True
+
+
+class _Segment:
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, "w+b")
+        self.size = 0
+
+    def close(self):
+        self.file.close()
+
+
+def _remove_segment_files(path: str):
+    for p in (path, path + _deletion_suffix, path + _moved_suffix):
+        try:
+            os.unlink(p)
+        except FileNotFoundError:  # pragma: no cover
+            pass
+
+
+class SegmentWriter:
+    def __init__(
+        self, storage: "SegmentDiskStorage", segment: _Segment, object_id: str
+    ):
+        self._storage = storage
+        self._segment = segment
+        self._object_id = object_id
+        self._offset = segment.size
+        self._size = 0
+        self._closed = False
+
+        segment.file.seek(self._offset)
+        segment.file.write(_header_pack.pack(_WRITING_SIZE))
+
+    @property
+    def object_id(self):
+        return self._object_id
+
+    @property
+    def mode(self):
+        return "wb"
+
+    def write(self, content: Union[bytes, memoryview]):
+        self._segment.file.write(content)
+        self._size += getattr(content, "nbytes", len(content))
+
+    def tell(self):
+        return self._size
+
+    def flush(self):
+        self._segment.file.flush()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+
+        file = self._segment.file
+        file.seek(self._offset)
+        file.write(_header_pack.pack(self._size))
+        file.flush()
+        self._segment.size = self._offset + _header_pack.size + self._size
+        self._storage._release_segment(self._segment)
+
+
+class SegmentReader(MmapFileObject):
+    def _read_init(self):
+        while True:
+            self._object_id = _resolve_object_id(self._object_id)
+            try:
+                return super()._read_init()
+            except FileNotFoundError:
+                # segment compacted after resolved
+                path = self._get_path()
+                if not os.path.exists(path + _moved_suffix):  # pragma: no cover
+                    raise
+
+    def _get_path(self) -> str:
+        return _parse_object_id(self._object_id)[0]
+
+    def _locate(self, file) -> Tuple[int, int]:
+        _, offset = _parse_object_id(self._object_id)
+        return offset + _header_pack.size, _read_header(file, offset)
+
+
+@register_storage_backend
+class SegmentDiskStorage(DiskStorage):
+    """
+    Disk storage appending objects into large segment files instead of
+    creating a file per object. Objects are identified by segments and
+    offsets, read via memory mapping, and deletions are appended to
+    deletion logs of segments. Space is reclaimed by removing segments
+    whose objects are all deleted, and by compacting full segments
+    whose deleted sizes reach `compact_ratio`, where live objects are
+    copied into new segments and looked up via tables of moved objects.
+    """
+
+    name = "segment_disk"
+
+    def __init__(
+        self,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        compact_ratio: float = DEFAULT_COMPACT_RATIO,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._segment_size = segment_size
+        self._compact_ratio = compact_ratio
+
+        # segments owned by current storage object, only one writer
+        # appends to a segment at a time
+        self._lock = threading.Lock()
+        self._idle_segments: List[_Segment] = []
+        self._path_to_segments: Dict[str, _Segment] = dict()
+        # path of segment -> (read position, deleted offsets, deleted size)
+        # of deletion logs
+        self._deletion_lock = threading.Lock()
+        self._deletion_states: Dict[str, Tuple[int, Set[int], int]] = dict()
+
+    @classmethod
+    @implements(StorageBackend.setup)
+    async def setup(cls, **kwargs) -> Tuple[Dict, Dict]:
+        segment_size = kwargs.pop("segment_size", None) or DEFAULT_SEGMENT_SIZE
+        if isinstance(segment_size, str):
+            segment_size = parse_readable_size(segment_size)[0]
+        compact_ratio = kwargs.pop("compact_ratio", None) or DEFAULT_COMPACT_RATIO
+        params, teardown_params = await super().setup(**kwargs)
+        params = dict(
+            params, segment_size=int(segment_size), compact_ratio=float(compact_ratio)
+        )
+        return params, teardown_params
+
+    def _acquire_segment(self) -> _Segment:
+        with self._lock:
+            while self._idle_segments:
+                segment = self._idle_segments.pop()
+                if not self._is_all_deleted(segment.path):
+                    return segment
+                # all objects deleted by other storage objects
+                self._remove_owned_segment(segment)
+
+            file_name = f"segment-{os.getpid()}-{uuid.uuid4()}"
+            selected_index = mod_hash(file_name, len(self._root_dirs))
+            path = os.path.join(self._root_dirs[selected_index], file_name)
+            segment = self._path_to_segments[path] = _Segment(path)
+            return segment
+
+    def _release_segment(self, segment: _Segment):
+        with self._lock:
+            if segment.size < self._segment_size:
+                self._idle_segments.append(segment)
+            else:
+                # segment is full, no more objects will be appended
+                self._path_to_segments.pop(segment.path, None)
+                segment.close()
+
+    def _open_writer(self) -> SegmentWriter:
+        segment = self._acquire_segment()
+        object_id = f"{segment.path}:{segment.size}"
+        try:
+            return SegmentWriter(self, segment, object_id)
+        except:  # noqa: E722  # nosec  # pylint: disable=bare-except
+            self._release_segment(segment)
+            raise
+
+    def _wrap_writer(self, writer: SegmentWriter):
+        if self._compressor is None:
+            return writer
+        return CompressedFileWriter(writer, self._compressor)
+
+    def _open_reader(self, object_id: str):
+        reader = SegmentReader(object_id)
+        if self._compressor is None:
+            return reader
+        return DecompressedFileReader(reader)
+
+    def _refresh_deletions(self, path: str) -> Tuple[Set[int], int]:
+        with self._deletion_lock:
+            pos, deleted_offsets, deleted_size = self._deletion_states.get(
+                path, (0, set(), 0)
+            )
+            try:
+                with open(path + _deletion_suffix, "rb") as f:
+                    f.seek(pos)
+                    content = f.read()
+            except FileNotFoundError:
+                return deleted_offsets, deleted_size
+            n_records = len(content) // _deletion_pack.size
+            for i in range(n_records):
+                offset, length = _deletion_pack.unpack_from(
+                    content, i * _deletion_pack.size
+                )
+                # objects may be deleted more than once
+                if offset not in deleted_offsets:
+                    deleted_offsets.add(offset)
+                    deleted_size += length
+            pos += n_records * _deletion_pack.size
+            self._deletion_states[path] = (pos, deleted_offsets, deleted_size)
+            return deleted_offsets, deleted_size
+
+    def _get_deleted_size(self, path: str) -> int:
+        return self._refresh_deletions(path)[1]
+
+    def _get_deleted_offsets(self, path: str) -> Set[int]:
+        offsets, _ = self._refresh_deletions(path)
+        # copy as sets may be updated by other threads
+        with self._deletion_lock:
+            return set(offsets)
+
+    def _is_all_deleted(self, path: str) -> bool:
+        try:
+            file_size = os.stat(path).st_size
+        except FileNotFoundError:  # pragma: no cover
+            return False
+        return file_size > 0 and self._get_deleted_size(path) >= file_size
+
+    def _delete(self, object_id: str):
+        path, offset = _parse_object_id(object_id)
+        deletion_path = path + _deletion_suffix
+        if not os.path.exists(path) and not os.path.exists(path + _moved_suffix):
+            # all objects in the segment are deleted
+            return
+
+        moved_object_id = None
+        fd = os.open(deletion_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            # shared among deletions, exclusive for compaction
+            _lock_file(fd, exclusive=False)
+            try:
+                with open(path, "rb") as f:
+                    length = _header_pack.size + _read_header(f, offset)
+            except FileNotFoundError:
+                # segment is compacted, delete the moved object
+                try:
+                    moved_object_id = _load_moved_ids(path).get(offset)
+                except FileNotFoundError:  # pragma: no cover
+                    moved_object_id = None
+                if moved_object_id is None or offset in self._get_deleted_offsets(path):
+                    return
+                length = 0
+            # appending small records is atomic, thus deletion logs
+            # can be shared among processes
+            os.write(fd, _deletion_pack.pack(offset, length))
+        finally:
+            os.close(fd)
+
+        if moved_object_id is not None:
+            self._delete(moved_object_id)
+            try:
+                moved_offsets = set(_load_moved_ids(path))
+            except FileNotFoundError:  # pragma: no cover
+                return
+            if moved_offsets.issubset(self._get_deleted_offsets(path)):
+                with self._deletion_lock:
+                    self._deletion_states.pop(path, None)
+                _remove_segment_files(path)
+            return
+
+        with self._lock:
+            segment = self._path_to_segments.get(path)
+            if segment is not None:
+                if segment not in self._idle_segments:
+                    # objects are still being appended
+                    return
+            else:
+                try:
+                    if os.stat(path).st_size < self._segment_size:
+                        # segment may be appended by other storage objects
+                        return
+                except FileNotFoundError:  # pragma: no cover
+                    # compacted by other storage objects
+                    return
+            if not self._is_all_deleted(path):
+                if segment is not None:
+                    # segments owned are still appended
+                    return
+                compact = True
+            else:
+                compact = False
+                if segment is not None:
+                    self._idle_segments.remove(segment)
+                    self._remove_owned_segment(segment)
+                else:
+                    with self._deletion_lock:
+                        self._deletion_states.pop(path, None)
+                    _remove_segment_files(path)
+        if compact:
+            self._maybe_compact(path)
+
+    def _maybe_compact(self, path: str):
+        if fcntl is None:  # pragma: no cover
+            return
+        try:
+            file_size = os.stat(path).st_size
+        except FileNotFoundError:  # pragma: no cover
+            return
+        if self._get_deleted_size(path) < file_size * self._compact_ratio:
+            return
+
+        fd = os.open(
+            path + _deletion_suffix, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        try:
+            # skip if deleting or compacting by others
+            if not _lock_file(fd, exclusive=True, blocking=False):
+                return
+            if not os.path.exists(path):  # pragma: no cover
+                # compacted by other storage objects
+                return
+            self._compact(path, self._get_deleted_offsets(path))
+        finally:
+            os.close(fd)
+
+    def _compact(self, path: str, deleted_offsets: Set[int]):
+        with open(path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            live_objects = []
+            offset = 0
+            while offset + _header_pack.size <= file_size:
+                size = _read_header(f, offset)
+                if size == _WRITING_SIZE:  # pragma: no cover
+                    # objects are still being written
+                    return
+                if offset not in deleted_offsets:
+                    live_objects.append((offset, size))
+                offset += _header_pack.size + size
+
+            moved_ids = dict()
+            try:
+                for offset, size in live_objects:
+                    writer = self._open_writer()
+                    try:
+                        f.seek(offset + _header_pack.size)
+                        remain = size
+                        while remain > 0:
+                            content = f.read(min(remain, _COPY_BUFFER_SIZE))
+                            writer.write(content)
+                            remain -= len(content)
+                    finally:
+                        writer.close()
+                    moved_ids[offset] = writer.object_id
+            except OSError:  # pragma: no cover
+                logger.exception("Failed to compact segment %s", path)
+                for moved_object_id in moved_ids.values():
+                    self._delete(moved_object_id)
+                return
+
+        moved_path = path + _moved_suffix
+        with open(moved_path + _tmp_suffix, "w") as f:
+            for offset, moved_object_id in moved_ids.items():
+                f.write(f"{offset} {moved_object_id}\n")
+        os.replace(moved_path + _tmp_suffix, moved_path)
+        # readers with the segment mapped are not affected
+        os.unlink(path)
+        logger.debug(
+            "Compacted segment %s, %d live objects moved", path, len(moved_ids)
+        )
+
+    def _remove_owned_segment(self, segment: _Segment):
+        del self._path_to_segments[segment.path]
+        with self._deletion_lock:
+            self._deletion_states.pop(segment.path, None)
+        segment.close()
+        _remove_segment_files(segment.path)
+
+    def _list(self) -> List:
+        object_ids = []
+        for d in self._root_dirs:
+            for file_name in os.listdir(d):
+                if file_name.endswith((_deletion_suffix, _moved_suffix, _tmp_suffix)):
+                    continue
+                path = os.path.join(d, file_name)
+                deleted_offsets = set()
+                try:
+                    with open(path + _deletion_suffix, "rb") as f:
+                        content = f.read()
+                    for offset, _ in _deletion_pack.iter_unpack(content):
+                        deleted_offsets.add(offset)
+                except FileNotFoundError:
+                    pass
+
+                try:
+                    f = open(path, "rb")
+                except FileNotFoundError:  # pragma: no cover
+                    # compacted or removed
+                    continue
+                with f:
+                    file_size = os.fstat(f.fileno()).st_size
+                    offset = 0
+                    while offset + _header_pack.size <= file_size:
+                        size = _read_header(f, offset)
+                        if size == _WRITING_SIZE:
+                            break
+                        if offset not in deleted_offsets:
+                            object_ids.append(f"{path}:{offset}")
+                        offset += _header_pack.size + size
+        return object_ids
+
+    @implements(StorageBackend.get)
+    async def get(self, object_id, **kwargs) -> object:
+        if kwargs:  # pragma: no cover
+            raise NotImplementedError(f'Got unsupported args: {",".join(kwargs)}')
+
+        async with StorageFileObject(self._open_reader(object_id), object_id) as f:
+            deserializer = MappedDeserializer(f)
+            return await deserializer.run()
+
+    @implements(StorageBackend.put)
+    async def put(self, obj, importance: int = 0) -> ObjectInfo:
+        serializer = AioSerializer(obj)
+        buffers = await serializer.run()
+        buffer_size = sum(getattr(buf, "nbytes", len(buf)) for buf in buffers)
+
+        def write_buffers():
+            segment_writer = self._open_writer()
+            writer = self._wrap_writer(segment_writer)
+            try:
+                for buffer in buffers:
+                    writer.write(buffer)
+            finally:
+                writer.close()
+            return segment_writer.object_id
+
+        object_id = await asyncio.to_thread(write_buffers)
+        return ObjectInfo(size=buffer_size, object_id=object_id)
+
+    @implements(StorageBackend.delete)
+    async def delete(self, object_id):
+        await asyncio.to_thread(self._delete, object_id)
+
+    @implements(StorageBackend.list)
+    async def list(self) -> List:
+        return await asyncio.to_thread(self._list)
+
+    @implements(StorageBackend.object_info)
+    async def object_info(self, object_id) -> ObjectInfo:
+        def read_size():
+            f, offset = _open_object(object_id)
+            with f:
+                return _read_header(f, offset)
+
+        size = await asyncio.to_thread(read_size)
+        return ObjectInfo(size=size, object_id=object_id)
+
+    @implements(StorageBackend.open_writer)
+    async def open_writer(self, size=None) -> StorageFileObject:
+        writer = await asyncio.to_thread(self._open_writer)
+        return StorageFileObject(self._wrap_writer(writer), writer.object_id)
+
+    @implements(StorageBackend.open_reader)
+    async def open_reader(self, object_id) -> StorageFileObject:
+        return StorageFileObject(self._open_reader(object_id), object_id)
+
+    def __del__(self):
+        for segment in self._path_to_segments.values():
+            segment.close()
@@ -35,6 +35,7 @@ from ..plasma import PlasmaStorage
 from ..shared_memory import SharedMemoryStorage
 from ..vineyard import VineyardStorage
 from ..ray import RayStorage
+from ..segment import SegmentDiskStorage
 
 try:
     import vineyard
@@ -50,6 +51,8 @@ params = [
     "filesystem",
     "shared_memory",
 ]
+if not sys.platform.startswith("win"):
+    params.append("segment_disk")
 if (
     not sys.platform.startswith("win")
     and pkgutil.find_loader("pyarrow.plasma") is not None
@@ -77,6 +80,17 @@ async def storage_context(ray_start_regular, request):
 
         yield storage
 
+        await storage.teardown(**teardown_params)
+    elif request.param == "segment_disk":
+        tempdir = tempfile.mkdtemp()
+        params, teardown_params = await SegmentDiskStorage.setup(
+            fs=LocalFileSystem(), root_dirs=[tempdir], segment_size="1k"
+        )
+        storage = SegmentDiskStorage(**params)
+        assert storage.level == StorageLevel.DISK
+
+        yield storage
+
         await storage.teardown(**teardown_params)
     elif request.param == "plasma":
         plasma_storage_size = 10 * 1024 * 1024
@@ -330,3 +344,178 @@ async def test_cuda_backend():
     cupy.testing.assert_array_equal(write_data, get_data1)
 
     await storage.delete(put_info1.object_id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="mmap of removed files")
+async def test_disk_storage_mmap_read():
+    tempdir = tempfile.mkdtemp()
+    params, teardown_params = await DiskStorage.setup(
+        fs=LocalFileSystem(), root_dirs=[tempdir], mmap_read=True
+    )
+    storage = DiskStorage(**params)
+    try:
+        data1 = np.random.rand(1000, 100)
+        data2 = pd.DataFrame({"a": np.random.rand(1000), "b": np.arange(1000)})
+        put_info1 = await storage.put(data1)
+        put_info2 = await storage.put(data2)
+
+        get_data1 = await storage.get(put_info1.object_id)
+        # arrays are views over mapped files, and are still writable
+        assert not get_data1.flags.owndata
+        assert get_data1.flags.writeable
+        get_data2 = await storage.get(put_info2.object_id)
+
+        # mappings are kept alive when files are deleted
+        await storage.delete(put_info1.object_id)
+        await storage.delete(put_info2.object_id)
+        np.testing.assert_array_equal(data1, get_data1)
+        pd.testing.assert_frame_equal(data2, get_data2)
+        get_data1[0, 0] = -1.0
+        assert get_data1[0, 0] == -1.0
+
+        # bytes objects are not returned as views over mapped files
+        data3 = [b"abc", {"key": b"value"}, "text", np.arange(10)]
+        put_info3 = await storage.put(data3)
+        get_data3 = await storage.get(put_info3.object_id)
+        assert type(get_data3[0]) is bytes
+        assert type(get_data3[1]["key"]) is bytes
+        assert get_data3[:3] == data3[:3]
+        np.testing.assert_array_equal(data3[3], get_data3[3])
+        put_info4 = await storage.put(b"abc")
+        assert await storage.get(put_info4.object_id) == b"abc"
+        assert type(await storage.get(put_info4.object_id)) is bytes
+    finally:
+        await storage.teardown(**teardown_params)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("storage_cls", [DiskStorage, SegmentDiskStorage])
+async def test_compressed_disk_storage(storage_cls):
+    pytest.importorskip("lz4.block")
+    if storage_cls is SegmentDiskStorage and sys.platform.startswith("win"):
+        pytest.skip("mmap of removed files")
+
+    tempdir = tempfile.mkdtemp()
+    params, teardown_params = await storage_cls.setup(
+        fs=LocalFileSystem(), root_dirs=[tempdir], compression="lz4"
+    )
+    storage = storage_cls(**params)
+    try:
+        data1 = np.zeros((1000, 100))
+        put_info1 = await storage.put(data1)
+        # sizes of objects are sizes before compression
+        assert put_info1.size > (await storage.object_info(put_info1.object_id)).size
+        np.testing.assert_array_equal(data1, await storage.get(put_info1.object_id))
+
+        data2 = np.random.rand(1000, 100)
+        serialized = AioSerializer(data2)
+        buffers = await serialized.run()
+        writer = await storage.open_writer()
+        for buf in buffers:
+            await writer.write(buf)
+        await writer.close()
+
+        async with await storage.open_reader(writer.object_id) as reader:
+            deserialized = AioDeserializer(reader)
+            np.testing.assert_array_equal(data2, await deserialized.run())
+        async with await storage.open_reader(writer.object_id) as reader:
+            await reader.seek(-10, os.SEEK_END)
+            assert len(await reader.read()) == 10
+
+        await storage.delete(put_info1.object_id)
+        await storage.delete(writer.object_id)
+    finally:
+        await storage.teardown(**teardown_params)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="mmap of removed files")
+async def test_segment_disk_storage():
+    tempdir = tempfile.mkdtemp()
+    params, teardown_params = await SegmentDiskStorage.setup(
+        fs=LocalFileSystem(), root_dirs=[tempdir], segment_size=1024
+    )
+    storage = SegmentDiskStorage(**params)
+    try:
+        data_list = [np.random.rand(i * 10) for i in range(1, 21)]
+        put_infos = [await storage.put(data) for data in data_list]
+        # objects are appended into a few segment files
+        assert len(os.listdir(tempdir)) < len(data_list)
+        assert sorted(await storage.list()) == sorted(
+            info.object_id for info in put_infos
+        )
+
+        # concurrent writers append to different segments
+        writer1 = await storage.open_writer()
+        writer2 = await storage.open_writer()
+        await writer1.write(b"abc")
+        await writer2.write(b"def")
+        await writer1.close()
+        await writer2.close()
+        for writer, expected in [(writer1, b"abc"), (writer2, b"def")]:
+            async with await storage.open_reader(writer.object_id) as reader:
+                assert await reader.read() == expected
+            await storage.delete(writer.object_id)
+
+        for data, info in zip(data_list, put_infos):
+            np.testing.assert_array_equal(data, await storage.get(info.object_id))
+            assert (await storage.object_info(info.object_id)).size == info.size
+
+        # bytes objects are not returned as views over mapped segments
+        put_info = await storage.put(b"abc")
+        assert type(await storage.get(put_info.object_id)) is bytes
+        await storage.delete(put_info.object_id)
+
+        # segments are removed when all objects in them are deleted
+        for info in put_infos:
+            await storage.delete(info.object_id)
+        assert await storage.list() == []
+        assert os.listdir(tempdir) == []
+    finally:
+        await storage.teardown(**teardown_params)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="mmap of removed files")
+async def test_segment_disk_storage_compaction():
+    tempdir = tempfile.mkdtemp()
+    params, teardown_params = await SegmentDiskStorage.setup(
+        fs=LocalFileSystem(), root_dirs=[tempdir], segment_size=1024
+    )
+    storage = SegmentDiskStorage(**params)
+    try:
+        data_list = [bytes([i]) * 100 for i in range(30)]
+        object_ids = []
+        for data in data_list:
+            writer = await storage.open_writer()
+            await writer.write(data)
+            await writer.close()
+            object_ids.append(writer.object_id)
+        segment_paths = set(os.listdir(tempdir))
+
+        # deleting objects more than once does not remove live objects
+        for _ in range(3):
+            await storage.delete(object_ids[0])
+        async with await storage.open_reader(object_ids[1]) as reader:
+            assert await reader.read() == data_list[1]
+
+        # live objects are moved when most of the segment is deleted
+        for object_id in object_ids[1:7]:
+            await storage.delete(object_id)
+        assert not segment_paths.issuperset(
+            p for p in os.listdir(tempdir) if "." not in p
+        )
+        for data, object_id in zip(data_list[7:], object_ids[7:]):
+            async with await storage.open_reader(object_id) as reader:
+                assert await reader.read() == data
+            assert (await storage.object_info(object_id)).size == len(data)
+        assert len(await storage.list()) == len(object_ids) - 7
+
+        for object_id in object_ids[7:]:
+            await storage.delete(object_id)
+            await storage.delete(object_id)
+        assert await storage.list() == []
+        assert os.listdir(tempdir) == []
+    finally:
+        await storage.teardown(**teardown_params)
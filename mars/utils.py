@@ -1354,7 +1354,17 @@ def dataslots(cls):
     # Create a new dict for our new class.
     cls_dict = dict(cls.__dict__)
     field_names = tuple(f.name for f in dataclasses.fields(cls))
-    cls_dict["__slots__"] = field_names
+    # Skip fields already declared as slots in base classes,
+    #  otherwise every instance carries duplicated slots.
+    inherited_slots = set()
+    for base in cls.__mro__[1:]:
+        base_slots = base.__dict__.get("__slots__", ())
+        if isinstance(base_slots, str):  # pragma: no cover
+            base_slots = (base_slots,)
+        inherited_slots.update(base_slots)
+    cls_dict["__slots__"] = tuple(
+        name for name in field_names if name not in inherited_slots
+    )
     for field_name in field_names:
         # Remove our attributes, if present. They'll still be
         #  available in _MARKER.